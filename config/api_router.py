@@ -2,15 +2,25 @@ from django.conf import settings
 from rest_framework.routers import DefaultRouter
 from rest_framework.routers import SimpleRouter
 
+from django_test_app.jobs.api.views import ApplicationAnalyticsViewSet
+from django_test_app.jobs.api.views import JobApplicationViewSet
+from django_test_app.jobs.api.views import JobCategoryViewSet
+from django_test_app.jobs.api.views import JobViewSet
+from django_test_app.jobs.api.views import OutboxMetricsViewSet
 from django_test_app.users.api.views import UserViewSet
-from django_test_app.jobs.api.views import JobViewSet, JobCategoryViewSet, JobApplicationViewSet
 
 router = DefaultRouter() if settings.DEBUG else SimpleRouter()
 
 router.register("users", UserViewSet)
-router.register("jobs", JobViewSet)
+router.register("jobs", JobViewSet, basename="job")
 router.register("categories", JobCategoryViewSet)
-router.register("applications", JobApplicationViewSet)
+router.register("applications", JobApplicationViewSet, basename="jobapplication")
+router.register(
+    "analytics/applications",
+    ApplicationAnalyticsViewSet,
+    basename="application-analytics",
+)
+router.register("outbox/metrics", OutboxMetricsViewSet, basename="outbox-metrics")
 
 
 app_name = "api"
@@ -0,0 +1,28 @@
+"""
+ASGI config for Django Test App project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+compose/production/django/start serves it with gunicorn and uvicorn workers
+when ``DJANGO_SERVER=asgi`` is set. It turns on ``JOBS_ASYNC_VIEWS``, so the
+job list and detail pages and the job API list/retrieve run on the event loop;
+sync views run in a thread per request.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/dev/howto/deployment/asgi/
+
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from django.core.asgi import get_asgi_application
+
+# This allows easy placement of apps within the interior
+# django_test_app directory.
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR / "django_test_app"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+os.environ.setdefault("JOBS_ASYNC_VIEWS", "True")
+
+application = get_asgi_application()
@@ -1,6 +1,9 @@
+import hashlib
 import os
 
 from celery import Celery
+from celery import Task
+from celery import shared_task
 from celery.signals import setup_logging
 
 # set the default Django settings module for the 'celery' program.
@@ -24,5 +27,83 @@ def config_loggers(*args, **kwargs):
     dictConfig(settings.LOGGING)
 
 
+class CoalescedTask(Task):
+    """
+    Base class for tasks declared with coalesced_task().
+
+    coalesce() schedules one run per key, ``coalesce_window`` seconds after the
+    first trigger; triggers that arrive before that run starts are merged into
+    it. The pending run is marked with cache.add(), which is an atomic SET NX on
+    the Redis cache, so this holds across web and worker processes. The marker
+    is cleared just before the run starts, so a trigger that arrives during the
+    run schedules the next one.
+    """
+
+    coalesce_window = 60
+    coalesce_key = None
+
+    def coalesce_cache_key(self, args, kwargs):
+        if self.coalesce_key:
+            suffix = self.coalesce_key(*args, **kwargs)
+        else:
+            suffix = hashlib.md5(
+                repr((args, sorted(kwargs.items()))).encode(), usedforsecurity=False
+            ).hexdigest()
+        return f"celery:coalesce:{self.name}:{suffix}"
+
+    def coalesce(self, *args, **kwargs):
+        """
+        Schedule a run unless one is already pending for these arguments.
+
+        Returns whether a run was scheduled.
+        """
+        from django.core.cache import cache  # noqa: PLC0415
+
+        window = (
+            self.coalesce_window()
+            if callable(self.coalesce_window)
+            else self.coalesce_window
+        )
+        key = self.coalesce_cache_key(args, kwargs)
+        # The marker outlives the window, so a run lost with the broker only blocks the
+        # key for a while. An unreachable cache (IGNORE_EXCEPTIONS in production)
+        # answers None: schedule the run anyway.
+        if cache.add(key, value=True, timeout=window * 2 + 60) is False:
+            return False
+        try:
+            self.apply_async(args, kwargs, countdown=window)
+        except Exception:
+            cache.delete(key)
+            raise
+        return True
+
+    def before_start(self, task_id, args, kwargs):
+        from django.core.cache import cache  # noqa: PLC0415
+
+        cache.delete(self.coalesce_cache_key(args, kwargs))
+
+
+def coalesced_task(window, key=None, **options):
+    """
+    Declare a shared task that can be triggered with ``task.coalesce(*args)``.
+
+    ``window`` is the debounce window in seconds, or a callable returning it
+    (e.g. to read a setting at trigger time). ``key`` maps the task arguments
+    to the coalescing key; by default, calls with equal arguments are merged.
+    delay() and apply_async() still run the task on every call.
+    """
+    def decorator(func):
+        # staticmethod: as class attributes of the task, plain functions would be bound
+        # to it.
+        return shared_task(
+            base=CoalescedTask,
+            coalesce_window=staticmethod(window) if callable(window) else window,
+            coalesce_key=key and staticmethod(key),
+            **options,
+        )(func)
+
+    return decorator
+
+
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
@@ -5,6 +5,7 @@ import ssl
 from pathlib import Path
 
 import environ
+from kombu import Queue
 
 BASE_DIR = Path(__file__).resolve(strict=True).parent.parent.parent
 # django_test_app/
@@ -57,6 +58,8 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 ROOT_URLCONF = "config.urls"
 # https://docs.djangoproject.com/en/dev/ref/settings/#wsgi-application
 WSGI_APPLICATION = "config.wsgi.application"
+# https://docs.djangoproject.com/en/dev/ref/settings/#asgi-application
+ASGI_APPLICATION = "config.asgi.application"
 
 # APPS
 # ------------------------------------------------------------------------------
@@ -69,6 +72,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     # "django.contrib.humanize", # Handy template tags
     "django.contrib.admin",
+    "django.contrib.postgres",
     "django.forms",
 ]
 THIRD_PARTY_APPS = [
@@ -307,6 +311,37 @@ CELERY_WORKER_SEND_TASK_EVENTS = True
 CELERY_TASK_SEND_SENT_EVENT = True
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-hijack-root-logger
 CELERY_WORKER_HIJACK_ROOT_LOGGER = False
+# Queues per workload class. The I/O worker (compose/production/django/celery/worker/start)
+# consumes email and default; the CPU worker (.../celery/worker-cpu/start) consumes the rest,
+# so a long index rebuild or bulk update never holds up time-sensitive email.
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-task_queues
+CELERY_TASK_QUEUES = (
+    Queue("email"),
+    Queue("default"),
+    Queue("analytics"),
+    Queue("exports"),
+    Queue("bulk"),
+)
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-default-queue
+CELERY_TASK_DEFAULT_QUEUE = "default"
+# With Redis, 0 is the highest priority and 9 the lowest.
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-default-priority
+CELERY_TASK_DEFAULT_PRIORITY = 5
+# https://docs.celeryq.dev/en/stable/userguide/routing.html#redis-message-priorities
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "priority_steps": list(range(10)),
+    "sep": ":",
+    "queue_order_strategy": "priority",
+}
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-task_routes
+CELERY_TASK_ROUTES = {
+    "django_test_app.jobs.tasks.dispatch_outbox_task": {"queue": "email", "priority": 0},
+    "django_test_app.jobs.tasks.send_digests_task": {"queue": "email", "priority": 1},
+    "django_test_app.jobs.tasks.run_job_schedule_task": {"queue": "default", "priority": 3},
+    "django_test_app.jobs.tasks.rollup_applications_task": {"queue": "analytics", "priority": 7},
+    "django_test_app.jobs.tasks.build_search_index_task": {"queue": "exports", "priority": 9},
+    "django_test_app.jobs.tasks.review_applications_task": {"queue": "bulk", "priority": 8},
+}
 # django-allauth
 # ------------------------------------------------------------------------------
 ACCOUNT_ALLOW_REGISTRATION = env.bool("DJANGO_ACCOUNT_ALLOW_REGISTRATION", True)
@@ -336,6 +371,16 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.TokenAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    # orjson-backed (pinned in pyproject.toml), stdlib json when it is missing
+    "DEFAULT_RENDERER_CLASSES": (
+        "django_test_app.jobs.api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "django_test_app.jobs.api.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
@@ -353,3 +398,63 @@ SPECTACULAR_SETTINGS = {
 }
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Jobs
+# ------------------------------------------------------------------------------
+# Search backend used by jobs.services.search_jobs and the job list views/API.
+JOBS_SEARCH_BACKEND = env(
+    "JOBS_SEARCH_BACKEND",
+    default="django_test_app.jobs.search.FullTextSearchBackend",
+)
+# Minimum pg_trgm word similarity (0-1) for TrigramSearchBackend matches and suggestions.
+JOBS_SEARCH_TRIGRAM_THRESHOLD = env.float("JOBS_SEARCH_TRIGRAM_THRESHOLD", default=0.3)
+# Optional snapshot file for InvertedIndexSearchBackend (see `manage.py build_search_index`).
+JOBS_SEARCH_INDEX_SNAPSHOT = env("JOBS_SEARCH_INDEX_SNAPSHOT", default=None)
+# Seconds to cache /api/jobs/facets/ counts per normalized filter set.
+JOBS_FACETS_CACHE_TIMEOUT = env.int("JOBS_FACETS_CACHE_TIMEOUT", default=60)
+# Listings whose planner row estimate is below this get an exact COUNT(*).
+JOBS_EXACT_COUNT_THRESHOLD = env.int("JOBS_EXACT_COUNT_THRESHOLD", default=10000)
+# Above the threshold, cache exact counts for this many seconds (0 = use the planner estimate).
+JOBS_COUNT_CACHE_TIMEOUT = env.int("JOBS_COUNT_CACHE_TIMEOUT", default=0)
+# Maximum rows accepted by one POST /api/jobs/bulk/ request (use `manage.py import_jobs` for files).
+JOBS_BULK_IMPORT_MAX_ROWS = env.int("JOBS_BULK_IMPORT_MAX_ROWS", default=10000)
+# Seconds a cached job representation (detail page / API retrieve) is kept.
+JOBS_DETAIL_CACHE_TIMEOUT = env.int("JOBS_DETAIL_CACHE_TIMEOUT", default=300)
+# Serve the job list/detail pages and API list/retrieve from async views. config/asgi.py turns
+# this on; under WSGI the views stay sync.
+JOBS_ASYNC_VIEWS = env.bool("JOBS_ASYNC_VIEWS", default=False)
+# Seconds a response to a request with an Idempotency-Key header is kept for replay.
+JOBS_IDEMPOTENCY_TIMEOUT = env.int("JOBS_IDEMPOTENCY_TIMEOUT", default=86400)
+# Bulk reviews selecting more applications than this run in a Celery task.
+JOBS_BULK_REVIEW_ASYNC_THRESHOLD = env.int("JOBS_BULK_REVIEW_ASYNC_THRESHOLD", default=5000)
+# Applications updated per statement by the background bulk review task.
+JOBS_BULK_REVIEW_CHUNK_SIZE = env.int("JOBS_BULK_REVIEW_CHUNK_SIZE", default=1000)
+# Seconds a bulk review task runs before continuing in a new run under the same task id.
+JOBS_BULK_REVIEW_TASK_SECONDS = env.int("JOBS_BULK_REVIEW_TASK_SECONDS", default=30)
+# Applications younger than this many seconds are left for the next rollup run.
+JOBS_ROLLUP_LAG = env.int("JOBS_ROLLUP_LAG", default=300)
+# Periodic tasks; the DatabaseScheduler copies these entries into django_celery_beat.
+CELERY_BEAT_SCHEDULE = {
+    "jobs-rollup-applications": {
+        "task": "django_test_app.jobs.tasks.rollup_applications_task",
+        "schedule": 300.0,
+    },
+    # Safety net for emails whose post-commit dispatch request was lost.
+    "jobs-dispatch-outbox": {
+        "task": "django_test_app.jobs.tasks.dispatch_outbox_task",
+        "schedule": 60.0,
+    },
+    "jobs-run-job-schedule": {
+        "task": "django_test_app.jobs.tasks.run_job_schedule_task",
+        "schedule": 60.0,
+    },
+}
+# Collect new-application emails for this many seconds into one digest per employer (0 = send each at once).
+JOBS_NOTIFICATION_DIGEST_WINDOW = env.int("JOBS_NOTIFICATION_DIGEST_WINDOW", default=0)
+# Applications handled per digest run.
+JOBS_NOTIFICATION_BATCH_SIZE = env.int("JOBS_NOTIFICATION_BATCH_SIZE", default=1000)
+# Outbox emails claimed and sent per dispatcher batch (one mail connection each).
+JOBS_OUTBOX_BATCH_SIZE = env.int("JOBS_OUTBOX_BATCH_SIZE", default=100)
+# Failed sends are retried with exponential backoff; after this many attempts the email is marked failed.
+JOBS_OUTBOX_MAX_ATTEMPTS = env.int("JOBS_OUTBOX_MAX_ATTEMPTS", default=8)
+# Jobs published or closed per statement by the scheduled publishing task.
+JOBS_SCHEDULE_CHUNK_SIZE = env.int("JOBS_SCHEDULE_CHUNK_SIZE", default=1000)
@@ -1,5 +1,9 @@
-from django.contrib import admin
+from django.conf import settings
+from django.contrib import admin, messages
+from django.contrib.admin.utils import prepare_lookup_value
 from .models import Job, JobCategory, JobApplication
+from .pagination import EstimatedCountPaginator
+from .services import bulk_review_applications, close_jobs, publish_jobs
 
 
 @admin.register(JobCategory)
@@ -15,6 +19,9 @@ class JobAdmin(admin.ModelAdmin):
     list_filter = ['status', 'category', 'created_at']
     search_fields = ['title', 'company_name', 'description']
     readonly_fields = ['created_at', 'updated_at']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ['publish_selected', 'close_selected']
     fieldsets = (
         ('Basic Information', {
             'fields': ('title', 'description', 'company_name', 'location')
@@ -23,7 +30,7 @@ class JobAdmin(admin.ModelAdmin):
             'fields': ('salary_min', 'salary_max')
         }),
         ('Status & Category', {
-            'fields': ('status', 'category', 'published_at')
+            'fields': ('status', 'category', 'published_at', 'publish_at', 'expires_at')
         }),
         ('Metadata', {
             'fields': ('created_by', 'created_at', 'updated_at')
@@ -34,6 +41,23 @@ class JobAdmin(admin.ModelAdmin):
         if not change and not obj.created_by_id:
             obj.created_by = request.user
         super().save_model(request, obj, form, change)
+    
+    def _change_status(self, request, queryset, change, verb):
+        selected = list(queryset.values_list('pk', flat=True))
+        changed = change(selected)
+        self.message_user(
+            request,
+            f'{len(changed)} of {len(selected)} selected job(s) {verb}.',
+            messages.SUCCESS,
+        )
+    
+    def publish_selected(self, request, queryset):
+        self._change_status(request, queryset, publish_jobs, 'published')
+    publish_selected.short_description = "Publish selected draft jobs"
+    
+    def close_selected(self, request, queryset):
+        self._change_status(request, queryset, close_jobs, 'closed')
+    close_selected.short_description = "Close selected jobs"
 
 
 @admin.register(JobApplication)
@@ -42,17 +66,67 @@ class JobApplicationAdmin(admin.ModelAdmin):
     list_filter = ['status', 'applied_at']
     search_fields = ['job__title', 'applicant__email']
     readonly_fields = ['applied_at', 'reviewed_at']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     actions = ['mark_as_reviewed', 'mark_as_accepted', 'mark_as_rejected']
     
+    def _selection_lookups(self, request, queryset):
+        """
+        Return filter arguments matching the action's ``queryset``, or ``None``.
+
+        Checked rows are at most one changelist page. "Select all" is expressed
+        through the changelist filters; a search term cannot be, so searched
+        selections are only resolved to ids when small enough to review inline.
+        """
+        if request.POST.get('select_across') != '1':
+            return {'pk__in': list(queryset.values_list('pk', flat=True))}
+        changelist = self.get_changelist_instance(request)
+        if changelist.query:
+            if queryset.count() > getattr(
+                settings, 'JOBS_BULK_REVIEW_ASYNC_THRESHOLD', 5000
+            ):
+                return None
+            return {'pk__in': list(queryset.values_list('pk', flat=True))}
+        lookups = {}
+        for name, values in changelist.get_filters_params().items():
+            if len(values) != 1:
+                return None
+            lookups[name] = prepare_lookup_value(name, values[0])
+        return lookups
+    
+    def _review(self, request, queryset, new_status):
+        lookups = self._selection_lookups(request, queryset)
+        if lookups is None:
+            self.message_user(
+                request,
+                'Too many applications match the search; '
+                'clear it or narrow the filters.',
+                messages.ERROR,
+            )
+            return
+        count, task_id = bulk_review_applications(lookups, new_status)
+        if task_id is None:
+            self.message_user(
+                request,
+                f'{count} application(s) marked as {new_status}.',
+                messages.SUCCESS,
+            )
+        else:
+            self.message_user(
+                request,
+                f'Marking {count} applications as {new_status} in the background '
+                f'(task {task_id}).',
+                messages.INFO,
+            )
+    
     def mark_as_reviewed(self, request, queryset):
-        queryset.update(status='reviewed')
+        self._review(request, queryset, 'reviewed')
     mark_as_reviewed.short_description = "Mark selected applications as reviewed"
     
     def mark_as_accepted(self, request, queryset):
-        queryset.update(status='accepted')
+        self._review(request, queryset, 'accepted')
     mark_as_accepted.short_description = "Mark selected applications as accepted"
     
     def mark_as_rejected(self, request, queryset):
-        queryset.update(status='rejected')
+        self._review(request, queryset, 'rejected')
     mark_as_rejected.short_description = "Mark selected applications as rejected"
-
@@ -0,0 +1,116 @@
+"""
+``Idempotency-Key`` support for unsafe API actions.
+
+The first response to a request carrying the header is kept, per user, method
+and path, for ``JOBS_IDEMPOTENCY_TIMEOUT`` seconds. Retries with the same key
+get that response back with ``Idempotent-Replayed: true`` instead of running
+the action again. A retry that arrives while the original request is still
+running gets 409, and reusing a key with a different body gets 422.
+
+Responses are stored once the request's transaction commits, so a rolled back
+request never leaves a replay behind, and its key is released as soon as the
+rollback is known. Server errors are not stored.
+"""
+import functools
+import hashlib
+import json
+from http import HTTPStatus
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+
+HEADER = 'Idempotency-Key'
+KEY_PREFIX = 'jobs:idempotency'
+MAX_KEY_LENGTH = 255
+# Bounds how long a key stays locked if the request dies without cleaning up.
+IN_PROGRESS_TIMEOUT = 60
+
+
+def _cache_key(request, key):
+    digest = hashlib.md5(
+        f'{request.user.pk}|{request.method}|{request.path}|{key}'.encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f'{KEY_PREFIX}:{digest}'
+
+
+def _fingerprint(data):
+    if hasattr(data, 'lists'):
+        data = dict(data.lists())
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.md5(payload.encode(), usedforsecurity=False).hexdigest()
+
+
+def _replay(record, fingerprint):
+    if record['fingerprint'] != fingerprint:
+        return Response(
+            {'error': f'{HEADER} was already used for a different request'},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+    if 'status' not in record:
+        return Response(
+            {'error': f'A request with this {HEADER} is still being processed'},
+            status=status.HTTP_409_CONFLICT
+        )
+    return Response(
+        record['data'], status=record['status'], headers={'Idempotent-Replayed': 'true'}
+    )
+
+
+def _rolled_back():
+    connection = transaction.get_connection()
+    return connection.in_atomic_block and connection.get_rollback()
+
+
+def idempotent(view_method):
+    """Honor ``Idempotency-Key`` on a viewset action for authenticated users."""
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if not key or not request.user.is_authenticated:
+            return view_method(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {'error': f'{HEADER} must be at most {MAX_KEY_LENGTH} characters'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        cache_key = _cache_key(request, key)
+        fingerprint = _fingerprint(request.data)
+        # add() returns None rather than False when the cache backend swallows an
+        # error (django-redis IGNORE_EXCEPTIONS); let the request through then.
+        if (
+            cache.add(cache_key, {'fingerprint': fingerprint}, IN_PROGRESS_TIMEOUT)
+            is False
+        ):
+            record = cache.get(cache_key)
+            if record is not None:
+                return _replay(record, fingerprint)
+            # The marker expired between add() and get(); treat it as in progress.
+            return _replay({'fingerprint': fingerprint}, fingerprint)
+
+        try:
+            response = view_method(self, request, *args, **kwargs)
+        except Exception:
+            cache.delete(cache_key)
+            raise
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR or _rolled_back():
+            # Nothing will be committed, so the stored response would never be
+            # written; release the key for a retry straight away.
+            cache.delete(cache_key)
+            return response
+
+        record = {
+            'fingerprint': fingerprint,
+            'status': response.status_code,
+            'data': response.data,
+        }
+        timeout = getattr(settings, 'JOBS_IDEMPOTENCY_TIMEOUT', 86400)
+        transaction.on_commit(lambda: cache.set(cache_key, record, timeout))
+        return response
+
+    return wrapper
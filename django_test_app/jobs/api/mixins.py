@@ -0,0 +1,398 @@
+from contextlib import ExitStack
+
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ValidationError as DjangoValidationError,
+)
+from django.db import connections, transaction
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Q
+from django.http import Http404, StreamingHttpResponse
+from rest_framework import serializers
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer
+
+from django_test_app.jobs.cache import aget_job_data, get_job_data
+from .readers import ValuesReader
+from .renderers import CSVRenderer, NDJSONRenderer
+
+
+def _is_concrete(model, name):
+    try:
+        return model._meta.get_field(name).concrete
+    except FieldDoesNotExist:
+        return False
+
+
+def serializer_projection(serializer, model):
+    """
+    Return ``(only, select_related)`` covering every readable serializer field,
+    or ``None`` when a field's source cannot be mapped onto model columns.
+    """
+    only = set()
+    select_related = set()
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if field.source == '*' or not _is_concrete(model, field.source_attrs[0]):
+            return None
+        path = '__'.join(field.source_attrs)
+        if isinstance(field, BaseSerializer):
+            select_related.add(path)
+            only.add(path)
+            only.update(
+                f'{path}__{"__".join(child.source_attrs)}'
+                for child in field.fields.values()
+                if not child.write_only
+            )
+        elif len(field.source_attrs) > 1:
+            relation = '__'.join(field.source_attrs[:-1])
+            select_related.add(relation)
+            only.update([relation, path])
+        else:
+            only.add(path)
+    return only, select_related
+
+
+class SparseFieldsetViewMixin:
+    """
+    Support ``?fields=`` / ``?exclude=`` on list and retrieve.
+
+    The serializer is trimmed to the requested fields and the queryset is
+    projected with ``.only()`` and ``select_related()`` so that unused columns,
+    joins and prefetches are skipped.
+    """
+
+    sparse_fieldset_actions = ('list', 'retrieve')
+
+    def _sparse_param(self, name):
+        value = self.request.query_params.get(name, '')
+        return [field.strip() for field in value.split(',') if field.strip()] or None
+
+    def get_serializer(self, *args, **kwargs):
+        if getattr(self, 'action', None) in self.sparse_fieldset_actions:
+            kwargs.setdefault('fields', self._sparse_param('fields'))
+            kwargs.setdefault('exclude', self._sparse_param('exclude'))
+        return super().get_serializer(*args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if getattr(self, 'action', None) not in self.sparse_fieldset_actions:
+            return queryset
+        projection = serializer_projection(self.get_serializer(), queryset.model)
+        if projection is None:
+            return queryset
+        only, select_related = projection
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        only.update(
+            name.lstrip('-') for name in ordering
+            if isinstance(name, str) and _is_concrete(queryset.model, name.lstrip('-'))
+        )
+        queryset = queryset.prefetch_related(None).select_related(None).only(*only)
+        # A bare select_related() would follow every foreign key.
+        return queryset.select_related(*select_related) if select_related else queryset
+
+
+class ValuesReadMixin:
+    """
+    Serve list and retrieve from ``.values()`` rows through a ValuesReader.
+
+    The response body is identical to the one the serializer would produce;
+    viewsets fall back to the serializer when the reader cannot map a field.
+    """
+
+    values_read_actions = ('list', 'retrieve')
+
+    def get_values_reader(self):
+        if getattr(self, 'action', None) not in self.values_read_actions:
+            return None
+        return ValuesReader.for_serializer(self.get_serializer())
+
+    def _values(self, queryset, reader):
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        keys = [name.lstrip('-') for name in ordering if isinstance(name, str)]
+        return queryset.values(
+            *dict.fromkeys([*reader.columns, *keys, queryset.model._meta.pk.name])
+        )
+
+    def list(self, request, *args, **kwargs):
+        reader = self.get_values_reader()
+        if reader is None:
+            return super().list(request, *args, **kwargs)
+        rows = self._values(self.filter_queryset(self.get_queryset()), reader)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(reader.represent_many(page))
+        return Response(reader.represent_many(rows))
+
+    def retrieve(self, request, *args, **kwargs):
+        reader = self.get_values_reader()
+        if reader is None:
+            return super().retrieve(request, *args, **kwargs)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            row = self._values(
+                queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}),
+                reader,
+            ).first()
+        except (TypeError, ValueError, DjangoValidationError) as exc:
+            raise Http404 from exc
+        if row is None:
+            raise Http404
+        self.check_object_permissions(request, row)
+        return Response(reader.to_representation(row))
+
+    async def alist(self, request, *args, **kwargs):
+        reader = self.get_values_reader()
+        if reader is None:
+            return await sync_to_async(super().list)(request, *args, **kwargs)
+        rows = self._values(self.filter_queryset(await self.aget_queryset()), reader)
+        page = await self.apaginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(reader.represent_many(page))
+        return Response(reader.represent_many([row async for row in rows]))
+
+    async def aretrieve(self, request, *args, **kwargs):
+        reader = self.get_values_reader()
+        if reader is None:
+            return await sync_to_async(super().retrieve)(request, *args, **kwargs)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(await self.aget_queryset())
+        try:
+            row = await self._values(
+                queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}),
+                reader,
+            ).afirst()
+        except (TypeError, ValueError, DjangoValidationError) as exc:
+            raise Http404 from exc
+        if row is None:
+            raise Http404
+        self.check_object_permissions(request, row)
+        return Response(reader.to_representation(row))
+
+
+def _header(serializer, prefix=''):
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, BaseSerializer) and hasattr(field, 'fields'):
+            yield from _header(field, prefix=f'{prefix}{name}.')
+        else:
+            yield f'{prefix}{name}'
+
+
+async def _aiterate(iterable):
+    """
+    Yield the items of a sync iterable, reading each one in the request's sync thread.
+
+    Django reads a sync iterator of a StreamingHttpResponse served over ASGI
+    into a list before sending anything; this keeps the export streaming.
+    """
+    iterator = iter(iterable)
+    try:
+        while (item := await sync_to_async(next)(iterator, None)) is not None:
+            yield item
+    finally:
+        # Closes the server-side cursor if the client went away mid-stream.
+        await sync_to_async(iterator.close)()
+
+
+class StreamingExportMixin:
+    """
+    ``GET <list>/export/`` streaming every row the list endpoint would return.
+
+    The format is negotiated from ``?format=ndjson|csv`` or the Accept header.
+    Rows are read through a server-side cursor ``export_chunk_size`` at a time
+    and written out in batches, so memory use does not grow with the export.
+    Under ASGI the batches are handed over through an async iterator.
+    ``?since=<ISO 8601>`` keeps rows whose ``export_since_fields`` are at or
+    after that time, oldest first, for incremental pulls.
+    """
+
+    export_chunk_size = 2000
+    export_since_fields = ()
+
+    def filter_since(self, queryset):
+        value = self.request.query_params.get('since')
+        if not value or not self.export_since_fields:
+            return queryset
+        try:
+            since = serializers.DateTimeField().to_internal_value(value)
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({'since': exc.detail}) from exc
+        condition = Q()
+        for name in self.export_since_fields:
+            condition |= Q(**{f'{name}__gte': since})
+        return queryset.filter(condition).order_by(self.export_since_fields[0], 'pk')
+
+    def export_rows(self, queryset, serializer):
+        reader = ValuesReader.for_serializer(serializer)
+        if reader is None:
+            instances = queryset.iterator(chunk_size=self.export_chunk_size)
+            return map(serializer.to_representation, instances)
+        rows = queryset.values(*reader.columns).iterator(
+            chunk_size=self.export_chunk_size
+        )
+        return map(reader.to_representation, rows)
+
+    @action(
+        detail=False, methods=['get'], renderer_classes=[NDJSONRenderer, CSVRenderer]
+    )
+    def export(self, request):
+        queryset = self.filter_since(self.filter_queryset(self.get_queryset()))
+        serializer = self.get_serializer()
+        renderer = request.accepted_renderer
+        content = renderer.stream(
+            self.export_rows(queryset, serializer), header=list(_header(serializer))
+        )
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f'{content_type}; charset={renderer.charset}'
+        if isinstance(request._request, ASGIRequest):  # noqa: SLF001
+            content = _aiterate(content)
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = (
+            f'attachment; filename="{self.basename}s.{renderer.format}"'
+        )
+        return response
+
+
+class CachedJobRetrieveMixin:
+    """
+    Serve job retrieve from the versioned job cache (see ``jobs.cache``).
+
+    Only requests filtered by nothing but ``status`` are served from the cache,
+    since that filter can be checked against the cached representation.
+    """
+
+    def _cached_job_id(self):
+        params = self.request.query_params
+        if self.action != 'retrieve' or params.get('search') or params.get('category'):
+            return None
+        try:
+            return int(self.kwargs[self.lookup_url_kwarg or self.lookup_field])
+        except ValueError:
+            return None
+
+    def _usable(self, cached):
+        if cached is not None and cached['data']['status'] == (
+            self.request.query_params.get('status') or 'published'
+        ):
+            return cached
+        return None
+
+    def _cached_response(self, cached):
+        # Also validates ?fields= / ?exclude=.
+        fields = {
+            name
+            for name, field in self.get_serializer().fields.items()
+            if not field.write_only
+        }
+        return Response(
+            {name: value for name, value in cached['data'].items() if name in fields}
+        )
+
+    def get_cached_job(self):
+        if not hasattr(self, '_cached_job'):
+            job_id = self._cached_job_id()
+            self._cached_job = (
+                None if job_id is None else self._usable(get_job_data(job_id))
+            )
+        return self._cached_job
+
+    def retrieve(self, request, *args, **kwargs):
+        cached = self.get_cached_job()
+        if cached is None:
+            return super().retrieve(request, *args, **kwargs)
+        return self._cached_response(cached)
+
+    async def aget_cached_job(self):
+        if not hasattr(self, '_cached_job'):
+            job_id = self._cached_job_id()
+            self._cached_job = (
+                None if job_id is None else self._usable(await aget_job_data(job_id))
+            )
+        return self._cached_job
+
+    async def aretrieve(self, request, *args, **kwargs):
+        cached = await self.aget_cached_job()
+        if cached is None:
+            return await super().aretrieve(request, *args, **kwargs)
+        return self._cached_response(cached)
+
+
+class AsyncReadMixin:
+    """
+    Async list and retrieve for a viewset, built from the ``alist()`` and
+    ``aretrieve()`` of the mixins that follow it.
+
+    They are only used when ``JOBS_ASYNC_VIEWS`` is on, which config/asgi.py
+    does: list and retrieve then run on the event loop with the async ORM and
+    cache API, and every other action runs the regular DRF dispatch in a
+    thread. Otherwise the viewset is left sync, so WSGI requests do not go
+    through async_to_sync.
+    """
+
+    async_actions = ('list', 'retrieve')
+    # Set by as_view() for the views it marks as coroutine functions.
+    async_dispatch = False
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        async_dispatch = getattr(settings, 'JOBS_ASYNC_VIEWS', False) and any(
+            action in cls.async_actions for action in actions.values()
+        )
+        view = super().as_view(actions, async_dispatch=async_dispatch, **initkwargs)
+        if async_dispatch:
+            # Django awaits views marked as coroutine functions, but cannot wrap them in
+            # ATOMIC_REQUESTS; the sync actions get their transaction in
+            # _atomic_dispatch().
+            view = transaction.non_atomic_requests(markcoroutinefunction(view))
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.async_dispatch:
+            return super().dispatch(request, *args, **kwargs)
+        action = self.action_map.get(request.method.lower())
+        if action not in self.async_actions:
+            return sync_to_async(self._atomic_dispatch)(request, *args, **kwargs)
+        return self._adispatch(getattr(self, f'a{action}'), request, *args, **kwargs)
+
+    def _atomic_dispatch(self, request, *args, **kwargs):
+        with ExitStack() as stack:
+            for db in connections.all():
+                if db.settings_dict['ATOMIC_REQUESTS']:
+                    stack.enter_context(transaction.atomic(using=db.alias))
+            return super().dispatch(request, *args, **kwargs)
+
+    async def _adispatch(self, handler, request, *args, **kwargs):
+        # APIView.dispatch() of djangorestframework 3.16.1 (pinned in pyproject.toml),
+        # awaiting the handler. It only calls DRF's own hooks; initial() runs in a
+        # thread since authenticators query the database. Compare it with
+        # APIView.dispatch() when upgrading DRF.
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:  # noqa: BLE001
+            response = self.handle_exception(exc)
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def aget_queryset(self):
+        return self.get_queryset()
+
+    async def apaginate_queryset(self, queryset):
+        if self.paginator is None:
+            return None
+        return await self.paginator.apaginate_queryset(
+            queryset, self.request, view=self
+        )
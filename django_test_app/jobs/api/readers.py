@@ -0,0 +1,143 @@
+from decimal import Decimal
+
+from rest_framework import ISO_8601, serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.settings import api_settings
+
+
+# Fields whose to_representation() is the identity for the values the database
+# hands back, so the fast path can copy them straight through.
+PASSTHROUGH_FIELDS = (
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    PrimaryKeyRelatedField,
+)
+
+
+def _datetime_converter(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    field_timezone = (
+        field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    )
+    if (
+        output_format is None
+        or output_format.lower() != ISO_8601
+        or field_timezone is None
+    ):
+        return field.to_representation
+
+    def convert(value):
+        if value.tzinfo is None:
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+    return convert
+
+
+def _decimal_converter(field):
+    coerce_to_string = getattr(
+        field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING
+    )
+    if (
+        not coerce_to_string
+        or field.localize
+        or field.normalize_output
+        or field.decimal_places is None
+    ):
+        return field.to_representation
+    exponent = -field.decimal_places
+
+    def convert(value):
+        # Values read from a DecimalField column already carry the field's scale,
+        # which makes DRF's quantize() a no-op.
+        if isinstance(value, Decimal) and value.as_tuple().exponent == exponent:
+            return f'{value:f}'
+        return field.to_representation(value)
+
+    return convert
+
+
+def _converter(field):
+    """
+    Return a callable matching ``field.to_representation``, or ``None`` for identity.
+
+    Datetime converters capture the active timezone, so build readers per request.
+    """
+    if isinstance(field, PASSTHROUGH_FIELDS):
+        return None
+    if isinstance(field, serializers.DateTimeField):
+        return _datetime_converter(field)
+    if isinstance(field, serializers.DecimalField):
+        return _decimal_converter(field)
+    return field.to_representation
+
+
+def _plan(serializer, prefix=''):
+    """Compile ``[(name, column, converter, nested_plan), ...]`` for readable fields."""
+    plan = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if field.source == '*':
+            return None
+        column = prefix + '__'.join(field.source_attrs)
+        if isinstance(field, serializers.BaseSerializer):
+            if not isinstance(field, serializers.ModelSerializer):
+                return None
+            nested = _plan(field, prefix=f'{column}__')
+            if nested is None:
+                return None
+            # A NULL related primary key means the relation itself is empty.
+            plan.append(
+                (name, f'{column}__{field.Meta.model._meta.pk.name}', None, nested)
+            )
+        else:
+            plan.append((name, column, _converter(field), None))
+    return plan
+
+
+def _columns(plan):
+    for _name, column, _converter, nested in plan:
+        yield column
+        if nested is not None:
+            yield from _columns(nested)
+
+
+def _represent(plan, row):
+    data = {}
+    for name, column, converter, nested in plan:
+        if nested is not None:
+            data[name] = None if row[column] is None else _represent(nested, row)
+            continue
+        value = row[column]
+        data[name] = value if value is None or converter is None else converter(value)
+    return data
+
+
+class ValuesReader:
+    """
+    Serialize ``.values()`` rows with the same output as a read-only serializer.
+
+    Plain dicts are built straight from the row, with related fields taken from
+    joined columns. This skips model instantiation and DRF's per-field attribute
+    lookup. ``for_serializer`` returns ``None`` when a field cannot be read from a
+    column; callers should then use the serializer itself.
+    """
+
+    def __init__(self, plan):
+        self.plan = plan
+        self.columns = list(dict.fromkeys(_columns(plan)))
+
+    @classmethod
+    def for_serializer(cls, serializer):
+        plan = _plan(serializer)
+        return None if plan is None else cls(plan)
+
+    def to_representation(self, row):
+        return _represent(self.plan, row)
+
+    def represent_many(self, rows):
+        plan = self.plan
+        return [_represent(plan, row) for row in rows]
@@ -0,0 +1,113 @@
+"""
+JSON renderer backed by orjson, which pyproject.toml pins.
+
+orjson serializes datetimes, UUIDs and dataclasses natively and encodes straight
+to UTF-8 bytes. Everything else it cannot handle (Decimal, lazy translation
+strings, querysets, ...) is passed to DRF's encoder, so output matches
+``rest_framework.renderers.JSONRenderer`` apart from datetimes keeping
+microsecond precision. Without orjson, or when an indented response is
+requested (e.g. the browsable API), or with UNICODE_JSON/COMPACT_JSON turned
+off, the stdlib renderer is used.
+
+NDJSONRenderer and CSVRenderer also expose ``stream()`` for export endpoints
+that write rows to a StreamingHttpResponse in batches.
+"""
+import csv
+import io
+from itertools import batched
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    # Only for installs that skip the pinned dependencies.
+    orjson = None
+
+
+LINE_SEPARATORS = ((b'\xe2\x80\xa8', b'\\u2028'), (b'\xe2\x80\xa9', b'\\u2029'))
+
+
+class FastJSONRenderer(JSONRenderer):
+    options = 0 if orjson is None else orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (
+            orjson is None or self.ensure_ascii or not self.compact or
+            self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=self.options
+            )
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits and similar edge cases.
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same as DRF: keep the output safe to embed in JavaScript.
+        if b'\xe2\x80' in ret:
+            for separator, escaped in LINE_SEPARATORS:
+                ret = ret.replace(separator, escaped)
+        return ret
+
+
+def flatten(data, prefix=''):
+    """Flatten nested dicts into ``{'category.name': ...}`` style keys."""
+    flat = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{prefix}{key}.'))
+        else:
+            flat[f'{prefix}{key}'] = value
+    return flat
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Newline-delimited JSON: one object per line."""
+
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = None
+    batch_size = 500
+
+    def stream(self, rows, header=None):
+        json_renderer = FastJSONRenderer()
+        for batch in batched(rows, self.batch_size, strict=False):
+            yield b''.join(json_renderer.render(row) + b'\n' for row in batch)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return b''.join(self.stream(data if isinstance(data, list) else [data]))
+
+
+class CSVRenderer(BaseRenderer):
+    """CSV with a header row; nested objects become ``parent.child`` columns."""
+
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+    batch_size = 500
+
+    def stream(self, rows, header):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(header)
+        for batch in batched(rows, self.batch_size, strict=False):
+            for row in batch:
+                flat = flatten(row)
+                writer.writerow([flat.get(column) for column in header])
+            yield buffer.getvalue().encode(self.charset)
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode(self.charset)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        rows = data if isinstance(data, list) else [data]
+        header = list(flatten(rows[0])) if rows else []
+        return b''.join(self.stream(rows, header))
@@ -1,5 +1,33 @@
+import datetime
+
+from django.utils import timezone
 from rest_framework import serializers
 from django_test_app.jobs.models import Job, JobCategory, JobApplication
+from django_test_app.jobs.rollups import GRANULARITIES, GROUPINGS
+
+
+class SparseFieldsetMixin:
+    """
+    Accept ``fields`` / ``exclude`` keyword arguments restricting the serialized fields.
+    
+    Unknown names raise a ValidationError so clients notice typos.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        exclude = kwargs.pop('exclude', None)
+        super().__init__(*args, **kwargs)
+        
+        requested = set(fields or []) | set(exclude or [])
+        unknown = requested - set(self.fields)
+        if unknown:
+            raise serializers.ValidationError({
+                'fields': f'Unknown field(s): {", ".join(sorted(unknown))}'
+            })
+        
+        for name in list(self.fields):
+            if (fields and name not in fields) or (exclude and name in exclude):
+                self.fields.pop(name)
 
 
 class JobCategorySerializer(serializers.ModelSerializer):
@@ -8,7 +36,7 @@ class JobCategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'created_at']
 
 
-class JobSerializer(serializers.ModelSerializer):
+class JobSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     category = JobCategorySerializer(read_only=True)
     category_id = serializers.IntegerField(write_only=True, required=False)
     created_by_email = serializers.EmailField(source='created_by.email', read_only=True)
@@ -16,9 +44,22 @@ class JobSerializer(serializers.ModelSerializer):
     class Meta:
         model = Job
         fields = [
-            'id', 'title', 'description', 'company_name', 'location',
-            'salary_min', 'salary_max', 'status', 'category', 'category_id',
-            'created_by_email', 'created_at', 'updated_at', 'published_at'
+            'id',
+            'title',
+            'description',
+            'company_name',
+            'location',
+            'salary_min',
+            'salary_max',
+            'status',
+            'category',
+            'category_id',
+            'created_by_email',
+            'created_at',
+            'updated_at',
+            'published_at',
+            'publish_at',
+            'expires_at',
         ]
         read_only_fields = ['created_at', 'updated_at', 'published_at']
     
@@ -31,10 +72,23 @@ class JobSerializer(serializers.ModelSerializer):
                 'salary_max': 'Maximum salary must be greater than minimum salary'
             })
         
+        publish_at = data.get('publish_at', getattr(self.instance, 'publish_at', None))
+        expires_at = data.get('expires_at', getattr(self.instance, 'expires_at', None))
+        if publish_at and expires_at and publish_at >= expires_at:
+            raise serializers.ValidationError({
+                'expires_at': 'Expiry must be after the scheduled publish time'
+            })
+        
         return data
 
 
-class JobApplicationSerializer(serializers.ModelSerializer):
+class JobIdsSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False, max_length=10000
+    )
+
+
+class JobApplicationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     job_title = serializers.CharField(source='job.title', read_only=True)
     applicant_email = serializers.EmailField(source='applicant.email', read_only=True)
     
@@ -46,3 +100,95 @@ class JobApplicationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['applied_at', 'reviewed_at']
 
+
+class ApplicationFilterSerializer(serializers.Serializer):
+    job = serializers.IntegerField(required=False)
+    status = serializers.ChoiceField(
+        choices=JobApplication.STATUS_CHOICES, required=False
+    )
+    applied_after = serializers.DateTimeField(required=False)
+    applied_before = serializers.DateTimeField(required=False)
+    
+    lookups = {
+        'job': 'job_id',
+        'status': 'status',
+        'applied_after': 'applied_at__gte',
+        'applied_before': 'applied_at__lt',
+    }
+    
+    def validate(self, data):
+        if not data:
+            msg = 'At least one filter is required'
+            raise serializers.ValidationError(msg)
+        return data
+
+
+class BulkReviewSerializer(serializers.Serializer):
+    status = serializers.ChoiceField(choices=JobApplication.REVIEW_STATUSES)
+    # Larger selections are made with filter.
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=1000,
+    )
+    filter = ApplicationFilterSerializer(required=False)
+    
+    def validate(self, data):
+        if ('ids' in data) == ('filter' in data):
+            msg = 'Provide either ids or filter'
+            raise serializers.ValidationError(msg)
+        return data
+    
+    def get_lookups(self):
+        """JobApplication filter arguments selecting the requested applications."""
+        if 'ids' in self.validated_data:
+            return {'pk__in': self.validated_data['ids']}
+        lookups = ApplicationFilterSerializer.lookups
+        return {
+            lookups[name]: value
+            for name, value in self.validated_data['filter'].items()
+        }
+
+
+class ApplicationAnalyticsSerializer(serializers.Serializer):
+    """Query parameters of the application analytics endpoint."""
+    
+    granularity = serializers.ChoiceField(choices=list(GRANULARITIES), default='day')
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+    group_by = serializers.ChoiceField(choices=list(GROUPINGS), required=False)
+    job = serializers.IntegerField(required=False)
+    category = serializers.IntegerField(required=False)
+    company = serializers.CharField(required=False)
+    
+    default_ranges = {
+        'hour': datetime.timedelta(days=2),
+        'day': datetime.timedelta(days=30),
+    }
+    max_ranges = {
+        'hour': datetime.timedelta(days=31),
+        'day': datetime.timedelta(days=731),
+    }
+    lookups = {'job': 'job_id', 'category': 'category_id', 'company': 'company_name'}
+    
+    def validate(self, data):
+        granularity = data['granularity']
+        data['end'] = data.get('end') or timezone.now()
+        data['start'] = (
+            data.get('start') or data['end'] - self.default_ranges[granularity]
+        )
+        if data['start'] >= data['end']:
+            raise serializers.ValidationError({'start': 'start must be before end'})
+        if data['end'] - data['start'] > self.max_ranges[granularity]:
+            days = self.max_ranges[granularity].days
+            raise serializers.ValidationError(
+                {'start': f'At most {days} days of {granularity}ly data per request'}
+            )
+        return data
+    
+    def get_filters(self):
+        data = self.validated_data
+        return {
+            lookup: data[name] for name, lookup in self.lookups.items() if name in data
+        }
@@ -1,49 +1,105 @@
+from celery.result import AsyncResult
+from django.conf import settings
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.db.models import Q
+from rest_framework.permissions import IsAdminUser, IsAuthenticated, AllowAny
+from django_test_app.jobs.conditional import (
+    ConditionalGetMixin,
+    ajob_version,
+    job_version,
+)
+from django_test_app.jobs.imports import import_jobs
 from django_test_app.jobs.models import Job, JobCategory, JobApplication
-from .serializers import JobSerializer, JobCategorySerializer, JobApplicationSerializer
+from django_test_app.jobs.services import (
+    apply_to_job,
+    asearch_jobs,
+    bulk_review_applications,
+    close_jobs,
+    get_job_facets,
+    get_job_statistics_bulk,
+    publish_jobs,
+    search_jobs,
+    suggest_search_terms,
+)
+from django_test_app.jobs.outbox import outbox_metrics
+from django_test_app.jobs.pagination import KeysetPagination
+from django_test_app.jobs.rollups import application_series
+from .idempotency import idempotent
+from .mixins import (
+    AsyncReadMixin,
+    CachedJobRetrieveMixin,
+    SparseFieldsetViewMixin,
+    StreamingExportMixin,
+    ValuesReadMixin,
+)
+from .serializers import (
+    ApplicationAnalyticsSerializer,
+    BulkReviewSerializer,
+    JobIdsSerializer,
+    JobSerializer,
+    JobCategorySerializer,
+    JobApplicationSerializer,
+)
 
 
-class JobCategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class JobCategoryViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = JobCategory.objects.all()
     serializer_class = JobCategorySerializer
     permission_classes = [AllowAny]
 
 
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(
+    AsyncReadMixin,
+    ConditionalGetMixin,
+    CachedJobRetrieveMixin,
+    StreamingExportMixin,
+    ValuesReadMixin,
+    SparseFieldsetViewMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = JobSerializer
+    pagination_class = KeysetPagination
     permission_classes = [AllowAny]
+    export_since_fields = ('updated_at',)
+    stats_max_ids = 100
     
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             return [IsAuthenticated()]
-        return [AllowAny()]
+        # Falls back to permission_classes, which @action(permission_classes=...)
+        # overrides.
+        return super().get_permissions()
     
-    def get_queryset(self):
-        queryset = Job.objects.all()
+    def _search_params(self):
         status_filter = self.request.query_params.get('status', None)
         search = self.request.query_params.get('search', None)
         category = self.request.query_params.get('category', None)
-        
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
-        else:
-            queryset = queryset.filter(status='published')
-        
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search) |
-                Q(company_name__icontains=search)
-            )
-        
-        if category:
-            queryset = queryset.filter(category_id=category)
-        
-        return queryset.select_related('category', 'created_by').prefetch_related('applications')
+        return {
+            'query': search,
+            'category_id': category,
+            'status': status_filter or 'published',
+        }
+    
+    def get_queryset(self):
+        queryset = search_jobs(**self._search_params())
+        return queryset.select_related('category', 'created_by')
+    
+    async def aget_queryset(self):
+        queryset = await asearch_jobs(**self._search_params())
+        return queryset.select_related('category', 'created_by')
+    
+    def get_version(self, queryset):
+        cached = self.get_cached_job()
+        if cached is not None:
+            return cached['data'], cached['last_modified']
+        return job_version(queryset)
+    
+    async def aget_version(self, queryset):
+        cached = await self.aget_cached_job()
+        if cached is not None:
+            return cached['data'], cached['last_modified']
+        return await ajob_version(queryset)
     
     def perform_create(self, serializer):
         if self.request.user.is_authenticated:
@@ -51,44 +107,154 @@ class JobViewSet(viewsets.ModelViewSet):
         else:
             serializer.save()
     
-    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated])
-    def apply(self, request, pk=None):
-        job = self.get_object()
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated])
+    def bulk(self, request):
+        rows = request.data
+        if not isinstance(rows, list):
+            return Response(
+                {'error': 'Expected a list of jobs'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        if job.status != 'published':
+        max_rows = getattr(settings, 'JOBS_BULK_IMPORT_MAX_ROWS', 10000)
+        if len(rows) > max_rows:
             return Response(
-                {'error': 'You can only apply to published jobs'},
+                {'error': f'At most {max_rows} jobs can be imported per request'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        cover_letter = request.data.get('cover_letter', '')
-        resume_url = request.data.get('resume_url', '')
+        result = import_jobs(rows, created_by=request.user)
+        return Response(
+            {'created': result.created, 'errors': result.errors},
+            status=(
+                status.HTTP_201_CREATED
+                if result.created
+                else status.HTTP_400_BAD_REQUEST
+            ),
+        )
+    
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        status_filter = request.query_params.get('status', None)
+        search = request.query_params.get('search', None)
+        category = request.query_params.get('category', None)
         
-        if JobApplication.objects.filter(job=job, applicant=request.user).exists():
+        return Response(
+            get_job_facets(
+                search, category_id=category, status=status_filter or 'published'
+            )
+        )
+    
+    @action(detail=False, methods=['get'])
+    def suggestions(self, request):
+        search = request.query_params.get('search', '')
+        return Response({'search': search, 'suggestions': suggest_search_terms(search)})
+    
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def stats(self, request):
+        jobs = (
+            Job.objects.all()
+            if request.user.is_staff
+            else Job.objects.filter(created_by=request.user)
+        )
+        ids = request.query_params.get('ids')
+        if not ids:
+            page = self.paginate_queryset(jobs.order_by('pk').only('pk'))
+            statistics = get_job_statistics_bulk([job.pk for job in page])
+            return self.get_paginated_response(self._stats_rows(statistics))
+        
+        try:
+            job_ids = [int(job_id) for job_id in ids.split(',')]
+        except ValueError:
+            job_ids = None
+        if job_ids is None or len(job_ids) > self.stats_max_ids:
             return Response(
-                {'error': 'You have already applied for this job'},
+                {
+                    'error': 'ids must be a comma-separated list of at most '
+                    f'{self.stats_max_ids} job ids'
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        statistics = get_job_statistics_bulk(jobs.filter(pk__in=job_ids))
+        return Response({'results': self._stats_rows(statistics)})
+    
+    def _stats_rows(self, statistics):
+        return [{'job': job_id, **counters} for job_id, counters in statistics.items()]
+    
+    def _change_status(self, request, change):
+        serializer = JobIdsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data['ids']
+        jobs = Job.objects.filter(pk__in=ids)
+        if not request.user.is_staff:
+            jobs = jobs.filter(created_by=request.user)
+        
+        changed = change(jobs.values_list('pk', flat=True))
+        return Response(
+            {'changed': changed, 'unchanged': sorted(set(ids) - set(changed))}
+        )
+    
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='bulk-publish',
+        permission_classes=[IsAuthenticated],
+    )
+    def bulk_publish(self, request):
+        return self._change_status(request, publish_jobs)
+    
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='bulk-close',
+        permission_classes=[IsAuthenticated],
+    )
+    def bulk_close(self, request):
+        return self._change_status(request, close_jobs)
+    
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated])
+    @idempotent
+    def apply(self, request, pk=None):
+        job = self.get_object()
+        
+        if job.status != 'published':
+            return Response(
+                {'error': 'You can only apply to published jobs'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        application = JobApplication.objects.create(
-            job=job,
-            applicant=request.user,
-            cover_letter=cover_letter,
-            resume_url=resume_url
+        application, created = apply_to_job(
+            job,
+            request.user,
+            cover_letter=request.data.get('cover_letter', ''),
+            resume_url=request.data.get('resume_url', '')
         )
         
         serializer = JobApplicationSerializer(application)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(
+            serializer.data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
 
 
-class JobApplicationViewSet(viewsets.ModelViewSet):
+class JobApplicationViewSet(
+    ConditionalGetMixin,
+    StreamingExportMixin,
+    ValuesReadMixin,
+    SparseFieldsetViewMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = JobApplicationSerializer
+    pagination_class = KeysetPagination
     permission_classes = [IsAuthenticated]
+    export_since_fields = ('applied_at', 'reviewed_at')
+    conditional_fields = ('applied_at', 'reviewed_at', 'job__updated_at')
     
     def get_queryset(self):
+        queryset = JobApplication.objects.select_related('job', 'applicant')
         if self.request.user.is_staff:
-            return JobApplication.objects.all()
-        return JobApplication.objects.filter(applicant=self.request.user)
+            return queryset
+        return queryset.filter(applicant=self.request.user)
     
     def perform_create(self, serializer):
         serializer.save(applicant=self.request.user)
@@ -104,7 +270,7 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         application = self.get_object()
         new_status = request.data.get('status', '')
         
-        valid_statuses = ['reviewed', 'accepted', 'rejected']
+        valid_statuses = JobApplication.REVIEW_STATUSES
         if new_status not in valid_statuses:
             return Response(
                 {'error': f'Invalid status. Must be one of: {", ".join(valid_statuses)}'},
@@ -118,4 +284,70 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         
         serializer = self.get_serializer(application)
         return Response(serializer.data)
+    
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='bulk-review',
+        permission_classes=[IsAdminUser],
+    )
+    def bulk_review(self, request):
+        serializer = BulkReviewSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        count, task_id = bulk_review_applications(
+            serializer.get_lookups(), serializer.validated_data['status']
+        )
+        if task_id is None:
+            return Response({'updated': count})
+        return Response(
+            {'selected': count, 'task_id': task_id}, status=status.HTTP_202_ACCEPTED
+        )
+    
+    @action(
+        detail=False, methods=['get'], url_path=r'bulk-review/(?P<task_id>[0-9a-f-]+)',
+        permission_classes=[IsAdminUser]
+    )
+    def bulk_review_progress(self, request, task_id=None):
+        result = AsyncResult(task_id)
+        data = {'task_id': task_id, 'state': result.state}
+        if isinstance(result.info, dict):
+            data.update(result.info)
+        return Response(data)
 
+
+class ApplicationAnalyticsViewSet(viewsets.ViewSet):
+    """Applications per hour or day, read from the rollup tables."""
+    
+    permission_classes = [IsAuthenticated]
+    
+    def list(self, request):
+        params = ApplicationAnalyticsSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+        jobs = (
+            None
+            if request.user.is_staff
+            else Job.objects.filter(created_by=request.user)
+        )
+        
+        results = application_series(
+            query['granularity'], query['start'], query['end'],
+            group_by=query.get('group_by'), jobs=jobs, filters=params.get_filters()
+        )
+        return Response({
+            'granularity': query['granularity'],
+            'start': query['start'],
+            'end': query['end'],
+            'group_by': query.get('group_by'),
+            'results': results,
+        })
+
+
+class OutboxMetricsViewSet(viewsets.ViewSet):
+    """Outbox queue depth and send throughput, for monitoring."""
+    
+    permission_classes = [IsAdminUser]
+    
+    def list(self, request):
+        return Response(outbox_metrics())
@@ -6,3 +6,6 @@ class JobsConfig(AppConfig):
     name = "django_test_app.jobs"
     verbose_name = "Jobs"
 
+
+    def ready(self):
+        import django_test_app.jobs.signals  # noqa: F401, PLC0415
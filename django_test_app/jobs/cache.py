@@ -0,0 +1,183 @@
+"""
+Versioned cache of job representations for the detail page and API retrieve.
+
+Each job has a version token under ``jobs:job:<id>:version`` and its cached
+representations live under ``jobs:job:<id>:<token>:<variant>``. Saving or
+deleting the job or its category, publish_jobs(), close_jobs() and the
+scheduled publish and expiry runs replace the token once the transaction
+commits. Stale entries are then never read again
+and simply expire. Changes to the job owner (``created_by_email``) are only
+picked up when the entry expires.
+
+The ``a``-prefixed functions are the same lookups for async views, through
+the async cache API and ORM; both share keys and counters.
+
+Hit and miss counters are per process.
+"""
+import threading
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .api.serializers import JobSerializer
+from .models import Job
+
+
+KEY_PREFIX = 'jobs:job'
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def _version_key(job_id):
+    return f'{KEY_PREFIX}:{job_id}:version'
+
+
+def _new_token():
+    return uuid.uuid4().hex[:16]
+
+
+def _record(variant, outcome):
+    with _stats_lock:
+        _stats[f'{variant}_{outcome}'] += 1
+        _stats[outcome] += 1
+
+
+def get_token(job_id):
+    key = _version_key(job_id)
+    token = cache.get(key)
+    if token is None:
+        token = _new_token()
+        if not cache.add(key, token, timeout=None):
+            token = cache.get(key) or token
+    return token
+
+
+async def aget_token(job_id):
+    key = _version_key(job_id)
+    token = await cache.aget(key)
+    if token is None:
+        token = _new_token()
+        if not await cache.aadd(key, token, timeout=None):
+            token = await cache.aget(key) or token
+    return token
+
+
+def invalidate_jobs(job_ids):
+    """Replace the version token of every job in ``job_ids``."""
+    tokens = {_version_key(job_id): _new_token() for job_id in job_ids}
+    if tokens:
+        cache.set_many(tokens, timeout=None)
+
+
+def invalidate_jobs_on_commit(job_ids):
+    job_ids = list(job_ids)
+    transaction.on_commit(lambda: invalidate_jobs(job_ids))
+
+
+def get_or_set(job_id, variant, build):
+    """
+    Return the cached ``variant`` of a job, calling ``build()`` on a miss.
+
+    ``None`` is never cached.
+    """
+    key = f'{KEY_PREFIX}:{job_id}:{get_token(job_id)}:{variant}'
+    value = cache.get(key)
+    if value is not None:
+        _record(variant, 'hits')
+        return value
+    _record(variant, 'misses')
+    value = build()
+    if value is not None:
+        cache.set(key, value, getattr(settings, 'JOBS_DETAIL_CACHE_TIMEOUT', 300))
+    return value
+
+
+async def aget_or_set(job_id, variant, build):
+    """get_or_set() for async views; ``build`` is a coroutine function."""
+    key = f'{KEY_PREFIX}:{job_id}:{await aget_token(job_id)}:{variant}'
+    value = await cache.aget(key)
+    if value is not None:
+        _record(variant, 'hits')
+        return value
+    _record(variant, 'misses')
+    value = await build()
+    if value is not None:
+        await cache.aset(
+            key, value, getattr(settings, 'JOBS_DETAIL_CACHE_TIMEOUT', 300)
+        )
+    return value
+
+
+def get_job(job_id):
+    """Return the job with its category and owner, or ``None``, whatever its status."""
+    def build():
+        return (
+            Job.objects.select_related('category', 'created_by')
+            .filter(pk=job_id)
+            .first()
+        )
+    return get_or_set(job_id, 'instance', build)
+
+
+async def aget_job(job_id):
+    async def build():
+        return (
+            await Job.objects.select_related('category', 'created_by')
+            .filter(pk=job_id)
+            .afirst()
+        )
+    return await aget_or_set(job_id, 'instance', build)
+
+
+def last_modified(job):
+    timestamps = [job.updated_at]
+    if job.category is not None:
+        timestamps.append(job.category.updated_at)
+    return max(timestamps)
+
+
+def get_job_data(job_id):
+    """
+    Return ``{'data': <JobSerializer output>, 'last_modified': <datetime>}``
+    or ``None``.
+
+    Built from the cached instance on a miss.
+    """
+    def build():
+        job = get_job(job_id)
+        if job is None:
+            return None
+        return {
+            'data': dict(JobSerializer(job).data),
+            'last_modified': last_modified(job),
+        }
+    return get_or_set(job_id, 'api', build)
+
+
+async def aget_job_data(job_id):
+    async def build():
+        job = await aget_job(job_id)
+        if job is None:
+            return None
+        return {
+            'data': dict(JobSerializer(job).data),
+            'last_modified': last_modified(job),
+        }
+    return await aget_or_set(job_id, 'api', build)
+
+
+def cache_stats():
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats.get('hits', 0) + stats.get('misses', 0)
+    stats['hit_ratio'] = stats.get('hits', 0) / lookups if lookups else None
+    return stats
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,227 @@
+"""
+Conditional GET (ETag / Last-Modified) for job, category and application views.
+
+Validators come from one aggregate query: the newest of some timestamp columns
+and a row count. A matching request is answered with 304 before any rows are
+loaded or serialized. The count catches deletions, which leave the timestamps
+unchanged, so If-None-Match is more reliable than If-Modified-Since alone.
+Changes that bump no timestamp (e.g. a user's email) are not detected.
+"""
+import hashlib
+from calendar import timegm
+from http import HTTPStatus
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .models import JobCategory
+
+
+def queryset_version(queryset, fields=('updated_at',)):
+    """Return ``(row count, newest value of fields)`` for ``queryset``."""
+    latest = {f'latest_{position}': Max(field) for position, field in enumerate(fields)}
+    state = queryset.order_by().aggregate(count=Count('pk'), **latest)
+    count = state.pop('count')
+    return count, max(
+        (value for value in state.values() if value is not None), default=None
+    )
+
+
+async def aqueryset_version(queryset, fields=('updated_at',)):
+    latest = {f'latest_{position}': Max(field) for position, field in enumerate(fields)}
+    state = await queryset.order_by().aaggregate(count=Count('pk'), **latest)
+    count = state.pop('count')
+    return count, max(
+        (value for value in state.values() if value is not None), default=None
+    )
+
+
+def _merge_job_version(job_state, category_state):
+    count, last_modified = job_state
+    category_count, category_modified = category_state
+    if last_modified is None or (
+        category_modified is not None and category_modified > last_modified
+    ):
+        last_modified = category_modified
+    return (count, category_count), last_modified
+
+
+def job_version(queryset):
+    """Jobs embed their category, so category edits and deletions are job changes."""
+    return _merge_job_version(
+        queryset_version(queryset), queryset_version(JobCategory.objects.all())
+    )
+
+
+async def ajob_version(queryset):
+    return _merge_job_version(
+        await aqueryset_version(queryset),
+        await aqueryset_version(JobCategory.objects.all()),
+    )
+
+
+def make_etag(*parts):
+    return hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+def not_modified(request, etag, last_modified):
+    """
+    Return a 304 (or 412) response when the request's preconditions match.
+
+    Returns ``None`` otherwise.
+    """
+    return get_conditional_response(
+        request,
+        etag=quote_etag(etag),
+        last_modified=timegm(last_modified.utctimetuple()) if last_modified else None,
+    )
+
+
+def set_validators(response, etag, last_modified):
+    if response.status_code != HTTPStatus.OK:
+        return response
+    response.headers.setdefault('ETag', quote_etag(etag))
+    if last_modified:
+        response.headers.setdefault(
+            'Last-Modified', http_date(timegm(last_modified.utctimetuple()))
+        )
+    return response
+
+
+class ConditionalGetViewMixin:
+    """
+    ETag / Last-Modified for anonymous GETs of a Django ListView or DetailView.
+
+    Authenticated pages include per-user content and are always rendered.
+    """
+
+    def _lookup(self, queryset):
+        pk_url_kwarg = getattr(self, 'pk_url_kwarg', None)
+        if pk_url_kwarg in self.kwargs:
+            queryset = queryset.filter(pk=self.kwargs[pk_url_kwarg])
+        return queryset
+
+    def get_conditional_queryset(self):
+        return self._lookup(self.get_queryset())
+
+    def get_version(self, queryset):
+        return queryset_version(queryset)
+
+    def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().get(request, *args, **kwargs)
+        state, last_modified = self.get_version(self.get_conditional_queryset())
+        etag = make_etag(request.get_full_path(), state, last_modified)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        return set_validators(
+            super().get(request, *args, **kwargs), etag, last_modified
+        )
+
+
+class AsyncConditionalGetViewMixin(ConditionalGetViewMixin):
+    """
+    ConditionalGetViewMixin with an async ``aget()`` alongside the sync ``get()``.
+
+    The validators are computed with ``aget_version()`` over ``aget_queryset()``.
+    """
+
+    async def aget_queryset(self):
+        return self.get_queryset()
+
+    async def aget_version(self, queryset):
+        return await aqueryset_version(queryset)
+
+    async def aget(self, request, *args, **kwargs):
+        if (await request.auser()).is_authenticated:
+            return await super().aget(request, *args, **kwargs)
+        state, last_modified = await self.aget_version(
+            self._lookup(await self.aget_queryset())
+        )
+        etag = make_etag(request.get_full_path(), state, last_modified)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        return set_validators(
+            await super().aget(request, *args, **kwargs), etag, last_modified
+        )
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified for viewset list and retrieve.
+
+    The ETag also covers the full path, the negotiated media type and the user,
+    since each of them changes the response body.
+    """
+
+    conditional_fields = ('updated_at',)
+
+    def _lookup(self, queryset):
+        queryset = self.filter_queryset(queryset)
+        if self.action == 'retrieve':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            try:
+                queryset = queryset.filter(
+                    **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+                )
+            except (TypeError, ValueError, ValidationError) as exc:
+                raise Http404 from exc
+        return queryset
+
+    def get_conditional_queryset(self):
+        return self._lookup(self.get_queryset())
+
+    def get_version(self, queryset):
+        return queryset_version(queryset, self.conditional_fields)
+
+    def _etag(self, request, state, last_modified):
+        return make_etag(
+            request.get_full_path(),
+            request.accepted_media_type,
+            request.user.pk,
+            state,
+            last_modified,
+        )
+
+    def _conditional(self, handler, request, *args, **kwargs):
+        state, last_modified = self.get_version(self.get_conditional_queryset())
+        etag = self._etag(request, state, last_modified)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        return set_validators(handler(request, *args, **kwargs), etag, last_modified)
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional(super().retrieve, request, *args, **kwargs)
+
+    # Async counterparts, for viewsets whose list / retrieve actions are async
+    # (api.mixins.AsyncReadMixin).
+
+    async def aget_version(self, queryset):
+        return await aqueryset_version(queryset, self.conditional_fields)
+
+    async def _aconditional(self, handler, request, *args, **kwargs):
+        state, last_modified = await self.aget_version(
+            self._lookup(await self.aget_queryset())
+        )
+        etag = self._etag(request, state, last_modified)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        return set_validators(
+            await handler(request, *args, **kwargs), etag, last_modified
+        )
+
+    async def alist(self, request, *args, **kwargs):
+        return await self._aconditional(super().alist, request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await self._aconditional(super().aretrieve, request, *args, **kwargs)
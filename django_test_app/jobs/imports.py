@@ -0,0 +1,181 @@
+"""
+Bulk job ingestion.
+
+Rows are validated with JobSerializer, so the field rules and its salary range
+check apply. Valid rows are then loaded in batches with Postgres COPY (or
+bulk_create). Invalid rows are reported by their 0-based position in the input
+and skipped. They never abort the rest of the batch.
+"""
+import csv
+import json
+from dataclasses import dataclass, field
+from itertools import batched
+
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
+
+from .api.serializers import JobSerializer
+from .models import Job, JobCategory
+from .search_index import index_jobs
+
+
+COPY_COLUMNS = (
+    'title', 'description', 'company_name', 'location', 'salary_min', 'salary_max',
+    'status', 'category_id', 'created_by_id', 'created_at', 'updated_at',
+    'published_at', 'publish_at', 'expires_at',
+)
+
+IMPORT_METHODS = ('copy', 'bulk_create')
+
+INVALID_CATEGORY = 'Invalid pk "{pk}" - object does not exist.'
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    errors: list = field(default_factory=list)
+
+
+def read_rows(stream, file_format):
+    """Yield job dicts from a CSV, NDJSON or JSON array text stream."""
+    if file_format == 'csv':
+        for row in csv.DictReader(stream):
+            # CSV has no null; treat empty cells as missing values.
+            yield {key: value for key, value in row.items() if value != ''}
+    elif file_format == 'ndjson':
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+    elif file_format == 'json':
+        yield from json.load(stream)
+    else:
+        msg = f'Unsupported import format: {file_format}'
+        raise ValueError(msg)
+
+
+def _surrogate_check(validator):
+    # DRF checks every character in Python; a UTF-8 encode finds surrogates in C.
+    def check(value):
+        try:
+            value.encode('utf-8')
+        except UnicodeEncodeError:
+            validator(value)
+    return check
+
+
+def import_serializer():
+    """
+    JobSerializer with a fast, equivalent check instead of the surrogate validators.
+    
+    DRF checks every character of a string for surrogates in Python.
+    """
+    serializer = JobSerializer()
+    for serializer_field in serializer.fields.values():
+        serializer_field.validators = [
+            _surrogate_check(validator)
+            if isinstance(validator, ProhibitSurrogateCharactersValidator)
+            else validator
+            for validator in serializer_field.validators
+        ]
+    return serializer
+
+
+def validate_rows(rows, start=0):
+    """Return ``(valid, errors)``; ``valid`` is a list of ``(position, data)`` pairs."""
+    serializer = import_serializer()
+    valid = []
+    errors = []
+    for position, row in enumerate(rows, start):
+        try:
+            valid.append((position, serializer.run_validation(row)))
+        except serializers.ValidationError as exc:
+            errors.append(
+                {'index': position, 'errors': serializers.as_serializer_error(exc)}
+            )
+    
+    category_ids = {
+        data['category_id']
+        for _position, data in valid
+        if data.get('category_id') is not None
+    }
+    if category_ids:
+        missing = category_ids - set(
+            JobCategory.objects.filter(pk__in=category_ids).values_list('pk', flat=True)
+        )
+        if missing:
+            errors.extend(
+                {
+                    'index': position,
+                    'errors': {
+                        'category_id': [INVALID_CATEGORY.format(pk=data['category_id'])]
+                    },
+                }
+                for position, data in valid
+                if data.get('category_id') in missing
+            )
+            valid = [
+                (position, data)
+                for position, data in valid
+                if data.get('category_id') not in missing
+            ]
+            errors.sort(key=lambda error: error['index'])
+    return valid, errors
+
+
+def _values(data, created_by, now):
+    status = data.get('status', Job._meta.get_field('status').default)
+    return (
+        data['title'], data['description'], data['company_name'], data['location'],
+        data.get('salary_min'), data.get('salary_max'), status, data.get('category_id'),
+        created_by.pk, now, now, now if status == 'published' else None,
+        data.get('publish_at'), data.get('expires_at'),
+    )
+
+
+def _copy(rows):
+    columns = ', '.join(connection.ops.quote_name(column) for column in COPY_COLUMNS)
+    table = connection.ops.quote_name(Job._meta.db_table)
+    with (
+        connection.cursor() as cursor,
+        cursor.copy(f'COPY {table} ({columns}) FROM STDIN') as copy,
+    ):
+        for row in rows:
+            copy.write_row(row)
+
+
+def _bulk_create(rows):
+    Job.objects.bulk_create(
+        [Job(**dict(zip(COPY_COLUMNS, row, strict=True))) for row in rows],
+        batch_size=1000,
+    )
+
+
+def import_jobs(rows, created_by, batch_size=5000, method='copy'):
+    """
+    Validate and insert ``rows`` (an iterable of dicts) as jobs owned by ``created_by``.
+    
+    Each batch is inserted in its own transaction. Published jobs are added to
+    the in-process search index once the import commits.
+    """
+    if method not in IMPORT_METHODS:
+        msg = f'Unsupported import method: {method}'
+        raise ValueError(msg)
+    load = _copy if method == 'copy' else _bulk_create
+    now = timezone.now()
+    result = ImportResult()
+    start = 0
+    for batch in batched(rows, batch_size, strict=False):
+        valid, errors = validate_rows(batch, start)
+        result.errors.extend(errors)
+        if valid:
+            with transaction.atomic():
+                load([_values(data, created_by, now) for _position, data in valid])
+            result.created += len(valid)
+        start += len(batch)
+    
+    if result.created:
+        imported = Job.objects.filter(created_by=created_by, created_at__gte=now)
+        transaction.on_commit(lambda: index_jobs(imported))
+    return result
@@ -0,0 +1,50 @@
+"""Shared setup for the ``benchmark_*`` management commands."""
+import random
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+
+from django_test_app.jobs.models import Job, JobCategory
+from django_test_app.users.models import User
+
+
+@contextmanager
+def rolled_back():
+    """Run the block in a transaction that is rolled back, leaving no rows behind."""
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+def benchmark_user(size):
+    return User.objects.create(email=f'benchmark-{size}@example.com')
+
+
+def populate_jobs(size, batch_size=5000):
+    """Create ``size`` published jobs with salaries in a new category and return it."""
+    rng = random.Random(size)  # noqa: S311
+    user = benchmark_user(size)
+    category = JobCategory.objects.create(
+        name='Benchmark', description='Synthetic rows'
+    )
+    Job.objects.bulk_create(
+        [
+            Job(
+                title=f'Job {n}',
+                description='Lorem ipsum dolor sit amet. ' * 40,
+                company_name=f'Company {n % 500}',
+                location='Remote',
+                salary_min=Decimal(rng.randint(30000, 50000)),
+                salary_max=Decimal(rng.randint(50000, 100000)),
+                status='published',
+                category=category,
+                created_by=user,
+                published_at=timezone.now(),
+            )
+            for n in range(size)
+        ],
+        batch_size=batch_size,
+    )
+    return category
@@ -0,0 +1,107 @@
+import asyncio
+import statistics
+import time
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        'Load a running server with concurrent keep-alive connections and report '
+        'throughput and latency, e.g. to compare the WSGI and ASGI deployments '
+        '(compose/production/django/start) with the same WEB_CONCURRENCY.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'urls',
+            nargs='+',
+            help='Absolute http:// URLs, requested in turn by each connection.',
+        )
+        parser.add_argument('--connections', nargs='+', type=int, default=[1, 16, 64])
+        parser.add_argument(
+            '--duration', type=float, default=10, help='Seconds per connection count.'
+        )
+
+    def handle(self, *args, **options):
+        targets = [urlsplit(url) for url in options['urls']]
+        if any(target.scheme != 'http' or not target.hostname for target in targets):
+            msg = 'Only absolute http:// URLs are supported.'
+            raise CommandError(msg)
+        for connections in options['connections']:
+            latencies, errors, elapsed = asyncio.run(
+                self._run(targets, connections, options['duration'])
+            )
+            if not latencies:
+                msg = f'No successful responses ({errors} errors).'
+                raise CommandError(msg)
+            quantiles = statistics.quantiles(latencies, n=100)
+            self.stdout.write(
+                f'connections={connections} requests={len(latencies)} errors={errors} '
+                f'throughput={len(latencies) / elapsed:,.0f} req/s '
+                f'p50={quantiles[49] * 1000:.1f}ms p99={quantiles[98] * 1000:.1f}ms'
+            )
+
+    async def _run(self, targets, connections, duration):
+        latencies = []
+        errors = 0
+        deadline = time.monotonic() + duration
+
+        async def client(offset):
+            nonlocal errors
+            reader = writer = None
+            position = offset
+            while time.monotonic() < deadline:
+                target = targets[position % len(targets)]
+                position += 1
+                try:
+                    if writer is None:
+                        reader, writer = await asyncio.open_connection(
+                            target.hostname, target.port or 80
+                        )
+                    started = time.perf_counter()
+                    writer.write(self._request(target))
+                    status, keep_alive = await self._read_response(reader)
+                    latency = time.perf_counter() - started
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    errors += 1
+                    status, keep_alive = None, False
+                if status == HTTPStatus.OK:
+                    latencies.append(latency)
+                elif status is not None:
+                    errors += 1
+                if not keep_alive and writer is not None:
+                    writer.close()
+                    reader = writer = None
+            if writer is not None:
+                writer.close()
+
+        started = time.monotonic()
+        await asyncio.gather(*(client(offset) for offset in range(connections)))
+        return latencies, errors, time.monotonic() - started
+
+    def _request(self, target):
+        path = target.path or '/'
+        if target.query:
+            path = f'{path}?{target.query}'
+        return (
+            f'GET {path} HTTP/1.1\r\nHost: {target.netloc}\r\n'
+            'Accept: application/json\r\nConnection: keep-alive\r\n\r\n'
+        ).encode()
+
+    async def _read_response(self, reader):
+        status_line = await reader.readuntil(b'\r\n')
+        status = int(status_line.split()[1])
+        headers = {}
+        while (line := await reader.readuntil(b'\r\n')) != b'\r\n':
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        if headers.get('transfer-encoding') == 'chunked':
+            while size := int((await reader.readuntil(b'\r\n')).split(b';')[0], 16):
+                await reader.readexactly(size + 2)
+            await reader.readuntil(b'\r\n')
+        else:
+            await reader.readexactly(int(headers.get('content-length', 0)))
+        return status, headers.get('connection', '').lower() != 'close'
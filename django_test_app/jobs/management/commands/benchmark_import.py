@@ -0,0 +1,61 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from django_test_app.jobs.imports import IMPORT_METHODS, import_jobs
+from django_test_app.jobs.management.benchmark import benchmark_user, rolled_back
+from django_test_app.jobs.models import JobCategory
+
+
+class Command(BaseCommand):
+    help = (
+        'Time import_jobs() on synthetic rows (1% invalid). '
+        'All imported rows are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', nargs='+', type=int, default=[100_000])
+        parser.add_argument(
+            '--methods', nargs='+', choices=IMPORT_METHODS, default=list(IMPORT_METHODS)
+        )
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        for size in options['rows']:
+            for method in options['methods']:
+                with rolled_back():
+                    user = benchmark_user(size)
+                    rows = self._rows(
+                        size, JobCategory.objects.create(name='Benchmark').pk
+                    )
+                    started = time.perf_counter()
+                    result = import_jobs(
+                        rows, user, batch_size=options['batch_size'], method=method
+                    )
+                    elapsed = time.perf_counter() - started
+                    self.stdout.write(
+                        f'rows={size} method={method} created={result.created} '
+                        f'rejected={len(result.errors)} time={elapsed:.1f}s '
+                        f'throughput={size / elapsed:,.0f} rows/s'
+                    )
+
+    def _rows(self, size, category_id):
+        rng = random.Random(size)  # noqa: S311
+        for n in range(size):
+            salary_min = rng.randint(30000, 50000)
+            yield {
+                'title': f'Imported job {n}',
+                'description': 'Lorem ipsum dolor sit amet. ' * 20,
+                'company_name': f'Company {n % 500}',
+                'location': 'Remote',
+                'salary_min': str(salary_min),
+                # Every hundredth row breaks the salary range rule.
+                'salary_max': str(
+                    salary_min - 1
+                    if n % 100 == 0
+                    else salary_min + rng.randint(0, 50000)
+                ),
+                'status': 'published',
+                'category_id': category_id,
+            }
@@ -0,0 +1,76 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from django_test_app.jobs.management.benchmark import benchmark_user, rolled_back
+from django_test_app.jobs.models import Job, JobApplication
+from django_test_app.jobs.services import get_job_statistics, get_job_statistics_bulk
+from django_test_app.jobs.stats import reconcile_job_stats
+from django_test_app.users.models import User
+
+
+STATUSES = ('pending', 'reviewed', 'accepted', 'rejected')
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare get_job_statistics() in a loop with get_job_statistics_bulk() '
+        'for a growing number of jobs. All created rows are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', nargs='+', type=int, default=[10, 100, 1000])
+        parser.add_argument(
+            '--applications', type=int, default=20, help='Applications per job.'
+        )
+
+    def handle(self, *args, **options):
+        for size in options['jobs']:
+            with rolled_back():
+                job_ids = self._populate(size, options['applications'])
+                self._measure(
+                    'loop',
+                    size,
+                    lambda ids: [get_job_statistics(job_id) for job_id in ids],
+                    job_ids,
+                )
+                self._measure('bulk', size, get_job_statistics_bulk, job_ids)
+
+    def _measure(self, label, size, call, job_ids):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            call(job_ids)
+            elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'jobs={size} {label}: queries={len(queries)} time={elapsed * 1000:.1f}ms'
+        )
+
+    def _populate(self, size, applications):
+        owner = benchmark_user(size)
+        applicants = User.objects.bulk_create(
+            User(email=f'benchmark-stats-{size}-{n}@example.com')
+            for n in range(applications)
+        )
+        jobs = Job.objects.bulk_create(
+            Job(
+                title=f'Job {n}',
+                description='Benchmark',
+                company_name='Acme',
+                location='Remote',
+                created_by=owner,
+            )
+            for n in range(size)
+        )
+        JobApplication.objects.bulk_create(
+            JobApplication(
+                job=job, applicant=applicant, status=STATUSES[n % len(STATUSES)]
+            )
+            for job in jobs
+            for n, applicant in enumerate(applicants)
+        )
+        job_ids = [job.pk for job in jobs]
+        # bulk_create() skips the signals that maintain the counters.
+        reconcile_job_stats(job_ids)
+        return job_ids
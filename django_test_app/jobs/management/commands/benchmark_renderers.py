@@ -0,0 +1,76 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from django_test_app.jobs.api.renderers import FastJSONRenderer, orjson
+from django_test_app.jobs.api.serializers import JobSerializer
+from django_test_app.jobs.management.benchmark import populate_jobs, rolled_back
+from django_test_app.jobs.models import Job
+
+
+RENDERERS = {
+    'stdlib': JSONRenderer,
+    'fast': FastJSONRenderer,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare JSON render time for job list payloads. '
+        'Generated rows are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', nargs='+', type=int, default=[1000, 10000])
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    'orjson is not installed; FastJSONRenderer uses the stdlib.'
+                )
+            )
+        for size in options['rows']:
+            with rolled_back():
+                queryset = (
+                    Job.objects.filter(category=populate_jobs(size))
+                    .select_related('category', 'created_by')
+                    .order_by('-created_at', '-id')
+                )
+                columns = [
+                    field.attname
+                    for field in Job._meta.concrete_fields
+                    if field.name != 'search_vector'
+                ]
+                payloads = {
+                    # What the API renders: serializer output, salaries and dates
+                    # already strings.
+                    'serialized': {'results': JobSerializer(queryset, many=True).data},
+                    # Raw rows with Decimal and datetime values.
+                    'values': {'results': list(queryset.values(*columns))},
+                }
+                for payload_name, payload in payloads.items():
+                    for renderer_name, renderer_class in RENDERERS.items():
+                        self._run(
+                            size,
+                            payload_name,
+                            renderer_name,
+                            renderer_class(),
+                            payload,
+                            options['repeat'],
+                        )
+
+    def _run(self, size, payload_name, renderer_name, renderer, payload, repeat):  # noqa: PLR0913
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            content = renderer.render(payload, 'application/json')
+            timings.append(time.perf_counter() - started)
+        median = statistics.median(timings)
+        self.stdout.write(
+            f'rows={size} payload={payload_name} renderer={renderer_name} '
+            f'median={median * 1000:.1f}ms size={len(content) / 1024:,.0f}KiB'
+        )
@@ -0,0 +1,127 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from django_test_app.jobs.management.benchmark import benchmark_user, rolled_back
+from django_test_app.jobs.models import Job, JobCategory
+from django_test_app.jobs.search_index import get_index, reset_index, tokenize
+from django_test_app.jobs.services import search_jobs
+
+
+WORDS = [
+    'python', 'django', 'senior', 'junior', 'backend', 'frontend', 'engineer',
+    'developer', 'manager', 'data', 'analyst', 'platform', 'cloud', 'security',
+    'mobile', 'product', 'design', 'remote', 'contract', 'support', 'sales',
+    'marketing', 'finance', 'operations', 'research', 'machine', 'learning', 'devops',
+    'qa', 'lead',
+]
+
+BACKENDS = {
+    'icontains': 'django_test_app.jobs.search.ContainsSearchBackend',
+    'fulltext': 'django_test_app.jobs.search.FullTextSearchBackend',
+    'trigram': 'django_test_app.jobs.search.TrigramSearchBackend',
+    'inverted': 'django_test_app.jobs.search.InvertedIndexSearchBackend',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare search backends against synthetic published jobs. '
+        'All generated rows are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', nargs='+', type=int, default=[100_000, 1_000_000]
+        )
+        parser.add_argument(
+            '--queries',
+            nargs='+',
+            default=['python', 'senior engineer', 'cloud security'],
+        )
+        parser.add_argument(
+            '--backends', nargs='+', choices=sorted(BACKENDS), default=sorted(BACKENDS)
+        )
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        for size in options['sizes']:
+            try:
+                with rolled_back():
+                    self._populate(size, options['batch_size'])
+                    reset_index()
+                    for backend in options['backends']:
+                        for query in options['queries']:
+                            self._run(size, backend, query, options['repeat'])
+            finally:
+                reset_index()
+
+    def _populate(self, size, batch_size):
+        rng = random.Random(size)  # noqa: S311
+        user = benchmark_user(size)
+        category = JobCategory.objects.create(name='Benchmark')
+        created = 0
+        started = time.perf_counter()
+        while created < size:
+            count = min(batch_size, size - created)
+            Job.objects.bulk_create(
+                [
+                    Job(
+                        title=' '.join(rng.choices(WORDS, k=3)),
+                        description=' '.join(rng.choices(WORDS, k=150)),
+                        company_name=' '.join(
+                            [*(rng.choice(WORDS).title() for _ in range(2)), 'Ltd']
+                        ),
+                        location='Remote',
+                        status='published',
+                        category=category,
+                        created_by=user,
+                    )
+                    for _ in range(count)
+                ],
+                batch_size=batch_size,
+            )
+            created += count
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Job._meta.db_table}')
+        self.stdout.write(
+            f'{size} jobs inserted in {time.perf_counter() - started:.1f}s'
+        )
+
+    def _index_lookups(self, size, query, repeat):
+        started = time.perf_counter()
+        index = get_index()
+        self.stdout.write(
+            f'size={size} inverted index ready in {time.perf_counter() - started:.1f}s'
+        )
+        terms = tokenize(query)
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for term in terms:
+                index.lookup(term)
+            index.search(query)
+            timings.append((time.perf_counter() - started) * 1000)
+        self.stdout.write(
+            f'size={size} backend=inverted query={query!r} in-process '
+            f'median={statistics.median(timings):.3f}ms'
+        )
+
+    def _run(self, size, backend, query, repeat):
+        if backend == 'inverted':
+            self._index_lookups(size, query, repeat)
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            queryset = search_jobs(query, backend=BACKENDS[backend])
+            list(queryset[:20])
+            queryset.count()
+            timings.append((time.perf_counter() - started) * 1000)
+        self.stdout.write(
+            f'size={size} backend={backend} query={query!r} '
+            f'median={statistics.median(timings):.1f}ms min={min(timings):.1f}ms'
+        )
@@ -0,0 +1,52 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from django_test_app.jobs.api.readers import ValuesReader
+from django_test_app.jobs.api.serializers import JobSerializer
+from django_test_app.jobs.management.benchmark import populate_jobs, rolled_back
+from django_test_app.jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare JobSerializer and ValuesReader list throughput (rows/second). '
+        'Generated rows are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', nargs='+', type=int, default=[1000, 10000])
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        for size in options['rows']:
+            with rolled_back():
+                self._compare(size, options['repeat'])
+
+    def _compare(self, size, repeat):
+        queryset = Job.objects.filter(category=populate_jobs(size)).select_related(
+            'category', 'created_by'
+        ).order_by('-created_at', '-id')
+        reader = ValuesReader.for_serializer(JobSerializer())
+        self._run(
+            size, 'serializer', lambda: JobSerializer(queryset, many=True).data, repeat
+        )
+        self._run(
+            size,
+            'values',
+            lambda: reader.represent_many(queryset.values(*reader.columns)),
+            repeat,
+        )
+
+    def _run(self, size, name, serialize, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            serialize()
+            timings.append(time.perf_counter() - started)
+        median = statistics.median(timings)
+        self.stdout.write(
+            f'rows={size} path={name} median={median * 1000:.1f}ms '
+            f'throughput={size / median:,.0f} rows/s'
+        )
@@ -0,0 +1,123 @@
+import statistics
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+from celery.contrib.testing.worker import start_worker
+from django.core.mail import EmailMessage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+
+from config.celery_app import app
+from django_test_app.jobs.models import OutboxEmail
+from django_test_app.jobs.outbox import enqueue
+from django_test_app.jobs.tasks import build_search_index_task
+
+
+# One worker for every queue, as before the queues were split, against the I/O and CPU
+# workers of production.
+SCENARIOS = {
+    'shared': [
+        {
+            'queues': ['email', 'default', 'analytics', 'exports', 'bulk'],
+            'concurrency': 2,
+        }
+    ],
+    'routed': [
+        {'queues': ['email', 'default'], 'concurrency': 4, 'prefetch_multiplier': 4},
+        {
+            'queues': ['analytics', 'exports', 'bulk'],
+            'concurrency': 2,
+            'prefetch_multiplier': 1,
+        },
+    ],
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure outbox email latency (queued to sent) while search index rebuilds '
+        'run, with one shared worker and with the routed I/O and CPU workers. Uses an '
+        'in-memory broker and embedded thread-pool workers; the benchmark emails are '
+        'deleted afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS)
+        )
+        parser.add_argument(
+            '--rebuilds',
+            type=int,
+            default=4,
+            help='Index rebuilds queued before the emails.',
+        )
+        parser.add_argument('--emails', type=int, default=30)
+        parser.add_argument(
+            '--interval', type=float, default=0.2, help='Seconds between emails.'
+        )
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as directory, override_settings(
+            CELERY_BROKER_URL='memory://',
+            CELERY_RESULT_BACKEND='cache+memory://',
+            CELERY_BROKER_TRANSPORT_OPTIONS={},
+            CELERY_TASK_ALWAYS_EAGER=False,
+            EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+            JOBS_SEARCH_INDEX_SNAPSHOT=str(Path(directory) / 'index.snapshot'),
+        ):
+            for scenario in options['scenarios']:
+                latencies = self._run(SCENARIOS[scenario], options)
+                self.stdout.write(
+                    f'{scenario}: emails={len(latencies)} '
+                    f'p50={statistics.median(latencies):.2f}s '
+                    f'p95={statistics.quantiles(latencies, n=20)[-1]:.2f}s '
+                    f'max={max(latencies):.2f}s'
+                )
+
+    def _run(self, workers, options):
+        email_ids = []
+        try:
+            with ExitStack() as stack:
+                for worker in workers:
+                    stack.enter_context(
+                        start_worker(
+                            app,
+                            pool='threads',
+                            perform_ping_check=False,
+                            shutdown_timeout=120,
+                            loglevel='WARNING',
+                            **worker,
+                        )
+                    )
+                for _ in range(options['rebuilds']):
+                    build_search_index_task.delay()
+                for n in range(options['emails']):
+                    with transaction.atomic():
+                        message = EmailMessage(
+                            f'Benchmark {n}',
+                            'Hello',
+                            'noreply@example.com',
+                            ['a@example.com'],
+                        )
+                        email_ids.extend(row.pk for row in enqueue([message]))
+                    time.sleep(options['interval'])
+                self._wait_until_sent(email_ids)
+            return [
+                (sent_at - created_at).total_seconds()
+                for created_at, sent_at in OutboxEmail.objects.filter(
+                    pk__in=email_ids, status='sent'
+                ).values_list('created_at', 'sent_at')
+            ]
+        finally:
+            OutboxEmail.objects.filter(pk__in=email_ids).delete()
+
+    def _wait_until_sent(self, email_ids, timeout=120):
+        deadline = time.monotonic() + timeout
+        while OutboxEmail.objects.filter(pk__in=email_ids, status='pending').exists():
+            if time.monotonic() > deadline:
+                self.stderr.write('Timed out waiting for the benchmark emails.')
+                return
+            time.sleep(0.1)
@@ -0,0 +1,27 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from django_test_app.jobs.search_index import build_index
+
+
+class Command(BaseCommand):
+    help = 'Build the in-process job search index and write it to a snapshot file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=settings.JOBS_SEARCH_INDEX_SNAPSHOT)
+
+    def handle(self, *args, **options):
+        if not options['output']:
+            msg = 'Pass --output or set JOBS_SEARCH_INDEX_SNAPSHOT.'
+            raise CommandError(msg)
+        started = time.perf_counter()
+        index = build_index()
+        index.save(options['output'])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Indexed {len(index)} jobs into {options["output"]} in {elapsed:.1f}s'
+            )
+        )
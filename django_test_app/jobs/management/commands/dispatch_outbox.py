@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from django_test_app.jobs.outbox import drain, outbox_metrics
+
+
+class Command(BaseCommand):
+    help = (
+        'Send queued outbox emails. Runs until interrupted unless --once is given; '
+        'start as many as needed, each claims different rows.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true', help='Drain the outbox once and exit.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Emails per batch (default: setting).',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait when nothing is due.',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.perf_counter()
+            sent, failed = drain(options['batch_size'])
+            elapsed = time.perf_counter() - started
+            if sent or failed or options['once']:
+                metrics = outbox_metrics()
+                self.stdout.write(
+                    f'Sent {sent}, failed {failed} in {elapsed:.2f}s '
+                    f'({sent / max(elapsed, 1e-6):.0f}/s); {metrics["due"]} due, '
+                    f'{metrics["pending"]} pending, {metrics["failed"]} failed'
+                )
+            if options['once']:
+                return
+            if not sent and not failed:
+                time.sleep(options['interval'])
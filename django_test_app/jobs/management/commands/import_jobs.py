@@ -0,0 +1,73 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_test_app.jobs.imports import IMPORT_METHODS, import_jobs, read_rows
+from django_test_app.users.models import User
+
+
+FORMATS = {'.csv': 'csv', '.ndjson': 'ndjson', '.jsonl': 'ndjson', '.json': 'json'}
+
+
+class Command(BaseCommand):
+    help = (
+        'Bulk import jobs from a CSV, NDJSON or JSON file. '
+        'Invalid rows are reported and skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to import, or "-" for stdin.')
+        parser.add_argument(
+            '--created-by',
+            required=True,
+            help='Email of the user who will own the jobs.',
+        )
+        parser.add_argument(
+            '--format',
+            choices=sorted(set(FORMATS.values())),
+            help='Defaults to the file extension.',
+        )
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--method', choices=IMPORT_METHODS, default='copy')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(email=options['created_by'])
+        except User.DoesNotExist as exc:
+            msg = f'No user with email {options["created_by"]}'
+            raise CommandError(msg) from exc
+        path = options['path']
+        file_format = options['format'] or FORMATS.get(Path(path).suffix.lower())
+        if file_format is None:
+            msg = 'Cannot infer the format from the file name; pass --format.'
+            raise CommandError(msg)
+
+        started = time.perf_counter()
+        with (
+            sys.stdin if path == '-' else Path(path).open(encoding='utf-8', newline='')
+        ) as stream:
+            try:
+                result = import_jobs(
+                    read_rows(stream, file_format),
+                    user,
+                    batch_size=options['batch_size'],
+                    method=options['method'],
+                )
+            except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                msg = f'Could not read {path}: {exc}'
+                raise CommandError(msg) from exc
+        elapsed = time.perf_counter() - started
+
+        for error in result.errors:
+            self.stderr.write(f'row {error["index"]}: {json.dumps(error["errors"])}')
+        total = result.created + len(result.errors)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Imported {result.created} of {total} jobs in {elapsed:.1f}s '
+                f'({total / elapsed if elapsed else total:,.0f} rows/s), '
+                f'{len(result.errors)} rejected'
+            )
+        )
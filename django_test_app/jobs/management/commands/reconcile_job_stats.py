@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from django_test_app.jobs.stats import reconcile_job_stats
+
+
+class Command(BaseCommand):
+    help = (
+        'Recompute the per-job application counters from the applications '
+        'and fix any drift.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'job_ids', nargs='*', type=int, help='Only these jobs (default: all).'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=10000, help='Jobs per statement.'
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        fixed = reconcile_job_stats(
+            options['job_ids'] or None, batch_size=options['batch_size']
+        )
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f'Corrected {fixed} job stats row(s) in {elapsed:.1f}s')
+        )
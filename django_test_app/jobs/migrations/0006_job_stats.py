@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_conditional_get_validators'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobStats',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='jobs.job')),
+                ('total', models.IntegerField(default=0)),
+                ('pending', models.IntegerField(default=0)),
+                ('reviewed', models.IntegerField(default=0)),
+                ('accepted', models.IntegerField(default=0)),
+                ('rejected', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'Job stats',
+            },
+        ),
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO jobs_jobstats (job_id, total, pending, reviewed, accepted, rejected)
+                SELECT job_id,
+                       COUNT(*),
+                       COUNT(*) FILTER (WHERE status = 'pending'),
+                       COUNT(*) FILTER (WHERE status = 'reviewed'),
+                       COUNT(*) FILTER (WHERE status = 'accepted'),
+                       COUNT(*) FILTER (WHERE status = 'rejected')
+                FROM jobs_jobapplication
+                GROUP BY job_id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
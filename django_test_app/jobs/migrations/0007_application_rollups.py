@@ -0,0 +1,51 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_job_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('position', models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DailyApplicationRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('company_name', models.CharField(max_length=100)),
+                ('applications', models.IntegerField(default=0)),
+                ('bucket', models.DateField()),
+                ('category', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='jobs.jobcategory')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['bucket'], name='jobs_dailya_bucket_fc8489_idx'), models.Index(fields=['category', 'bucket'], name='jobs_dailya_categor_07d7b3_idx'), models.Index(fields=['company_name', 'bucket'], name='jobs_dailya_company_d37329_idx')],
+                'constraints': [models.UniqueConstraint(fields=('job', 'bucket'), name='jobs_daily_rollup_job_bucket')],
+            },
+        ),
+        migrations.CreateModel(
+            name='HourlyApplicationRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('company_name', models.CharField(max_length=100)),
+                ('applications', models.IntegerField(default=0)),
+                ('bucket', models.DateTimeField()),
+                ('category', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='jobs.jobcategory')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['bucket'], name='jobs_hourly_bucket_23c5ee_idx'), models.Index(fields=['category', 'bucket'], name='jobs_hourly_categor_7c869c_idx'), models.Index(fields=['company_name', 'bucket'], name='jobs_hourly_company_1cf721_idx')],
+                'constraints': [models.UniqueConstraint(fields=('job', 'bucket'), name='jobs_hourly_rollup_job_bucket')],
+            },
+        ),
+    ]
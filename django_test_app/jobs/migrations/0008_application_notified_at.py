@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_application_rollups'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='notified_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        # Existing applications predate the notification queue and must not be emailed now.
+        migrations.RunSQL(
+            sql='UPDATE jobs_jobapplication SET notified_at = applied_at WHERE notified_at IS NULL',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(condition=models.Q(('notified_at__isnull', True)), fields=['applied_at'], name='jobs_app_notify_pending_idx'),
+        ),
+    ]
@@ -1,10 +1,15 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
+from django.utils import timezone
 
 
 class JobCategory(models.Model):
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         verbose_name_plural = "Job Categories"
@@ -33,12 +38,49 @@ class Job(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(null=True, blank=True)
+    # Picked up by jobs.scheduling: drafts go live at publish_at, open jobs close at
+    # expires_at.
+    publish_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='english') +
+            SearchVector('company_name', weight='B', config='english') +
+            SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
     
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['status', 'created_at', 'id']),
+            models.Index(fields=['status', 'updated_at']),
             models.Index(fields=['company_name']),
+            GinIndex(fields=['search_vector']),
+            # Upper() matches the expression Django emits for icontains, so the
+            # same trigram index serves infix and similarity lookups.
+            GinIndex(
+                OpClass(Upper('title'), name='gin_trgm_ops'), name='jobs_job_title_trgm'
+            ),
+            GinIndex(
+                OpClass(Upper('company_name'), name='gin_trgm_ops'),
+                name='jobs_job_company_trgm',
+            ),
+            # Only jobs still waiting for their scheduled change are indexed.
+            models.Index(
+                fields=['publish_at'],
+                condition=models.Q(status='draft', publish_at__isnull=False),
+                name='jobs_job_publish_due_idx',
+            ),
+            models.Index(
+                fields=['expires_at'],
+                condition=models.Q(
+                    status__in=['draft', 'published'], expires_at__isnull=False
+                ),
+                name='jobs_job_expiry_due_idx',
+            ),
         ]
     
     def __str__(self):
@@ -52,6 +94,7 @@ class JobApplication(models.Model):
         ('accepted', 'Accepted'),
         ('rejected', 'Rejected'),
     ]
+    REVIEW_STATUSES = ['reviewed', 'accepted', 'rejected']
     
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='applications')
     applicant = models.ForeignKey('users.User', on_delete=models.CASCADE, related_name='job_applications')
@@ -60,11 +103,147 @@ class JobApplication(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     applied_at = models.DateTimeField(auto_now_add=True)
     reviewed_at = models.DateTimeField(null=True, blank=True)
+    notified_at = models.DateTimeField(null=True, blank=True)
     
     class Meta:
         unique_together = [['job', 'applicant']]
         ordering = ['-applied_at']
+        indexes = [
+            models.Index(fields=['applicant', 'applied_at', 'id']),
+            models.Index(fields=['applied_at', 'id']),
+            # Applications whose employer has not been emailed yet.
+            models.Index(
+                fields=['applied_at'],
+                condition=models.Q(notified_at__isnull=True),
+                name='jobs_app_notify_pending_idx',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.applicant.email} applied for {self.job.title}"
 
+
+
+class JobStats(models.Model):
+    """Application counters per job, kept up to date by jobs.stats."""
+    
+    job = models.OneToOneField(
+        Job, on_delete=models.CASCADE, primary_key=True, related_name='stats'
+    )
+    total = models.IntegerField(default=0)
+    pending = models.IntegerField(default=0)
+    reviewed = models.IntegerField(default=0)
+    accepted = models.IntegerField(default=0)
+    rejected = models.IntegerField(default=0)
+    
+    class Meta:
+        verbose_name_plural = "Job stats"
+    
+    def __str__(self):
+        return f"Stats for job {self.job_id}"
+
+
+class ApplicationRollup(models.Model):
+    """Applications received per job and time bucket; filled by jobs.rollups."""
+    
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='+')
+    # Copied from the job when the bucket is written, for grouping without joins.
+    category = models.ForeignKey(
+        JobCategory, on_delete=models.SET_NULL, null=True, related_name='+'
+    )
+    company_name = models.CharField(max_length=100)
+    applications = models.IntegerField(default=0)
+    
+    class Meta:
+        abstract = True
+    
+    def __str__(self):
+        return (
+            f"{self.applications} applications for job {self.job_id} at {self.bucket}"
+        )
+
+
+class HourlyApplicationRollup(ApplicationRollup):
+    bucket = models.DateTimeField()
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['job', 'bucket'], name='jobs_hourly_rollup_job_bucket'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['bucket']),
+            models.Index(fields=['category', 'bucket']),
+            models.Index(fields=['company_name', 'bucket']),
+        ]
+
+
+class DailyApplicationRollup(ApplicationRollup):
+    bucket = models.DateField()
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['job', 'bucket'], name='jobs_daily_rollup_job_bucket'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['bucket']),
+            models.Index(fields=['category', 'bucket']),
+            models.Index(fields=['company_name', 'bucket']),
+        ]
+
+
+class RollupWatermark(models.Model):
+    """Rows up to ``position`` have been added to the rollups named ``name``."""
+    
+    name = models.CharField(max_length=50, primary_key=True)
+    position = models.DateTimeField()
+    
+    def __str__(self):
+        return f"{self.name} up to {self.position}"
+
+
+class OutboxEmail(models.Model):
+    """
+    An email written in the same transaction as the change it reports.
+    
+    Sent by jobs.outbox.
+    """
+    
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+    
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    recipients = models.JSONField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # Not sent before this time; pushed back after every failed attempt.
+    available_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['available_at', 'id'],
+                condition=models.Q(status='pending'),
+                name='jobs_outbox_due_idx',
+            ),
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(status='failed'),
+                name='jobs_outbox_failed_idx',
+            ),
+            models.Index(fields=['sent_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.subject} to {', '.join(self.recipients)}"
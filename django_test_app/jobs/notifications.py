@@ -0,0 +1,123 @@
+"""
+Employer notification emails for new job applications.
+
+queue_application_notification() runs in the transaction that creates the
+application. By default it writes the email to the outbox (jobs.outbox)
+straight away, so it is sent if and only if the application commits. With
+``JOBS_NOTIFICATION_DIGEST_WINDOW`` set, applications are collected for that
+many seconds instead: the first application of a burst schedules
+send_digests_task with coalesce(), and later ones are merged into that run,
+which writes one email per employer that lists all of their new applications.
+
+Applications get ``notified_at`` in the same transaction as their outbox rows,
+so a repeated run skips them. Rows locked by a concurrent run are skipped too.
+If scheduling a digest fails, the application stays pending and the next digest
+includes it.
+"""
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.db import transaction
+from django.utils import timezone
+
+from .models import JobApplication
+from .outbox import enqueue
+
+
+def _from_email():
+    return getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@example.com')
+
+
+def application_message(application):
+    job = application.job
+    return EmailMessage(
+        subject=f'New application for {job.title}',
+        body=(
+            f'You have received a new application from {application.applicant.email} '
+            f'for the position {job.title}.'
+        ),
+        from_email=_from_email(),
+        to=[job.created_by.email],
+    )
+
+
+def digest_message(recipient, applications):
+    if len(applications) == 1:
+        return application_message(applications[0])
+    lines = [
+        f'- {application.applicant.email} applied for {application.job.title}'
+        for application in applications
+    ]
+    return EmailMessage(
+        subject=f'{len(applications)} new applications for your jobs',
+        body='You have received new applications:\n\n' + '\n'.join(lines),
+        from_email=_from_email(),
+        to=[recipient],
+    )
+
+
+def _pending(queryset, limit=None):
+    queryset = queryset.filter(notified_at__isnull=True).select_related(
+        'job__created_by', 'applicant'
+    )
+    queryset = queryset.select_for_update(skip_locked=True, of=('self',)).order_by(
+        'applied_at', 'pk'
+    )
+    return list(queryset if limit is None else queryset[:limit])
+
+
+def _enqueue(applications, messages):
+    enqueue(messages)
+    JobApplication.objects.filter(
+        pk__in=[application.pk for application in applications]
+    ).update(notified_at=timezone.now())
+
+
+def send_notifications(application_ids):
+    """
+    Queue an email to the employer of each application not notified yet.
+
+    Returns the number of emails.
+    """
+    with transaction.atomic():
+        applications = _pending(JobApplication.objects.filter(pk__in=application_ids))
+        if not applications:
+            return 0
+        messages = [application_message(application) for application in applications]
+        _enqueue(applications, messages)
+    return len(messages)
+
+
+def send_digests(batch_size=1000):
+    """
+    Queue one digest email per employer of their pending applications.
+
+    Handles at most ``batch_size`` applications and returns how many it handled.
+    """
+    with transaction.atomic():
+        applications = _pending(JobApplication.objects.all(), limit=batch_size)
+        if not applications:
+            return 0
+        by_employer = defaultdict(list)
+        for application in applications:
+            by_employer[application.job.created_by.email].append(application)
+        _enqueue(
+            applications,
+            [digest_message(email, grouped) for email, grouped in by_employer.items()],
+        )
+    return len(applications)
+
+
+def queue_application_notification(application_id):
+    window = getattr(settings, 'JOBS_NOTIFICATION_DIGEST_WINDOW', 0)
+    if not window:
+        send_notifications([application_id])
+        return
+
+    def schedule_digest():
+        from .tasks import send_digests_task  # noqa: PLC0415
+
+        send_digests_task.coalesce()
+
+    transaction.on_commit(schedule_digest, robust=True)
@@ -0,0 +1,197 @@
+"""
+Transactional outbox for outgoing email.
+
+enqueue() writes messages to OutboxEmail in the caller's transaction, so an
+email exists exactly when the change that caused it commits: a request that
+rolls back leaves nothing to send, and a broker outage loses nothing. After the
+commit, a dispatch_outbox_task is requested as a best-effort nudge for low
+latency. Celery beat also runs it every minute to pick up whatever the nudges
+missed.
+
+dispatch() claims up to ``JOBS_OUTBOX_BATCH_SIZE`` due rows with SELECT ...
+FOR UPDATE SKIP LOCKED, sends them over one mail connection and records the
+outcome before committing. Any number of dispatchers can run side by side, as
+Celery workers or ``manage.py dispatch_outbox`` processes, and each one claims
+different rows. Delivery is at least once: a dispatcher that dies between
+sending and committing leaves its rows to be sent again.
+
+A failed email is retried with exponential backoff and jitter. After
+``JOBS_OUTBOX_MAX_ATTEMPTS`` attempts it is marked failed. A message that
+cannot be built, such as a subject containing a newline, fails on its own
+without holding up the rest of its batch.
+"""
+import datetime
+import random
+import smtplib
+import time
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+
+from .models import OutboxEmail
+
+
+RETRY_DELAY = 30
+RETRY_DELAY_MAX = 3600
+
+
+def enqueue(messages):
+    """Add EmailMessages to the outbox in the current transaction; returns the rows."""
+    rows = OutboxEmail.objects.bulk_create(
+        [
+            OutboxEmail(
+                subject=message.subject,
+                body=message.body,
+                from_email=message.from_email,
+                recipients=message.to,
+            )
+            for message in messages
+        ]
+    )
+    if rows:
+        # Robust: with the broker down, the commit still stands and beat sends the rows
+        # later.
+        transaction.on_commit(_nudge, robust=True)
+    return rows
+
+
+def _nudge():
+    from .tasks import dispatch_outbox_task  # noqa: PLC0415
+
+    dispatch_outbox_task.delay()
+
+
+def _message(row):
+    return EmailMessage(
+        subject=row.subject, body=row.body, from_email=row.from_email, to=row.recipients
+    )
+
+
+def _retry_at(now, attempts):
+    delay = min(RETRY_DELAY * 2 ** (attempts - 1), RETRY_DELAY_MAX)
+    return now + datetime.timedelta(seconds=random.uniform(delay / 2, delay))  # noqa: S311
+
+
+def dispatch(batch_size=None):
+    """Send one batch of due emails; returns ``(sent, failed)``."""
+    batch_size = batch_size or getattr(settings, 'JOBS_OUTBOX_BATCH_SIZE', 100)
+    interrupted = None
+    with transaction.atomic():
+        rows = list(
+            OutboxEmail.objects.filter(
+                status='pending', available_at__lte=timezone.now()
+            )
+            .order_by('available_at', 'id')
+            .select_for_update(skip_locked=True)[:batch_size]
+        )
+        if not rows:
+            return 0, 0
+        sent, failed = [], []
+        connection = get_connection(fail_silently=False)
+        try:
+            for row in rows:
+                try:
+                    # Opens the connection on the first row only; send_messages() would
+                    # reconnect per call.
+                    connection.open()
+                    connection.send_messages([_message(row)])
+                except (
+                    smtplib.SMTPRecipientsRefused,
+                    smtplib.SMTPResponseException,
+                ) as exc:
+                    # The server refused this message; carry on with the rest.
+                    failed.append((row, exc))
+                except OSError as exc:
+                    # The connection is gone. Unsent rows are released untouched.
+                    failed.append((row, exc))
+                    break
+                except (TypeError, ValueError) as exc:
+                    # The message cannot be built, e.g. BadHeaderError for a subject
+                    # with a newline.
+                    failed.append((row, exc))
+                except Exception as exc:
+                    failed.append((row, exc))
+                    raise
+                else:
+                    sent.append(row)
+        except BaseException as exc:  # noqa: BLE001
+            # Record what was sent before re-raising, or the whole batch would be sent
+            # again.
+            interrupted = exc
+        finally:
+            connection.close()
+        _record(sent, failed)
+    if interrupted is not None:
+        raise interrupted
+    return len(sent), len(failed)
+
+
+def _record(sent, failed):
+    now = timezone.now()
+    if sent:
+        OutboxEmail.objects.filter(pk__in=[row.pk for row in sent]).update(
+            status='sent', sent_at=now, attempts=F('attempts') + 1
+        )
+    max_attempts = getattr(settings, 'JOBS_OUTBOX_MAX_ATTEMPTS', 8)
+    for row, exc in failed:
+        row.attempts += 1
+        row.last_error = repr(exc)
+        if row.attempts >= max_attempts:
+            row.status = 'failed'
+        else:
+            row.available_at = _retry_at(now, row.attempts)
+    OutboxEmail.objects.bulk_update(
+        [row for row, _exc in failed],
+        ['attempts', 'last_error', 'status', 'available_at'],
+    )
+
+
+def drain(batch_size=None, max_seconds=None):
+    """
+    Dispatch batches until one comes back short; returns ``(sent, failed)``.
+
+    Stops early after ``max_seconds``. A batch cut short by a lost connection
+    also ends the run, so an unreachable mail server is not hammered.
+    """
+    batch_size = batch_size or getattr(settings, 'JOBS_OUTBOX_BATCH_SIZE', 100)
+    started = time.monotonic()
+    sent = failed = 0
+    while True:
+        batch_sent, batch_failed = dispatch(batch_size)
+        sent += batch_sent
+        failed += batch_failed
+        if batch_sent + batch_failed < batch_size:
+            return sent, failed
+        if max_seconds is not None and time.monotonic() - started >= max_seconds:
+            return sent, failed
+
+
+def outbox_metrics(window=300):
+    """
+    Queue depth and throughput of the outbox.
+
+    ``sent_per_minute`` averages the last ``window`` seconds, and
+    ``oldest_due_seconds`` is how long the oldest due email has been waiting.
+    """
+    now = timezone.now()
+    queue = OutboxEmail.objects.filter(status='pending').aggregate(
+        pending=Count('pk'),
+        due=Count('pk', filter=Q(available_at__lte=now)),
+        retrying=Count('pk', filter=Q(attempts__gt=0)),
+        oldest_due=Min('available_at', filter=Q(available_at__lte=now)),
+    )
+    oldest_due = queue.pop('oldest_due')
+    sent = OutboxEmail.objects.filter(
+        sent_at__gt=now - datetime.timedelta(seconds=window)
+    ).count()
+    return {
+        **queue,
+        'failed': OutboxEmail.objects.filter(status='failed').count(),
+        'oldest_due_seconds': (now - oldest_due).total_seconds() if oldest_due else 0,
+        'sent_last_window': sent,
+        'sent_per_minute': round(sent * 60 / window, 2),
+        'window_seconds': window,
+    }
@@ -0,0 +1,336 @@
+"""
+Keyset (cursor) pagination for job and application listings.
+
+Pages are selected with a ``WHERE (ordering columns) < (last row values)``
+condition instead of OFFSET, and no COUNT(*) is issued, so every page costs
+the same as the first one when a matching index exists.
+
+For "about N results" displays, estimate_count() uses the planner's row
+estimate for large result sets and an exact COUNT(*) for small ones.
+"""
+import base64
+import binascii
+import datetime
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import cached_property, partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import Http404
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class InvalidCursor(ValueError):  # noqa: N818
+    pass
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # DjangoJSONEncoder truncates to milliseconds; keys must round-trip exactly.
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(values, *, reverse=False):
+    payload = json.dumps(
+        {'v': values, 'r': reverse}, cls=CursorEncoder, separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        payload = json.loads(
+            base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        )
+        return list(payload['v']), bool(payload['r'])
+    except (binascii.Error, ValueError, TypeError, KeyError) as exc:
+        raise InvalidCursor(cursor) from exc
+
+
+def keyset_ordering(queryset):
+    """
+    Return the queryset ordering as ``[(field, descending), ...]``.
+
+    The primary key is appended as a tie-breaker so that the key is unique.
+    """
+    ordering = queryset.query.order_by or (
+        queryset.query.default_ordering and queryset.model._meta.ordering
+    )
+    if not ordering:
+        msg = 'Keyset pagination requires an ordered queryset.'
+        raise ValueError(msg)
+    keys = []
+    for name in ordering:
+        if not isinstance(name, str):
+            msg = f'Keyset pagination only supports field ordering, got {name!r}.'
+            raise TypeError(msg)
+        keys.append((name.lstrip('-'), name.startswith('-')))
+    pk_name = queryset.model._meta.pk.name
+    if not any(name in (pk_name, 'pk') for name, _descending in keys):
+        keys.append((pk_name, keys[-1][1]))
+    return keys
+
+
+def _after(keys, values):
+    """Build ``(k1, k2, ...) > (v1, v2, ...)`` respecting each key's direction."""
+    condition = Q()
+    equal = {}
+    for (name, descending), value in zip(keys, values, strict=True):
+        condition |= Q(**equal, **{f'{name}__{"lt" if descending else "gt"}': value})
+        equal[name] = value
+    first_name, first_descending = keys[0]
+    # Redundant bound on the leading column so it can be used as an index condition.
+    return (
+        Q(**{f'{first_name}__{"lte" if first_descending else "gte"}': values[0]})
+        & condition
+    )
+
+
+def planner_estimate(queryset):
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def estimate_count(queryset):
+    """
+    Count ``queryset`` exactly while it is small, approximately once it is large.
+
+    Below ``JOBS_EXACT_COUNT_THRESHOLD`` estimated rows a real COUNT(*) is run.
+    Above it, the exact count is cached for ``JOBS_COUNT_CACHE_TIMEOUT`` seconds
+    when that setting is enabled, otherwise the planner estimate is returned.
+    """
+    estimate = planner_estimate(queryset)
+    if estimate < getattr(settings, 'JOBS_EXACT_COUNT_THRESHOLD', 10000):
+        return queryset.count()
+    timeout = getattr(settings, 'JOBS_COUNT_CACHE_TIMEOUT', 0)
+    if not timeout:
+        return estimate
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.md5(f'{sql}|{params}'.encode(), usedforsecurity=False).hexdigest()
+    return cache.get_or_set(f'jobs:count:{digest}', queryset.count, timeout)
+
+
+class EstimatedCountPaginator(Paginator):
+    """Offset paginator whose total comes from estimate_count()."""
+
+    @cached_property
+    def count(self):
+        if hasattr(self.object_list, 'query'):
+            return estimate_count(self.object_list)
+        return len(self.object_list)
+
+
+@dataclass
+class KeysetPage:
+    object_list: list
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+def _keyset_query(queryset, cursor, per_page):
+    """
+    Return ``(page queryset, keys, cursor values, reverse)``.
+
+    The queryset fetches one extra row.
+    """
+    keys = keyset_ordering(queryset)
+    values, reverse = decode_cursor(cursor) if cursor else (None, False)
+    if values is not None and len(values) != len(keys):
+        raise InvalidCursor(cursor)
+
+    walk_keys = [(name, descending != reverse) for name, descending in keys]
+    queryset = queryset.order_by(
+        *[f'{"-" if descending else ""}{name}' for name, descending in walk_keys]
+    )
+    if values is not None:
+        try:
+            queryset = queryset.filter(_after(walk_keys, values))
+        except (DjangoValidationError, TypeError, ValueError) as exc:
+            # Well-formed cursor whose values do not fit the ordering columns.
+            raise InvalidCursor(cursor) from exc
+    return queryset[:per_page + 1], keys, values, reverse
+
+
+def paginate_keyset(queryset, cursor=None, per_page=20):
+    queryset, keys, values, reverse = _keyset_query(queryset, cursor, per_page)
+    return _keyset_page(list(queryset), keys, values, reverse, per_page)
+
+
+async def apaginate_keyset(queryset, cursor=None, per_page=20):
+    """paginate_keyset() for async views, fetching the page with the async ORM."""
+    queryset, keys, values, reverse = _keyset_query(queryset, cursor, per_page)
+    return _keyset_page(
+        [row async for row in queryset], keys, values, reverse, per_page
+    )
+
+
+def _keyset_page(rows, keys, values, reverse, per_page):
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if reverse:
+        rows.reverse()
+    if not rows:
+        return KeysetPage([])
+
+    def key_of(row):
+        if isinstance(row, dict):
+            return [row[name] for name, _descending in keys]
+        return [getattr(row, name) for name, _descending in keys]
+
+    next_cursor = previous_cursor = None
+    if has_more or reverse:
+        next_cursor = encode_cursor(key_of(rows[-1]))
+    if values is not None and (has_more or not reverse):
+        previous_cursor = encode_cursor(key_of(rows[0]), reverse=True)
+    return KeysetPage(rows, next_cursor=next_cursor, previous_cursor=previous_cursor)
+
+
+class KeysetPaginationMixin:
+    """ListView mixin replacing Paginator/OFFSET with ``?cursor=`` keyset paging."""
+
+    cursor_kwarg = 'cursor'
+
+    def paginate_queryset(self, queryset, page_size):
+        try:
+            page = paginate_keyset(
+                queryset, self.request.GET.get(self.cursor_kwarg), page_size
+            )
+        except InvalidCursor as exc:
+            msg = 'Invalid cursor'
+            raise Http404(msg) from exc
+        return None, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # Templates call this lazily, so pages that do not show a total never count.
+        context['result_count'] = partial(estimate_count, self.object_list)
+        return context
+
+
+class AsyncKeysetPaginationMixin(KeysetPaginationMixin):
+    """
+    Async ``aget()`` for a keyset-paginated ListView, alongside the sync ``get()``.
+
+    The page is fetched with the async ORM before the context is built;
+    ``aget_queryset()`` may be overridden when building the queryset needs I/O.
+    """
+
+    keyset_page = None
+
+    async def aget_queryset(self):
+        return self.get_queryset()
+
+    async def aget(self, request, *args, **kwargs):
+        self.object_list = await self.aget_queryset()
+        try:
+            self.keyset_page = await apaginate_keyset(
+                self.object_list,
+                request.GET.get(self.cursor_kwarg),
+                self.get_paginate_by(self.object_list),
+            )
+        except InvalidCursor as exc:
+            msg = 'Invalid cursor'
+            raise Http404(msg) from exc
+        return self.render_to_response(self.get_context_data())
+
+    def paginate_queryset(self, queryset, page_size):
+        page = self.keyset_page
+        if page is None:
+            return super().paginate_queryset(queryset, page_size)
+        return None, page, page.object_list, page.has_other_pages()
+
+
+class KeysetPagination(BasePagination):
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        try:
+            self.page = paginate_keyset(
+                queryset,
+                request.query_params.get(self.cursor_query_param),
+                self.get_page_size(request),
+            )
+        except InvalidCursor as exc:
+            msg = 'Invalid cursor'
+            raise NotFound(msg) from exc
+        return self.page.object_list
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        try:
+            self.page = await apaginate_keyset(
+                queryset,
+                request.query_params.get(self.cursor_query_param),
+                self.get_page_size(request),
+            )
+        except InvalidCursor as exc:
+            msg = 'Invalid cursor'
+            raise NotFound(msg) from exc
+        return self.page.object_list
+
+    def _link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        return self._link(self.page.next_cursor)
+
+    def get_previous_link(self):
+        return self._link(self.page.previous_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,90 @@
+"""
+Scheduled publishing and expiry of jobs.
+
+run_job_schedule() publishes drafts whose ``publish_at`` has passed and closes
+draft or published jobs whose ``expires_at`` has passed. A draft that expires
+before it is published is closed without going live. Celery beat runs it every
+minute (``CELERY_BEAT_SCHEDULE``).
+
+Each step is a set-based UPDATE ... RETURNING over at most
+``JOBS_SCHEDULE_CHUNK_SIZE`` rows, committed on its own, so locks stay short
+however many jobs fall due at once. Rows locked by a concurrent edit are
+skipped and left for the next run. Once a chunk commits, the cache entries of
+its jobs are invalidated with a single set_many and the process search index
+is updated (services.jobs_status_changed). The UPDATEs bypass Job signals.
+"""
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Job
+from .services import jobs_status_changed
+
+
+# Each WHERE clause matches the condition of its partial index on Job.
+PUBLISH_DUE = (
+    "status = 'draft' AND publish_at <= %(now)s"
+    " AND (expires_at IS NULL OR expires_at > %(now)s)"
+)
+EXPIRY_DUE = "status IN ('draft', 'published') AND expires_at <= %(now)s"
+
+
+def _update_due(where, new_status, assignments, now, chunk_size):
+    """
+    Move the rows matching ``where`` to ``new_status``, one committed chunk at a time.
+
+    Returns their ids.
+    """
+    table = Job._meta.db_table
+    params = {'now': now, 'status': new_status, 'chunk_size': chunk_size}
+    job_ids = []
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH due AS (
+                    SELECT id FROM {table}
+                    WHERE {where}
+                    LIMIT %(chunk_size)s
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE {table} AS j
+                SET status = %(status)s, updated_at = %(now)s{assignments}
+                FROM due WHERE j.id = due.id
+                RETURNING j.id
+                """,  # noqa: S608
+                params,
+            )
+            chunk = [row[0] for row in cursor.fetchall()]
+            jobs_status_changed(chunk, new_status)
+        job_ids.extend(chunk)
+        if len(chunk) < chunk_size:
+            return job_ids
+
+
+def publish_due_jobs(now=None, chunk_size=None):
+    """Publish drafts whose ``publish_at`` has passed; returns their ids."""
+    now = now or timezone.now()
+    chunk_size = chunk_size or getattr(settings, 'JOBS_SCHEDULE_CHUNK_SIZE', 1000)
+    return _update_due(
+        PUBLISH_DUE, 'published', ', published_at = %(now)s', now, chunk_size
+    )
+
+
+def close_expired_jobs(now=None, chunk_size=None):
+    """Close draft and published jobs past their ``expires_at``; returns their ids."""
+    now = now or timezone.now()
+    chunk_size = chunk_size or getattr(settings, 'JOBS_SCHEDULE_CHUNK_SIZE', 1000)
+    return _update_due(EXPIRY_DUE, 'closed', '', now, chunk_size)
+
+
+def run_job_schedule(now=None):
+    """
+    Apply every scheduled change that is due.
+
+    Returns ``{'published': n, 'closed': n}``.
+    """
+    now = now or timezone.now()
+    closed = close_expired_jobs(now)
+    published = publish_due_jobs(now)
+    return {'published': len(published), 'closed': len(closed)}
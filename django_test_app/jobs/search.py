@@ -0,0 +1,170 @@
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import (
+    BigIntegerField,
+    F,
+    FloatField,
+    Func,
+    IntegerField,
+    Q,
+    Value,
+)
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast, Coalesce, Greatest, Upper
+from django.utils.module_loading import import_string
+
+from .search_index import get_index
+
+
+DEFAULT_SEARCH_BACKEND = 'django_test_app.jobs.search.FullTextSearchBackend'
+
+
+def trigram_threshold():
+    return getattr(settings, 'JOBS_SEARCH_TRIGRAM_THRESHOLD', 0.3)
+
+
+def set_trigram_threshold(connection):
+    """Set ``pg_trgm.word_similarity_threshold`` for the session of ``connection``."""
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('pg_trgm.word_similarity_threshold', %s, false)",
+            [str(trigram_threshold())],
+        )
+
+
+class ContainsSearchBackend:
+    """Case-insensitive substring match over title, description and company."""
+
+    def search(self, queryset, query):
+        return queryset.filter(
+            Q(title__icontains=query) |
+            Q(description__icontains=query) |
+            Q(company_name__icontains=query)
+        )
+
+
+class FullTextSearchBackend:
+    """
+    Postgres full-text search against the stored ``Job.search_vector`` column.
+
+    Title matches outrank company matches, which outrank description matches.
+    """
+
+    config = 'english'
+    search_type = 'websearch'
+
+    def search(self, queryset, query):
+        search_query = SearchQuery(
+            query, config=self.config, search_type=self.search_type
+        )
+        return (
+            queryset.filter(search_vector=search_query)
+            .annotate(
+                # float8 round-trips exactly through keyset pagination cursors, real
+                # does not.
+                rank=Cast(SearchRank(F('search_vector'), search_query), FloatField())
+            )
+            .order_by('-rank', '-created_at')
+        )
+
+
+class TrigramSearchBackend:
+    """
+    Typo-tolerant matching on title and company name using pg_trgm.
+
+    Both the ``%>`` word-similarity operator and icontains run against
+    ``UPPER(column)``, which is what the trigram GIN indexes are built on.
+    The operator's threshold is set once per database session, see
+    set_trigram_threshold().
+    """
+
+    fields = ['title', 'company_name']
+
+    @property
+    def threshold(self):
+        return trigram_threshold()
+
+    def _match(self, queryset, query):
+        condition = Q()
+        for field in self.fields:
+            condition |= Q(**{f'{field}_upper__trigram_word_similar': query})
+            condition |= Q(**{f'{field}_upper__contains': query.upper()})
+        return queryset.annotate(
+            **{f'{field}_upper': Upper(field) for field in self.fields}
+        ).filter(condition)
+
+    def search(self, queryset, query):
+        return (
+            self._match(queryset, query)
+            .annotate(
+                similarity=Cast(
+                    Greatest(
+                        *[TrigramWordSimilarity(query, field) for field in self.fields]
+                    ),
+                    FloatField(),
+                )
+            )
+            .order_by('-similarity', '-created_at')
+        )
+
+    def suggest(self, queryset, query, limit=5):
+        """Return distinct titles and company names closest to ``query``."""
+        candidates = []
+        matches = self._match(queryset, query)
+        for field in self.fields:
+            candidates.extend(
+                matches.annotate(similarity=TrigramWordSimilarity(query, field))
+                .filter(similarity__gte=self.threshold)
+                .order_by('-similarity')
+                .values_list(field, 'similarity')
+                .distinct()[:limit]
+            )
+        suggestions = []
+        for value, _similarity in sorted(
+            candidates, key=lambda candidate: -candidate[1]
+        ):
+            if value.lower() != query.lower() and value not in suggestions:
+                suggestions.append(value)
+        return suggestions[:limit]
+
+
+class InvertedIndexSearchBackend:
+    """
+    Pure-Python search over the process-local inverted index of published jobs.
+
+    Every query term must match. The best ``rank_limit`` hits are ordered by
+    index score, the remainder by recency.
+    """
+
+    rank_limit = 100
+
+    def search(self, queryset, query):
+        ids = get_index().search(query)
+        # Each id list is bound as one array parameter, however many jobs match.
+        rank = Func(
+            Value(ids[:self.rank_limit], output_field=ArrayField(BigIntegerField())),
+            F('pk'),
+            function='array_position',
+            output_field=IntegerField(),
+        )
+        return (
+            queryset.filter(pk__in=RawSQL('SELECT unnest(%s::bigint[])', (ids,)))
+            .annotate(
+                rank=Coalesce(rank, self.rank_limit + 1),
+            )
+            .order_by('rank', '-created_at')
+        )
+
+
+def get_search_backend(path=None):
+    backend_class = import_string(
+        path or getattr(settings, 'JOBS_SEARCH_BACKEND', DEFAULT_SEARCH_BACKEND)
+    )
+    return backend_class()
@@ -0,0 +1,312 @@
+"""
+In-process inverted index over published jobs.
+
+Postings are kept per term as two parallel arrays: sorted job ids (``q``) and
+field weights (``H``), so a term lookup is a dict hit plus a contiguous scan.
+"""
+import json
+import re
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import Job
+
+
+SNAPSHOT_MAGIC = b'JOBIDX1\n'
+
+FIELD_WEIGHTS = {
+    'title': 4,
+    'company_name': 2,
+    'description': 1,
+}
+
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in',
+    'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'to', 'was', 'we', 'were',
+    'will', 'with', 'you', 'your',
+})
+
+# Stems are kept at least this long.
+MIN_STEM_LENGTH = 3
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+SUFFIXES = (
+    'ational', 'ization', 'fulness', 'ousness', 'iveness', 'ement', 'ments', 'ment',
+    'ness', 'ings', 'ing', 'ers', 'er', 'ies', 'ied', 'ed', 'ly', 'es', 's',
+)
+
+
+def _strip_suffix(word):
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            return word[:-len(suffix)] + ('y' if suffix in ('ies', 'ied') else '')
+    return word
+
+
+def stem(word):
+    """
+    Light suffix-stripping stemmer; keeps stems at least three letters long.
+
+    Two passes let "engineering", "engineers" and "engineer" share a stem.
+    """
+    if len(word) <= MIN_STEM_LENGTH or word.isdigit() or word.endswith('ss'):
+        return word
+    word = _strip_suffix(_strip_suffix(word))
+    if len(word) > MIN_STEM_LENGTH and word.endswith('e'):
+        word = word[:-1]
+    if (
+        len(word) > MIN_STEM_LENGTH
+        and word[-1] == word[-2]
+        and word[-1] not in 'aeiouls'
+    ):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text):
+    return [
+        stem(token)
+        for token in TOKEN_RE.findall((text or '').lower())
+        if token not in STOP_WORDS
+    ]
+
+
+class InvertedIndex:
+    def __init__(self):
+        self._postings = {}
+        self._doc_terms = {}
+        self._lock = threading.Lock()
+        self.built_at = None
+
+    def __len__(self):
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._doc_terms
+
+    def doc_ids(self):
+        return set(self._doc_terms)
+
+    @staticmethod
+    def _term_weights(fields):
+        weights = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(fields.get(field)):
+                weights[term] = weights.get(term, 0) + weight
+        return weights
+
+    def _insert(self, doc_id, weights):
+        for term, weight in weights.items():
+            ids, term_weights = self._postings.setdefault(
+                term, (array('q'), array('H'))
+            )
+            position = bisect_left(ids, doc_id)
+            ids.insert(position, doc_id)
+            term_weights.insert(position, min(weight, 0xFFFF))
+        self._doc_terms[doc_id] = tuple(weights)
+
+    def _delete(self, doc_id):
+        for term in self._doc_terms.pop(doc_id, ()):
+            ids, term_weights = self._postings[term]
+            position = bisect_left(ids, doc_id)
+            if position < len(ids) and ids[position] == doc_id:
+                del ids[position]
+                del term_weights[position]
+            if not ids:
+                del self._postings[term]
+
+    def add(self, doc_id, fields):
+        weights = self._term_weights(fields)
+        with self._lock:
+            self._delete(doc_id)
+            self._insert(doc_id, weights)
+
+    def remove(self, doc_id):
+        with self._lock:
+            self._delete(doc_id)
+
+    def build(self, rows, built_at=None):
+        """
+        Replace the index contents with ``rows`` of ``(id, fields)`` pairs.
+
+        ``built_at`` should be taken before the rows are read: load_index()
+        re-reads jobs updated since then.
+        """
+        postings = {}
+        doc_terms = {}
+        for doc_id, fields in sorted(rows, key=lambda row: row[0]):
+            weights = self._term_weights(fields)
+            for term, weight in weights.items():
+                ids, term_weights = postings.setdefault(term, (array('q'), array('H')))
+                ids.append(doc_id)
+                term_weights.append(min(weight, 0xFFFF))
+            doc_terms[doc_id] = tuple(weights)
+        with self._lock:
+            self._postings = postings
+            self._doc_terms = doc_terms
+            self.built_at = built_at or timezone.now()
+
+    def lookup(self, term):
+        """Return the posting list ``(ids, weights)`` for an already stemmed term."""
+        return self._postings.get(term, (array('q'), array('H')))
+
+    def search(self, query):
+        """Return ids of documents containing every query term, best matches first."""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        postings = sorted(
+            (self.lookup(term) for term in terms), key=lambda posting: len(posting[0])
+        )
+        ids, weights = postings[0]
+        scores = dict(zip(ids, weights, strict=True))
+        for ids, weights in postings[1:]:
+            if not scores:
+                break
+            scores = {
+                doc_id: scores[doc_id] + weight
+                for doc_id, weight in zip(ids, weights, strict=True)
+                if doc_id in scores
+            }
+        return sorted(scores, key=lambda doc_id: (-scores[doc_id], -doc_id))
+
+    def save(self, path):
+        with self._lock:
+            terms = sorted(self._postings)
+            header = json.dumps({
+                'byteorder': sys.byteorder,
+                'built_at': self.built_at.isoformat() if self.built_at else None,
+                'terms': terms,
+                'lengths': [len(self._postings[term][0]) for term in terms],
+            }).encode()
+            ids = array('q')
+            weights = array('H')
+            for term in terms:
+                ids.extend(self._postings[term][0])
+                weights.extend(self._postings[term][1])
+        with Path(path).open('wb') as snapshot:
+            snapshot.write(SNAPSHOT_MAGIC)
+            snapshot.write(struct.pack('<Q', len(header)))
+            snapshot.write(header)
+            ids.tofile(snapshot)
+            weights.tofile(snapshot)
+
+    @classmethod
+    def load(cls, path):
+        with Path(path).open('rb') as snapshot:
+            if snapshot.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                msg = f'{path} is not a job search index snapshot'
+                raise ValueError(msg)
+            (header_length,) = struct.unpack('<Q', snapshot.read(8))
+            header = json.loads(snapshot.read(header_length))
+            total = sum(header['lengths'])
+            ids = array('q')
+            ids.fromfile(snapshot, total)
+            weights = array('H')
+            weights.fromfile(snapshot, total)
+        if header['byteorder'] != sys.byteorder:
+            ids.byteswap()
+            weights.byteswap()
+
+        index = cls()
+        doc_terms = {}
+        offset = 0
+        for term, length in zip(header['terms'], header['lengths'], strict=True):
+            index._postings[term] = (
+                ids[offset:offset + length],
+                weights[offset:offset + length],
+            )
+            for doc_id in index._postings[term][0]:
+                doc_terms.setdefault(doc_id, []).append(term)
+            offset += length
+        index._doc_terms = {doc_id: tuple(terms) for doc_id, terms in doc_terms.items()}
+        if header['built_at']:
+            index.built_at = datetime.fromisoformat(header['built_at'])
+        return index
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def _indexed_rows(queryset):
+    for row in queryset.values('id', *FIELD_WEIGHTS).iterator(chunk_size=2000):
+        yield row['id'], row
+
+
+def _published_jobs():
+    return Job.objects.filter(status='published')
+
+
+def build_index():
+    index = InvertedIndex()
+    built_at = timezone.now()
+    index.build(_indexed_rows(_published_jobs()), built_at)
+    return index
+
+
+def load_index(path):
+    """Load a snapshot and apply job changes made since it was written."""
+    index = InvertedIndex.load(path)
+    refreshed_at = timezone.now()
+    published = _published_jobs()
+    if index.built_at:
+        for job_id, fields in _indexed_rows(
+            published.filter(updated_at__gte=index.built_at)
+        ):
+            index.add(job_id, fields)
+    published_ids = set(published.values_list('id', flat=True))
+    for job_id in index.doc_ids() - published_ids:
+        index.remove(job_id)
+    index.built_at = refreshed_at
+    return index
+
+
+def get_index():
+    global _index  # noqa: PLW0603
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                path = getattr(settings, 'JOBS_SEARCH_INDEX_SNAPSHOT', None)
+                if path and Path(path).exists():
+                    _index = load_index(path)
+                else:
+                    _index = build_index()
+    return _index
+
+
+def peek_index():
+    """Return the process index if it has been built, without building it."""
+    return _index
+
+
+def index_jobs(queryset):
+    """Add the published jobs in ``queryset`` to the process index, if it is built."""
+    index = peek_index()
+    if index is None:
+        return
+    for job_id, fields in _indexed_rows(queryset.filter(status='published')):
+        index.add(job_id, fields)
+
+
+def unindex_jobs(job_ids):
+    """Remove ``job_ids`` from the process index, if it has been built."""
+    index = peek_index()
+    if index is None:
+        return
+    for job_id in job_ids:
+        index.remove(job_id)
+
+
+def reset_index():
+    global _index  # noqa: PLW0603
+    _index = None
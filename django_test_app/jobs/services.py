@@ -1,75 +1,284 @@
+import hashlib
+import json
+import time
+import uuid
+from asgiref.sync import sync_to_async
 from django.utils import timezone
-from django.core.mail import send_mail
+from django.core.cache import cache
 from django.conf import settings
-from django.db.models import Q
-from .models import Job, JobApplication
+from django.db import connection, transaction
+from django.db.models import Case, CharField, Count, Max, Q, Value, When
+from django.db.models.functions import Coalesce
+from .cache import invalidate_jobs_on_commit
+from .models import Job, JobApplication, JobStats
+from .notifications import queue_application_notification, send_notifications
+from .search import TrigramSearchBackend, get_search_backend
+from .search_index import index_jobs, unindex_jobs
+from .stats import COUNTERS, application_created, applications_status_changed
+
+
+# new status -> statuses it can be reached from
+JOB_TRANSITIONS = {
+    'published': ('draft',),
+    'closed': ('draft', 'published'),
+}
+
+
+def _transition_jobs(job_ids, new_status):
+    """
+    Move the jobs among ``job_ids`` in an allowed source status to ``new_status``.
+
+    One conditional UPDATE of status, updated_at (and published_at), so a job
+    changed concurrently is re-checked rather than overwritten. Returns the ids
+    that changed, in ascending order.
+    """
+    job_ids = list(job_ids)
+    if not job_ids:
+        return []
+    now = timezone.now()
+    assignments = 'status = %(status)s, updated_at = %(now)s'
+    if new_status == 'published':
+        assignments += ', published_at = %(now)s'
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {Job._meta.db_table} SET {assignments}
+            WHERE id = ANY(%(ids)s) AND status = ANY(%(from)s)
+            RETURNING id
+            """,  # noqa: S608
+            {
+                'status': new_status,
+                'now': now,
+                'ids': job_ids,
+                'from': list(JOB_TRANSITIONS[new_status]),
+            },
+        )
+        changed = sorted(row[0] for row in cursor.fetchall())
+    jobs_status_changed(changed, new_status)
+    return changed
+
+
+def jobs_status_changed(job_ids, new_status):
+    """Refresh caches and the search index after a status UPDATE that skipped save()."""
+    if not job_ids:
+        return
+    invalidate_jobs_on_commit(job_ids)
+    if new_status == 'published':
+        transaction.on_commit(lambda: index_jobs(Job.objects.filter(pk__in=job_ids)))
+    else:
+        transaction.on_commit(lambda: unindex_jobs(job_ids))
+
+
+def publish_jobs(job_ids):
+    """Publish the drafts among ``job_ids``; returns the ids that were published."""
+    return _transition_jobs(job_ids, 'published')
+
+
+def close_jobs(job_ids):
+    """Close the draft and published jobs among ``job_ids``; return the closed ids."""
+    return _transition_jobs(job_ids, 'closed')
 
 
 def publish_job(job_id):
-    try:
-        job = Job.objects.get(pk=job_id)
-        if job.status == 'draft':
-            job.status = 'published'
-            job.published_at = timezone.now()
-            job.save()
-            return True
-        return False
-    except Job.DoesNotExist:
-        return False
+    return bool(publish_jobs([job_id]))
 
 
 def close_job(job_id):
-    try:
-        job = Job.objects.get(pk=job_id)
-        job.status = 'closed'
-        job.save()
-        return True
-    except Job.DoesNotExist:
-        return False
+    return bool(close_jobs([job_id]))
 
 
-def send_application_notification(application_id):
-    application = JobApplication.objects.get(pk=application_id)
-    job = application.job
+APPLY_COLUMNS = (
+    'job_id', 'applicant_id', 'cover_letter', 'resume_url', 'status', 'applied_at',
+)
+
+
+def apply_to_job(job, applicant, cover_letter='', resume_url=''):
+    """
+    Create the application of ``applicant`` to ``job``, or return the one that exists.
+
+    Returns ``(application, created)``. A single INSERT ... ON CONFLICT statement
+    does both, so concurrent requests cannot create duplicates or fail on the
+    unique constraint; a conflicting insert waits for the other transaction and
+    then returns its row. The no-op DO UPDATE is what makes RETURNING yield the
+    existing row, and ``xmax = 0`` tells a fresh insert from an existing row.
+    """
+    field_names = [field.attname for field in JobApplication._meta.concrete_fields]
+    values = [job.pk, applicant.pk, cover_letter, resume_url, 'pending', timezone.now()]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {JobApplication._meta.db_table} ({', '.join(APPLY_COLUMNS)})
+            VALUES ({', '.join(['%s'] * len(APPLY_COLUMNS))})
+            ON CONFLICT (job_id, applicant_id) DO UPDATE SET job_id = EXCLUDED.job_id
+            RETURNING {', '.join(field_names)}, (xmax = 0)
+            """,  # noqa: S608
+            values,
+        )
+        *row, created = cursor.fetchone()
+    application = JobApplication.from_db(connection.alias, field_names, row)
+    application.job = job
+    application.applicant = applicant
+    if created:
+        application_created(job.pk, application.status)
+        queue_application_notification(application.pk)
+    return application, created
+
+
+def review_applications(queryset, new_status, reviewed_at=None):
+    """
+    Set ``status`` and ``reviewed_at`` of every application in ``queryset`` at once.
+
+    The UPDATE also returns each row's previous status, from which the JobStats
+    counters are adjusted in one more statement.
+    """
+    if new_status not in JobApplication.REVIEW_STATUSES:
+        msg = f'Invalid review status: {new_status!r}'
+        raise ValueError(msg)
+    table = JobApplication._meta.db_table
+    selection, params = queryset.order_by().values('pk').query.sql_with_params()
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH previous AS (
+                SELECT id, job_id, status FROM {table}
+                WHERE id IN ({selection}) FOR UPDATE
+            )
+            UPDATE {table} AS application
+            SET status = %s, reviewed_at = %s
+            FROM previous
+            WHERE application.id = previous.id
+            RETURNING previous.job_id, previous.status
+            """,  # noqa: S608
+            [*params, new_status, reviewed_at or timezone.now()],
+        )
+        previous = cursor.fetchall()
+        applications_status_changed(previous, new_status)
+    return len(previous)
+
+
+def review_applications_in_chunks(  # noqa: PLR0913
+    lookups,
+    new_status,
+    reviewed_at,
+    max_pk,
+    after=0,
+    state=None,
+    chunk_size=1000,
+    max_seconds=None,
+    progress=None,
+):
+    """
+    Review the applications matching ``lookups`` with ``after < pk <= max_pk``.
+
+    One UPDATE per chunk of ``chunk_size`` rows, each in its own transaction.
+    ``state`` is ``{'done', 'total', 'updated'}`` and is passed to ``progress``
+    after every chunk. Returns ``(after, state)``: ``after`` is the last pk
+    reviewed when ``max_seconds`` ran out, or ``None`` once the walk is done.
+    """
+    state = dict(state or {'done': 0, 'total': None, 'updated': 0})
+    selection = JobApplication.objects.filter(**lookups, pk__lte=max_pk).order_by('pk')
+    deadline = time.monotonic() + max_seconds if max_seconds else None
+    while True:
+        chunk = list(
+            selection.filter(pk__gt=after).values_list('pk', flat=True)[:chunk_size]
+        )
+        if chunk:
+            with transaction.atomic():
+                state['updated'] += review_applications(
+                    JobApplication.objects.filter(pk__in=chunk), new_status, reviewed_at
+                )
+            state['done'] += len(chunk)
+            after = chunk[-1]
+            if progress is not None:
+                progress(dict(state))
+        if len(chunk) < chunk_size:
+            return None, state
+        if deadline is not None and time.monotonic() >= deadline:
+            return after, state
+
+
+def bulk_review_applications(lookups, new_status):
+    """
+    Review the applications matching ``lookups``, in the background when there are many.
+
+    ``lookups`` are JobApplication filter arguments with JSON-serializable
+    values. Returns ``(count, task_id)``. Selections of up to
+    ``JOBS_BULK_REVIEW_ASYNC_THRESHOLD`` rows are updated right away and
+    ``task_id`` is ``None``. Larger ones are handed to review_applications_task
+    once the transaction commits: the task receives ``lookups`` and the largest
+    pk selected now, not the ids, and ``count`` is the number of selected rows.
+    The task reports its progress under ``task_id``.
+    """
+    from .tasks import review_applications_task  # noqa: PLC0415
     
-    subject = f'New application for {job.title}'
-    message = f'You have received a new application from {application.applicant.email} for the position {job.title}.'
-    recipient = job.created_by.email
+    if new_status not in JobApplication.REVIEW_STATUSES:
+        msg = f'Invalid review status: {new_status!r}'
+        raise ValueError(msg)
+    queryset = JobApplication.objects.filter(**lookups)
+    selection = queryset.aggregate(count=Count('pk'), max_pk=Max('pk'))
+    if selection['count'] <= getattr(
+        settings, 'JOBS_BULK_REVIEW_ASYNC_THRESHOLD', 5000
+    ):
+        return review_applications(queryset, new_status), None
     
-    send_mail(
-        subject,
-        message,
-        getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@example.com'),
-        [recipient],
-        fail_silently=False,
+    reviewed_at = timezone.now().isoformat()
+    state = {'done': 0, 'total': selection['count'], 'updated': 0}
+    task_id = str(uuid.uuid4())
+    transaction.on_commit(
+        lambda: review_applications_task.apply_async(
+            (lookups, new_status, reviewed_at, selection['max_pk']),
+            {'state': state},
+            task_id=task_id,
+        )
     )
+    return selection['count'], task_id
+
+
+def send_application_notification(application_id):
+    """Queue the employer email for one application in the outbox, skipping digests."""
+    return send_notifications([application_id])
 
 
 def get_job_statistics(job_id):
-    job = Job.objects.get(pk=job_id)
-    applications = JobApplication.objects.filter(job=job)
-    total_applications = applications.count()
-    pending = applications.filter(status='pending').count()
-    accepted = applications.filter(status='accepted').count()
-    rejected = applications.filter(status='rejected').count()
-    
+    """Return the application counters of a job from its JobStats row."""
+    statistics = JobStats.objects.filter(job_id=job_id).values(*COUNTERS).first()
+    if statistics is None:
+        # No row yet: either the job has no applications or it does not exist.
+        if not Job.objects.filter(pk=job_id).exists():
+            msg = f'Job {job_id} does not exist'
+            raise Job.DoesNotExist(msg)
+        statistics = dict.fromkeys(COUNTERS, 0)
+    return statistics
+
+
+def get_job_statistics_bulk(job_ids):
+    """
+    Return ``{job_id: counters}`` for the jobs in ``job_ids`` with one query.
+
+    ``job_ids`` may also be a queryset of jobs. The JobStats rows are LEFT
+    JOINed, so jobs without applications get zeros and unknown ids are left out.
+    """
+    rows = Job.objects.filter(pk__in=job_ids).order_by('pk').values_list(
+        'pk', *(f'stats__{name}' for name in COUNTERS)
+    )
     return {
-        'total': total_applications,
-        'pending': pending,
-        'accepted': accepted,
-        'rejected': rejected,
+        job_id: dict(zip(COUNTERS, (count or 0 for count in counts), strict=True))
+        for job_id, *counts in rows
     }
 
 
-def search_jobs(query, category_id=None, min_salary=None, max_salary=None):
-    jobs = Job.objects.filter(status='published')
+def search_jobs(  # noqa: PLR0913
+    query,
+    category_id=None,
+    min_salary=None,
+    max_salary=None,
+    status='published',
+    backend=None,
+):
+    jobs = Job.objects.filter(status=status)
     
     if query:
-        jobs = jobs.filter(
-            Q(title__icontains=query) |
-            Q(description__icontains=query) |
-            Q(company_name__icontains=query)
-        )
+        jobs = get_search_backend(backend).search(jobs, query)
     
     if category_id:
         jobs = jobs.filter(category_id=category_id)
@@ -82,3 +291,137 @@ def search_jobs(query, category_id=None, min_salary=None, max_salary=None):
     
     return jobs
 
+
+async def asearch_jobs(query, **kwargs):
+    """search_jobs() for async views."""
+    if query:
+        # A backend may read data to build the queryset (the process index on first
+        # use).
+        return await sync_to_async(search_jobs)(query, **kwargs)
+    return search_jobs(query, **kwargs)
+
+
+def suggest_search_terms(query, limit=5):
+    if not query:
+        return []
+    return TrigramSearchBackend().suggest(
+        Job.objects.filter(status='published'), query, limit=limit
+    )
+
+
+SALARY_BUCKETS = [
+    (None, 30000),
+    (30000, 50000),
+    (50000, 75000),
+    (75000, 100000),
+    (100000, None),
+]
+
+FACETS_CACHE_PREFIX = 'jobs:facets'
+
+# GROUPING(category_id, status, location, salary_bucket) of each facet's rows:
+# a bit is set for every column that is rolled up.
+CATEGORY_GROUPING = 0b0111
+STATUS_GROUPING = 0b1011
+LOCATION_GROUPING = 0b1101
+SALARY_GROUPING = 0b1110
+
+
+def _salary_bucket_label(lower, upper):
+    if lower is None:
+        return f'<{upper}'
+    if upper is None:
+        return f'{lower}+'
+    return f'{lower}-{upper}'
+
+
+def _salary_bucket_expression():
+    """Bucket jobs by their advertised maximum salary, falling back to the minimum."""
+    whens = []
+    for lower, upper in SALARY_BUCKETS:
+        condition = Q()
+        if lower is not None:
+            condition &= Q(salary__gte=lower)
+        if upper is not None:
+            condition &= Q(salary__lt=upper)
+        whens.append(When(condition, then=Value(_salary_bucket_label(lower, upper))))
+    return Case(*whens, default=Value('unspecified'), output_field=CharField())
+
+
+def _facets_cache_key(query, category_id, status):
+    filters = {
+        'backend': getattr(settings, 'JOBS_SEARCH_BACKEND', ''),
+        'category': str(category_id or ''),
+        'search': ' '.join((query or '').lower().split()),
+        'status': status,
+    }
+    digest = hashlib.md5(
+        json.dumps(filters, sort_keys=True).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f'{FACETS_CACHE_PREFIX}:{digest}'
+
+
+def get_job_facets(query, category_id=None, status='published'):
+    """
+    Count jobs matching the filters per category, status, salary bucket and location.
+
+    All four facets come from a single GROUPING SETS query over the same
+    filtered rows that search_jobs returns, and are cached per normalized filter set.
+    """
+    cache_key = _facets_cache_key(query, category_id, status)
+    facets = cache.get(cache_key)
+    if facets is not None:
+        return facets
+    
+    rows = (
+        search_jobs(query, category_id=category_id, status=status)
+        .order_by()
+        .annotate(
+            salary=Coalesce('salary_max', 'salary_min'),
+        )
+        .annotate(
+            salary_bucket=_salary_bucket_expression(),
+        )
+        .values_list(
+            'category_id', 'category__name', 'status', 'location', 'salary_bucket'
+        )
+    )
+    sql, params = rows.query.sql_with_params()
+    
+    facets = {'category': [], 'status': [], 'salary': [], 'location': []}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT category_id, category_name, status, location, salary_bucket,
+                   GROUPING(category_id, status, location, salary_bucket), COUNT(*)
+            FROM ({sql}) AS filtered
+                (category_id, category_name, status, location, salary_bucket)
+            GROUP BY GROUPING SETS (
+                (category_id, category_name), (status), (location), (salary_bucket)
+            )
+            ORDER BY COUNT(*) DESC
+            """,  # noqa: S608
+            params,
+        )
+        for (
+            category_id_,
+            category_name,
+            status_,
+            location,
+            salary_bucket,
+            grouping,
+            count,
+        ) in cursor.fetchall():
+            if grouping == CATEGORY_GROUPING:
+                facets['category'].append(
+                    {'id': category_id_, 'name': category_name, 'count': count}
+                )
+            elif grouping == STATUS_GROUPING:
+                facets['status'].append({'value': status_, 'count': count})
+            elif grouping == LOCATION_GROUPING:
+                facets['location'].append({'value': location, 'count': count})
+            elif grouping == SALARY_GROUPING:
+                facets['salary'].append({'value': salary_bucket, 'count': count})
+    
+    cache.set(cache_key, facets, getattr(settings, 'JOBS_FACETS_CACHE_TIMEOUT', 60))
+    return facets
@@ -0,0 +1,94 @@
+from django.core.signals import setting_changed
+from django.db import connections, transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .cache import invalidate_jobs_on_commit
+from . import stats
+from .models import Job, JobApplication, JobCategory
+from .notifications import queue_application_notification
+from .search import set_trigram_threshold
+from .search_index import FIELD_WEIGHTS, peek_index
+
+
+@receiver(post_save, sender=Job)
+def update_search_index(sender, instance, **kwargs):
+    index = peek_index()
+    if index is None:
+        return
+    job_id = instance.pk
+    if instance.status == 'published':
+        fields = {field: getattr(instance, field) for field in FIELD_WEIGHTS}
+        transaction.on_commit(lambda: index.add(job_id, fields))
+    else:
+        transaction.on_commit(lambda: index.remove(job_id))
+
+
+@receiver(post_delete, sender=Job)
+def remove_from_search_index(sender, instance, **kwargs):
+    index = peek_index()
+    if index is None:
+        return
+    job_id = instance.pk
+    transaction.on_commit(lambda: index.remove(job_id))
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_cache(sender, instance, **kwargs):
+    invalidate_jobs_on_commit([instance.pk])
+
+
+@receiver(post_save, sender=JobCategory)
+@receiver(pre_delete, sender=JobCategory)
+def invalidate_category_jobs_cache(sender, instance, **kwargs):
+    # pre_delete: once the category is gone its jobs no longer point at it.
+    invalidate_jobs_on_commit(
+        Job.objects.filter(category=instance).values_list('pk', flat=True)
+    )
+
+
+@receiver(pre_save, sender=JobApplication)
+def remember_application_status(sender, instance, update_fields=None, **kwargs):
+    if instance._state.adding or (
+        update_fields is not None and 'status' not in update_fields
+    ):
+        instance._previous_status = None  # noqa: SLF001
+        return
+    instance._previous_status = (  # noqa: SLF001
+        JobApplication.objects.filter(pk=instance.pk)
+        .values_list('status', flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=JobApplication)
+def update_stats_on_save(sender, instance, created, **kwargs):
+    if created:
+        stats.application_created(instance.job_id, instance.status)
+        queue_application_notification(instance.pk)
+    elif getattr(instance, '_previous_status', None) is not None:
+        stats.application_status_changed(
+            instance.job_id,
+            instance._previous_status,  # noqa: SLF001
+            instance.status,
+        )
+
+
+@receiver(post_delete, sender=JobApplication)
+def update_stats_on_delete(sender, instance, **kwargs):
+    stats.application_deleted(instance.job_id, instance.status)
+
+
+@receiver(connection_created)
+def configure_search_session(sender, connection, **kwargs):
+    set_trigram_threshold(connection)
+
+
+@receiver(setting_changed)
+def trigram_threshold_changed(sender, setting, **kwargs):
+    if setting == 'JOBS_SEARCH_TRIGRAM_THRESHOLD':
+        for connection in connections.all(initialized_only=True):
+            if connection.connection is not None:
+                set_trigram_threshold(connection)
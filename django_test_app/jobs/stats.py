@@ -0,0 +1,134 @@
+"""
+Denormalized application counters per job (JobStats).
+
+Creating, deleting or re-statusing an application adjusts the counters of its
+job with relative ``counter = counter + delta`` updates, so concurrent changes
+never overwrite each other. Single applications go through the model signals
+and apply_to_job(); bulk reviews through review_applications(). Writes that
+bypass both (raw SQL, ``queryset.update(status=...)``) cause drift, which
+reconcile_job_stats() repairs.
+
+A job without a row has no applications yet; the row is created with its
+first application.
+"""
+from collections import Counter, defaultdict
+
+from django.db import connection
+from django.db.models import F
+
+from .models import Job, JobApplication, JobStats
+
+
+COUNTERS = ('total', 'pending', 'reviewed', 'accepted', 'rejected')
+
+
+def update_job_stats(job_id, deltas):
+    """Add ``deltas`` (``{counter: delta}``) to the counters of one job."""
+    updates = {name: F(name) + delta for name, delta in deltas.items() if delta}
+    if not updates:
+        return
+    if JobStats.objects.filter(job_id=job_id).update(**updates):
+        return
+    # Only a new application may create the row: applications deleted along with
+    # their job can run after the row is gone and must not recreate it.
+    if deltas.get('total', 0) > 0:
+        JobStats.objects.bulk_create([JobStats(job_id=job_id)], ignore_conflicts=True)
+        JobStats.objects.filter(job_id=job_id).update(**updates)
+
+
+def update_many_job_stats(deltas_by_job):
+    """Apply ``{job_id: {counter: delta}}`` to existing rows in a single UPDATE."""
+    rows = [
+        (job_id, deltas)
+        for job_id, deltas in deltas_by_job.items()
+        if any(deltas.values())
+    ]
+    if not rows:
+        return
+    columns = [[job_id for job_id, _deltas in rows]]
+    columns += [[deltas.get(name, 0) for _job_id, deltas in rows] for name in COUNTERS]
+    updates = ', '.join(f'{name} = stats.{name} + delta.{name}' for name in COUNTERS)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {JobStats._meta.db_table} AS stats
+            SET {updates}
+            FROM unnest(%s::bigint[], {', '.join(['%s::integer[]'] * len(COUNTERS))})
+                AS delta (job_id, {', '.join(COUNTERS)})
+            WHERE stats.job_id = delta.job_id
+            """,  # noqa: S608
+            columns,
+        )
+
+
+def application_created(job_id, status):
+    update_job_stats(job_id, {'total': 1, status: 1})
+
+
+def application_deleted(job_id, status):
+    update_job_stats(job_id, {'total': -1, status: -1})
+
+
+def application_status_changed(job_id, old_status, new_status):
+    if old_status != new_status:
+        update_job_stats(job_id, {old_status: -1, new_status: 1})
+
+
+def applications_status_changed(previous, new_status):
+    """Record a bulk status change from ``[(job_id, previous status), ...]``."""
+    deltas_by_job = defaultdict(Counter)
+    for job_id, old_status in previous:
+        if old_status != new_status:
+            deltas_by_job[job_id][old_status] -= 1
+            deltas_by_job[job_id][new_status] += 1
+    update_many_job_stats(deltas_by_job)
+
+
+def reconcile_job_stats(job_ids=None, batch_size=10000):
+    """
+    Recompute the counters of ``job_ids`` (default: every job) from the applications.
+
+    Jobs are processed in primary key ranges of ``batch_size``, one statement
+    each, and only rows whose counters differ are written. Returns the number
+    of rows created or corrected. Counts are taken from the statement's
+    snapshot, so changes committed while a batch runs may need another pass.
+    """
+    if job_ids is not None:
+        return _reconcile('j.id = ANY(%s)', [list(job_ids)])
+    bounds = Job.objects.order_by().values_list('pk', flat=True)
+    first, last = bounds.order_by('pk').first(), bounds.order_by('-pk').first()
+    if first is None:
+        return 0
+    return sum(
+        _reconcile('j.id >= %s AND j.id < %s', [start, start + batch_size])
+        for start in range(first, last + 1, batch_size)
+    )
+
+
+def _reconcile(condition, params):
+    stats_table = JobStats._meta.db_table
+    counts = ', '.join(
+        f"COUNT(a.id) FILTER (WHERE a.status = '{name}')"
+        for name in COUNTERS
+        if name != 'total'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {stats_table} (job_id, {', '.join(COUNTERS)})
+            SELECT j.id, COUNT(a.id), {counts}
+            FROM {Job._meta.db_table} AS j
+            LEFT JOIN {JobApplication._meta.db_table} AS a ON a.job_id = j.id
+            WHERE {condition}
+            GROUP BY j.id
+            HAVING COUNT(a.id) > 0
+                OR EXISTS (SELECT 1 FROM {stats_table} AS s WHERE s.job_id = j.id)
+            ON CONFLICT (job_id) DO UPDATE
+            SET {', '.join(f'{name} = EXCLUDED.{name}' for name in COUNTERS)}
+            WHERE ({', '.join(f'{stats_table}.{name}' for name in COUNTERS)})
+                IS DISTINCT FROM ({', '.join(f'EXCLUDED.{name}' for name in COUNTERS)})
+            RETURNING job_id
+            """,  # noqa: S608
+            params,
+        )
+        return cursor.rowcount
@@ -0,0 +1,106 @@
+from celery import shared_task
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+
+from config.celery_app import coalesced_task
+
+from .notifications import send_digests
+from .outbox import drain
+from .rollups import rollup_applications
+from .scheduling import run_job_schedule
+from .search_index import build_index
+from .services import review_applications_in_chunks
+
+
+@shared_task(bind=True)
+def review_applications_task(  # noqa: PLR0913
+    self, lookups, new_status, reviewed_at, max_pk, after=0, state=None
+):
+    """
+    Bulk review started by bulk_review_applications(); reports PROGRESS per chunk.
+
+    When its time budget runs out the task replaces itself, keeping its id,
+    to continue after the last reviewed pk.
+    """
+    def progress(state):
+        self.update_state(state='PROGRESS', meta=state)
+
+    after, state = review_applications_in_chunks(
+        lookups,
+        new_status,
+        parse_datetime(reviewed_at),
+        max_pk,
+        after=after,
+        state=state,
+        chunk_size=getattr(settings, 'JOBS_BULK_REVIEW_CHUNK_SIZE', 1000),
+        # Stay well inside CELERY_TASK_SOFT_TIME_LIMIT. Eager runs have no time limit
+        # (and cannot be replaced).
+        max_seconds=(
+            None if self.request.is_eager
+            else getattr(settings, 'JOBS_BULK_REVIEW_TASK_SECONDS', 30)
+        ),
+        # Eager runs have nobody polling and no result backend to write to.
+        progress=None if self.request.is_eager else progress,
+    )
+    if after is not None:
+        return self.replace(
+            self.s(lookups, new_status, reviewed_at, max_pk, after=after, state=state)
+        )
+    return state
+
+
+@shared_task()
+def rollup_applications_task():
+    """Periodic: add new applications to the hourly and daily rollups."""
+    return rollup_applications().isoformat()
+
+
+@coalesced_task(
+    window=lambda: getattr(settings, 'JOBS_NOTIFICATION_DIGEST_WINDOW', 0), bind=True
+)
+def send_digests_task(self):
+    """
+    Queue digest emails.
+
+    Triggered with coalesce(), so a burst of applications is sent as one digest.
+    """
+    batch_size = getattr(settings, 'JOBS_NOTIFICATION_BATCH_SIZE', 1000)
+    handled = send_digests(batch_size)
+    if handled == batch_size:
+        # More applications are waiting than fit in one batch.
+        self.apply_async()
+    return handled
+
+
+@shared_task()
+def dispatch_outbox_task():
+    """
+    Send due outbox emails.
+
+    Requested after each commit that queues email and run by beat every minute.
+    """
+    # Stay well inside CELERY_TASK_SOFT_TIME_LIMIT; whatever is left goes to the next
+    # run.
+    sent, failed = drain(max_seconds=30)
+    return {'sent': sent, 'failed': failed}
+
+
+@shared_task()
+def run_job_schedule_task():
+    """Periodic: publish and close the jobs whose publish_at / expires_at has passed."""
+    return run_job_schedule()
+
+
+@shared_task()
+def build_search_index_task():
+    """
+    Rebuild the job search index snapshot (``JOBS_SEARCH_INDEX_SNAPSHOT``).
+
+    Web processes load it at startup.
+    """
+    path = getattr(settings, 'JOBS_SEARCH_INDEX_SNAPSHOT', None)
+    if not path:
+        return None
+    index = build_index()
+    index.save(path)
+    return len(index)
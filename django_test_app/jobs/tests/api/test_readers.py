@@ -0,0 +1,109 @@
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from django_test_app.jobs.api.readers import ValuesReader
+from django_test_app.jobs.api.serializers import JobApplicationSerializer, JobSerializer
+from django_test_app.jobs.models import Job, JobApplication
+from django_test_app.jobs.tests.factories import JobApplicationFactory, JobFactory
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+def assert_parity(serializer_class, queryset, **kwargs):
+    expected = serializer_class(queryset, many=True, **kwargs).data
+    reader = ValuesReader.for_serializer(serializer_class(**kwargs))
+    rows = queryset.values(*reader.columns)
+    assert render(reader.represent_many(rows)) == render(expected)
+    for instance, row in zip(queryset, rows, strict=True):
+        assert render(reader.to_representation(row)) == render(
+            serializer_class(instance, **kwargs).data
+        )
+
+
+@pytest.mark.django_db
+class TestJobParity:
+    def test_full_representation(self):
+        JobFactory(
+            salary_min=Decimal('45000.5'),
+            salary_max=Decimal('90000'),
+            published_at=timezone.now(),
+        )
+        JobFactory(salary_min=None, salary_max=None, category=None, status='draft')
+        JobFactory(title='Ünïcode «title»', description='')
+        
+        assert_parity(JobSerializer, Job.objects.order_by('id'))
+    
+    def test_sparse_fields(self):
+        JobFactory.create_batch(2)
+        
+        assert_parity(
+            JobSerializer,
+            Job.objects.order_by('id'),
+            fields=['id', 'title', 'salary_max'],
+        )
+        assert_parity(
+            JobSerializer,
+            Job.objects.order_by('id'),
+            exclude=['category', 'description'],
+        )
+        assert_parity(JobSerializer, Job.objects.order_by('id'), fields=['category'])
+
+
+@pytest.mark.django_db
+class TestJobApplicationParity:
+    def test_full_representation(self):
+        JobApplicationFactory(
+            resume_url=None, reviewed_at=timezone.now(), status='accepted'
+        )
+        JobApplicationFactory(cover_letter='')
+        
+        assert_parity(JobApplicationSerializer, JobApplication.objects.order_by('id'))
+
+
+class TestFallback:
+    def test_method_field_is_not_supported(self):
+        class MethodSerializer(serializers.ModelSerializer):
+            label = serializers.SerializerMethodField()
+            
+            class Meta:
+                model = Job
+                fields = ['id', 'label']
+            
+            def get_label(self, obj):
+                return str(obj)
+        
+        assert ValuesReader.for_serializer(MethodSerializer()) is None
+
+
+@pytest.mark.django_db
+class TestApiParity:
+    def test_list_and_retrieve_match_serializer(self):
+        client = APIClient()
+        JobFactory(category=None, salary_min=None)
+        job = JobFactory(published_at=timezone.now())
+        
+        response = client.get('/api/jobs/')
+        expected = JobSerializer(
+            Job.objects.order_by('-created_at', '-id'), many=True
+        ).data
+        assert render(response.data['results']) == render(expected)
+        
+        response = client.get(f'/api/jobs/{job.pk}/')
+        assert response.content == render(JobSerializer(job).data)
+    
+    def test_retrieve_missing(self):
+        client = APIClient()
+        
+        response = client.get('/api/jobs/0/')
+        assert response.status_code == 404
+    
+    def test_retrieve_non_numeric_id(self):
+        response = APIClient().get('/api/jobs/abc/')
+        
+        assert response.status_code == 404
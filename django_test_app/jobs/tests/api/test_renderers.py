@@ -0,0 +1,121 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from django_test_app.jobs.api import renderers
+from django_test_app.jobs.api.parsers import FastJSONParser
+from django_test_app.jobs.api.renderers import FastJSONRenderer
+from django_test_app.jobs.api.serializers import JobSerializer
+from django_test_app.jobs.models import Job
+from django_test_app.jobs.tests.factories import JobFactory
+
+
+class TestFastJSONRenderer:
+    def test_native_types(self):
+        data = {
+            'salary': Decimal('45000.50'),
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'date': datetime.date(2024, 5, 1),
+            'created_at': datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.UTC),
+            1: 'non-string key',
+        }
+        
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+    
+    def test_escapes_line_separators(self):
+        data = {'title': 'line\u2028break\u2029'}
+        
+        assert FastJSONRenderer().render(data) == b'{"title":"line\\u2028break\\u2029"}'
+    
+    def test_indent_uses_stdlib(self):
+        data = {'title': 'Engineer', 'tags': ['a', 'b']}
+        
+        rendered = FastJSONRenderer().render(data, 'application/json; indent=4')
+        assert rendered == JSONRenderer().render(data, 'application/json; indent=4')
+    
+    def test_large_integer_uses_stdlib(self):
+        assert (
+            FastJSONRenderer().render({'value': 2**70})
+            == b'{"value":1180591620717411303424}'
+        )
+    
+    def test_uses_orjson(self, monkeypatch):
+        # orjson is a pinned dependency; the stdlib fallback must not be what serves
+        # responses.
+        monkeypatch.setattr(
+            JSONRenderer,
+            'render',
+            lambda *args, **kwargs: pytest.fail('stdlib renderer used'),
+        )
+        
+        assert renderers.orjson is not None
+        assert (
+            FastJSONRenderer().render({'title': 'Engineer'}) == b'{"title":"Engineer"}'
+        )
+    
+    def test_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(renderers, 'orjson', None)
+        data = {'salary': Decimal('1.50'), 'title': 'Engineer'}
+        
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+    
+    @pytest.mark.django_db
+    def test_serializer_output_parity(self):
+        JobFactory(salary_min=Decimal('45000.50'), title='Ünïcode «title»')
+        JobFactory(salary_min=None, category=None)
+        data = JobSerializer(Job.objects.order_by('id'), many=True).data
+        
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+class TestFastJSONParser:
+    def test_parse(self):
+        stream = io.BytesIO(
+            '{"title": "Ünïcode", "salary_min": 1.5, "tags": [1, null]}'.encode()
+        )
+        
+        assert FastJSONParser().parse(stream) == {
+            'title': 'Ünïcode',
+            'salary_min': 1.5,
+            'tags': [1, None],
+        }
+    
+    @pytest.mark.parametrize('body', [b'{"title": ', b'{"value": NaN}'])
+    def test_invalid_json(self, body):
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(io.BytesIO(body))
+    
+    def test_uses_orjson(self, monkeypatch):
+        monkeypatch.setattr(
+            JSONParser,
+            'parse',
+            lambda *args, **kwargs: pytest.fail('stdlib parser used'),
+        )
+        
+        assert FastJSONParser().parse(io.BytesIO(b'{"title": "Engineer"}')) == {
+            'title': 'Engineer'
+        }
+    
+    def test_other_encoding_uses_stdlib(self):
+        body = '{"title": "Ünïcode"}'.encode('utf-16')
+        context = {'encoding': 'utf-16'}
+        
+        assert FastJSONParser().parse(io.BytesIO(body), parser_context=context) == {
+            'title': 'Ünïcode'
+        }
+
+
+@pytest.mark.django_db
+class TestDefaultRenderer:
+    def test_api_renders_with_fast_renderer(self):
+        JobFactory(status='published')
+        
+        response = APIClient().get('/api/jobs/')
+        assert isinstance(response.accepted_renderer, FastJSONRenderer)
+        assert response.json()['results'][0]['status'] == 'published'
@@ -1,6 +1,29 @@
+import csv
+import datetime
+import io
+import json
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import rest_framework
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.db import connection, transaction
+from django.test import AsyncClient, override_settings
+from django.urls import clear_url_caches, resolve
+from django.utils import timezone
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from rest_framework import status
+from config import api_router, urls
+from django_test_app.jobs.api import idempotency, views
+from django_test_app.jobs.api.renderers import NDJSONRenderer
+from django_test_app.jobs.api.views import JobViewSet
+from django_test_app.jobs.cache import invalidate_jobs
+from django_test_app.jobs.models import Job, JobApplication
+from django_test_app.jobs.services import apply_to_job
+from django_test_app.jobs.pagination import encode_cursor
 from django_test_app.jobs.tests.factories import JobFactory, JobCategoryFactory, JobApplicationFactory
 from django_test_app.users.tests.factories import UserFactory
 
@@ -17,6 +40,73 @@ class TestJobViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) == 2
     
+    def test_list_jobs_cursor_pagination(self):
+        client = APIClient()
+        jobs = JobFactory.create_batch(3, status='published')
+        
+        response = client.get('/api/jobs/', {'page_size': 2})
+        assert [job['id'] for job in response.data['results']] == [
+            jobs[2].pk,
+            jobs[1].pk,
+        ]
+        assert response.data['previous'] is None
+        
+        response = client.get(response.data['next'])
+        assert [job['id'] for job in response.data['results']] == [jobs[0].pk]
+        assert response.data['next'] is None
+        assert response.data['previous'] is not None
+    
+    def test_list_jobs_invalid_cursor(self):
+        client = APIClient()
+        
+        response = client.get('/api/jobs/', {'cursor': 'garbage'})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        
+        response = client.get('/api/jobs/', {'cursor': encode_cursor(['x', 'y'])})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+    
+    def test_list_jobs_sparse_fields(self):
+        client = APIClient()
+        JobFactory(status='published')
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(
+                '/api/jobs/', {'fields': 'id,title,company_name,salary_min,salary_max'}
+            )
+        assert response.status_code == status.HTTP_200_OK
+        assert list(response.data['results'][0]) == [
+            'id',
+            'title',
+            'company_name',
+            'salary_min',
+            'salary_max',
+        ]
+        job_query = next(
+            query['sql']
+            for query in queries.captured_queries
+            if 'FROM "jobs_job"' in query['sql']
+        )
+        assert '"description"' not in job_query
+        assert 'JOIN' not in job_query
+    
+    def test_retrieve_job_exclude_fields(self):
+        client = APIClient()
+        job = JobFactory(status='published')
+        
+        response = client.get(
+            f'/api/jobs/{job.pk}/', {'exclude': 'description,category'}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert 'description' not in response.data
+        assert 'category' not in response.data
+        assert response.data['created_by_email'] == job.created_by.email
+    
+    def test_unknown_sparse_field(self):
+        client = APIClient()
+        
+        response = client.get('/api/jobs/', {'fields': 'id,nope'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
     def test_create_job_requires_auth(self):
         client = APIClient()
         category = JobCategoryFactory()
@@ -52,6 +142,148 @@ class TestJobViewSet:
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data['title'] == 'New Job'
     
+    def test_bulk_import(self):
+        client = APIClient()
+        user = UserFactory()
+        client.force_authenticate(user=user)
+        rows = [
+            {
+                'title': 'Engineer',
+                'description': 'APIs',
+                'company_name': 'Acme',
+                'location': 'Remote',
+            },
+            {
+                'title': 'Manager',
+                'description': 'People',
+                'company_name': 'Acme',
+                'location': 'Remote',
+                'salary_min': '90000',
+                'salary_max': '50000',
+            },
+        ]
+        
+        response = client.post('/api/jobs/bulk/', rows, format='json')
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['created'] == 1
+        assert response.data['errors'] == [
+            {
+                'index': 1,
+                'errors': {
+                    'salary_max': ['Maximum salary must be greater than minimum salary']
+                },
+            }
+        ]
+        assert Job.objects.get().created_by == user
+    
+    def test_bulk_import_rejects_invalid_payload(self, settings):
+        client = APIClient()
+        client.force_authenticate(user=UserFactory())
+        settings.JOBS_BULK_IMPORT_MAX_ROWS = 1
+        
+        response = client.post('/api/jobs/bulk/', {'title': 'Engineer'}, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        response = client.post('/api/jobs/bulk/', [{}, {}], format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Job.objects.count() == 0
+    
+    def test_bulk_publish_and_close_own_jobs(self):
+        owner = UserFactory()
+        drafts = JobFactory.create_batch(2, created_by=owner, status='draft')
+        published = JobFactory(created_by=owner, status='published')
+        other = JobFactory(status='draft')
+        client = APIClient()
+        client.force_authenticate(user=owner)
+        ids = [job.pk for job in drafts] + [published.pk, other.pk]
+        
+        response = client.post('/api/jobs/bulk-publish/', {'ids': ids}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            'changed': [job.pk for job in drafts],
+            'unchanged': [published.pk, other.pk],
+        }
+        assert Job.objects.get(pk=other.pk).status == 'draft'
+        
+        response = client.post('/api/jobs/bulk-close/', {'ids': ids}, format='json')
+        assert response.data['changed'] == [job.pk for job in drafts] + [published.pk]
+        assert (
+            Job.objects.filter(created_by=owner).exclude(status='closed').count() == 0
+        )
+        
+        client.force_authenticate(user=UserFactory(is_staff=True))
+        response = client.post(
+            '/api/jobs/bulk-publish/', {'ids': [other.pk]}, format='json'
+        )
+        assert response.data['changed'] == [other.pk]
+    
+    def test_bulk_publish_validation(self):
+        client = APIClient()
+        assert client.post(
+            '/api/jobs/bulk-publish/', {'ids': [1]}, format='json'
+        ).status_code in (401, 403)
+        
+        client.force_authenticate(user=UserFactory())
+        assert (
+            client.post(
+                '/api/jobs/bulk-publish/', {'ids': []}, format='json'
+            ).status_code
+            == 400
+        )
+        assert (
+            client.post(
+                '/api/jobs/bulk-close/', {'ids': ['x']}, format='json'
+            ).status_code
+            == 400
+        )
+    
+    def test_reads_are_sync_by_default(self):
+        # Under WSGI, DRF's own dispatch runs without an async_to_sync hop.
+        assert not iscoroutinefunction(resolve('/api/jobs/').func)
+        assert not iscoroutinefunction(resolve('/api/jobs/1/').func)
+    
+    def test_conditional_get(self, django_assert_num_queries):
+        client = APIClient()
+        jobs = JobFactory.create_batch(2, status='published')
+        
+        response = client.get('/api/jobs/')
+        etag = response['ETag']
+        assert response.has_header('Last-Modified')
+        # Two aggregates, plus the ATOMIC_REQUESTS savepoint and its release.
+        with django_assert_num_queries(4):
+            response = client.get('/api/jobs/', headers={'if-none-match': etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert (
+            client.get(
+                '/api/jobs/', {'page_size': 1}, headers={'if-none-match': etag}
+            ).status_code
+            == 200
+        )
+        
+        jobs[0].delete()
+        assert (
+            client.get('/api/jobs/', headers={'if-none-match': etag}).status_code == 200
+        )
+    
+    def test_conditional_get_retrieve(self):
+        client = APIClient()
+        job = JobFactory(status='published')
+        
+        response = client.get(f'/api/jobs/{job.pk}/')
+        last_modified = response['Last-Modified']
+        response = client.get(
+            f'/api/jobs/{job.pk}/', headers={'if-modified-since': last_modified}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        
+        Job.objects.filter(pk=job.pk).update(
+            updated_at=job.updated_at + datetime.timedelta(minutes=1)
+        )
+        invalidate_jobs([job.pk])
+        response = client.get(
+            f'/api/jobs/{job.pk}/', headers={'if-modified-since': last_modified}
+        )
+        assert response.status_code == status.HTTP_200_OK
+    
     def test_apply_to_job(self):
         client = APIClient()
         user = UserFactory()
@@ -64,6 +296,197 @@ class TestJobViewSet:
         })
         
         assert response.status_code == status.HTTP_201_CREATED
+    
+    def test_apply_requires_auth(self):
+        job = JobFactory()
+        
+        response = APIClient().post(
+            f'/api/jobs/{job.pk}/apply/', {'cover_letter': 'Hi'}
+        )
+        
+        assert response.status_code in (
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_403_FORBIDDEN,
+        )
+        assert not JobApplication.objects.exists()
+    
+    def test_apply_twice_returns_existing_application(self):
+        client = APIClient()
+        user = UserFactory()
+        job = JobFactory()
+        client.force_authenticate(user=user)
+        
+        first = client.post(f'/api/jobs/{job.pk}/apply/', {'cover_letter': 'First'})
+        second = client.post(f'/api/jobs/{job.pk}/apply/', {'cover_letter': 'Second'})
+        
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data['id'] == first.data['id']
+        assert second.data['cover_letter'] == 'First'
+        assert second.data['applicant_email'] == user.email
+        assert JobApplication.objects.filter(job=job, applicant=user).count() == 1
+    
+    def test_apply_idempotency_key_replays_response(
+        self, django_capture_on_commit_callbacks
+    ):
+        client = APIClient()
+        user = UserFactory()
+        job = JobFactory()
+        client.force_authenticate(user=user)
+        headers = {'Idempotency-Key': 'apply-1'}
+        
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            first = client.post(
+                f'/api/jobs/{job.pk}/apply/', {'cover_letter': 'Hi'}, headers=headers
+            )
+        assert first.status_code == status.HTTP_201_CREATED
+        # The employer notification and the stored response.
+        assert len(callbacks) == 2
+        
+        retry = client.post(
+            f'/api/jobs/{job.pk}/apply/', {'cover_letter': 'Hi'}, headers=headers
+        )
+        assert retry.status_code == status.HTTP_201_CREATED
+        assert retry['Idempotent-Replayed'] == 'true'
+        assert retry.json() == first.json()
+        
+        reused = client.post(
+            f'/api/jobs/{job.pk}/apply/', {'cover_letter': 'Other'}, headers=headers
+        )
+        assert reused.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        
+        headers = {'Idempotency-Key': 'apply-2'}
+        other_key = client.post(
+            f'/api/jobs/{job.pk}/apply/', {'cover_letter': 'Hi'}, headers=headers
+        )
+        assert other_key.status_code == status.HTTP_200_OK
+        assert 'Idempotent-Replayed' not in other_key
+    
+    def test_apply_idempotency_key_is_per_user(
+        self, django_capture_on_commit_callbacks
+    ):
+        client = APIClient()
+        job = JobFactory()
+        headers = {'Idempotency-Key': 'same-key'}
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            client.force_authenticate(user=UserFactory())
+            client.post(f'/api/jobs/{job.pk}/apply/', {}, headers=headers)
+            client.force_authenticate(user=UserFactory())
+            response = client.post(f'/api/jobs/{job.pk}/apply/', {}, headers=headers)
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        assert 'Idempotent-Replayed' not in response
+        assert JobApplication.objects.filter(job=job).count() == 2
+    
+    def test_apply_idempotency_key_without_cache(self, monkeypatch):
+        client = APIClient()
+        job = JobFactory()
+        client.force_authenticate(user=UserFactory())
+        headers = {'Idempotency-Key': 'cache-down'}
+        # What django-redis returns when IGNORE_EXCEPTIONS hides a failed add().
+        monkeypatch.setattr(idempotency.cache, 'add', lambda *args, **kwargs: None)
+        
+        first = client.post(f'/api/jobs/{job.pk}/apply/', {}, headers=headers)
+        retry = client.post(f'/api/jobs/{job.pk}/apply/', {}, headers=headers)
+        
+        assert first.status_code == status.HTTP_201_CREATED
+        assert retry.status_code == status.HTTP_200_OK
+        assert 'Idempotent-Replayed' not in retry
+    
+    def test_apply_idempotency_key_released_on_rollback(
+        self, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        client = APIClient()
+        job = JobFactory()
+        client.force_authenticate(user=UserFactory())
+        headers = {'Idempotency-Key': 'rolled-back'}
+        
+        def apply_then_roll_back(*args, **kwargs):
+            result = apply_to_job(*args, **kwargs)
+            transaction.set_rollback(True)
+            return result
+        
+        monkeypatch.setattr(views, 'apply_to_job', apply_then_roll_back)
+        with django_capture_on_commit_callbacks(execute=True):
+            rolled_back = client.post(f'/api/jobs/{job.pk}/apply/', {}, headers=headers)
+        monkeypatch.undo()
+        retry = client.post(f'/api/jobs/{job.pk}/apply/', {}, headers=headers)
+        
+        assert rolled_back.status_code == status.HTTP_201_CREATED
+        assert retry.status_code == status.HTTP_201_CREATED
+        assert 'Idempotent-Replayed' not in retry
+        assert JobApplication.objects.filter(job=job).count() == 1
+    
+    def test_facets(self):
+        client = APIClient()
+        JobFactory(title='Python Developer', location='Berlin', status='published')
+        JobFactory(title='Python Developer', location='Berlin', status='draft')
+        
+        response = client.get('/api/jobs/facets/', {'search': 'python'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['location'] == [{'value': 'Berlin', 'count': 1}]
+    
+    def test_suggestions(self):
+        client = APIClient()
+        JobFactory(title='Designer', company_name='Initech', status='published')
+        
+        response = client.get('/api/jobs/suggestions/', {'search': 'Inittech'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['suggestions'] == ['Initech']
+    
+    def test_export_ndjson(self):
+        client = APIClient()
+        category = JobCategoryFactory()
+        jobs = JobFactory.create_batch(3, status='published', category=category)
+        JobFactory(status='published')
+        JobFactory(status='draft', category=category)
+        
+        response = client.get('/api/jobs/export/', {'category': category.pk})
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+        rows = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).splitlines()
+        ]
+        assert [row['id'] for row in rows] == [job.pk for job in reversed(jobs)]
+        assert rows[0]['category']['name'] == category.name
+    
+    def test_export_csv(self):
+        client = APIClient()
+        job = JobFactory(status='published', category=None)
+        
+        response = client.get('/api/jobs/export/', {'format': 'csv'})
+        assert response['Content-Type'] == 'text/csv; charset=utf-8'
+        assert response['Content-Disposition'] == 'attachment; filename="jobs.csv"'
+        rows = list(
+            csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode()))
+        )
+        assert len(rows) == 1
+        assert rows[0]['id'] == str(job.pk)
+        assert rows[0]['category.name'] == ''
+        assert rows[0]['created_by_email'] == job.created_by.email
+    
+    def test_export_since(self):
+        client = APIClient()
+        old, recent = JobFactory.create_batch(2, status='published')
+        Job.objects.filter(pk=old.pk).update(
+            updated_at=timezone.now() - datetime.timedelta(days=2)
+        )
+        
+        since = (timezone.now() - datetime.timedelta(days=1)).isoformat()
+        response = client.get('/api/jobs/export/', {'since': since})
+        rows = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).splitlines()
+        ]
+        assert [row['id'] for row in rows] == [recent.pk]
+    
+    def test_export_invalid_since(self):
+        client = APIClient()
+        
+        response = client.get('/api/jobs/export/', {'since': 'yesterday'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'since' in json.loads(response.content)
 
 
 @pytest.mark.django_db
@@ -80,6 +503,87 @@ class TestJobApplicationViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) == 2
     
+    def test_list_applications_sparse_fields(self):
+        client = APIClient()
+        user = UserFactory()
+        client.force_authenticate(user=user)
+        application = JobApplicationFactory(applicant=user)
+        
+        response = client.get('/api/applications/', {'fields': 'id,job_title,status'})
+        assert response.data['results'] == [
+            {
+                'id': application.pk,
+                'job_title': application.job.title,
+                'status': 'pending',
+            }
+        ]
+    
+    def test_export_applications(self):
+        client = APIClient()
+        user = UserFactory()
+        client.force_authenticate(user=user)
+        application = JobApplicationFactory(applicant=user)
+        JobApplicationFactory()
+        
+        response = client.get('/api/applications/export/', {'format': 'csv'})
+        rows = list(
+            csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode()))
+        )
+        assert [row['id'] for row in rows] == [str(application.pk)]
+        assert rows[0]['job_title'] == application.job.title
+    
+    def test_export_applications_since_includes_reviewed(self):
+        client = APIClient()
+        staff = UserFactory(is_staff=True)
+        client.force_authenticate(user=staff)
+        reviewed, untouched = JobApplicationFactory.create_batch(2)
+        JobApplication.objects.filter(pk__in=[reviewed.pk, untouched.pk]).update(
+            applied_at=timezone.now() - datetime.timedelta(days=2)
+        )
+        JobApplication.objects.filter(pk=reviewed.pk).update(
+            status='reviewed', reviewed_at=timezone.now()
+        )
+        fresh = JobApplicationFactory()
+        
+        since = (timezone.now() - datetime.timedelta(days=1)).isoformat()
+        response = client.get('/api/applications/export/', {'since': since})
+        rows = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).splitlines()
+        ]
+        assert [row['id'] for row in rows] == [reviewed.pk, fresh.pk]
+    
+    def test_conditional_get(self):
+        client = APIClient()
+        user = UserFactory()
+        client.force_authenticate(user=user)
+        application = JobApplicationFactory(applicant=user)
+        
+        etag = client.get('/api/applications/')['ETag']
+        assert (
+            client.get(
+                '/api/applications/', headers={'if-none-match': etag}
+            ).status_code
+            == 304
+        )
+        
+        application.job.title = 'Renamed'
+        application.job.save()
+        assert (
+            client.get(
+                '/api/applications/', headers={'if-none-match': etag}
+            ).status_code
+            == 200
+        )
+        
+        client.force_authenticate(user=UserFactory())
+        assert (
+            client.get(
+                '/api/applications/', headers={'if-none-match': etag}
+            ).status_code
+            == 200
+        )
+    
     def test_review_application_requires_staff(self):
         client = APIClient()
         user = UserFactory()
@@ -91,4 +595,248 @@ class TestJobApplicationViewSet:
         })
         
         assert response.status_code == status.HTTP_403_FORBIDDEN
+    
+    def test_bulk_review_by_ids(self):
+        client = APIClient()
+        client.force_authenticate(user=UserFactory(is_staff=True))
+        selected = JobApplicationFactory.create_batch(2)
+        other = JobApplicationFactory()
+        
+        response = client.post('/api/applications/bulk-review/', {
+            'status': 'accepted', 'ids': [application.pk for application in selected]
+        }, format='json')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'updated': 2}
+        assert set(
+            JobApplication.objects.filter(reviewed_at__isnull=False).values_list(
+                'pk', 'status'
+            )
+        ) == {(application.pk, 'accepted') for application in selected}
+        other.refresh_from_db()
+        assert other.status == 'pending'
+    
+    def test_bulk_review_by_filter(self):
+        client = APIClient()
+        client.force_authenticate(user=UserFactory(is_staff=True))
+        job = JobFactory()
+        JobApplicationFactory.create_batch(2, job=job)
+        JobApplicationFactory(job=job, status='accepted')
+        JobApplicationFactory()
+        
+        response = client.post('/api/applications/bulk-review/', {
+            'status': 'rejected', 'filter': {'job': job.pk, 'status': 'pending'}
+        }, format='json')
+        
+        assert response.data == {'updated': 2}
+        assert JobApplication.objects.filter(status='rejected', job=job).count() == 2
+    
+    def test_bulk_review_validation(self):
+        client = APIClient()
+        client.force_authenticate(user=UserFactory(is_staff=True))
+        
+        for data in (
+            {'status': 'accepted'},
+            {'status': 'accepted', 'ids': [1], 'filter': {'job': 1}},
+            {'status': 'accepted', 'filter': {}},
+            {'status': 'pending', 'ids': [1]},
+            {'status': 'accepted', 'ids': list(range(1, 1002))},
+        ):
+            response = client.post(
+                '/api/applications/bulk-review/', data, format='json'
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST, data
+    
+    def test_bulk_review_requires_staff(self):
+        client = APIClient()
+        client.force_authenticate(user=UserFactory())
+        
+        response = client.post(
+            '/api/applications/bulk-review/',
+            {'status': 'accepted', 'ids': [1]},
+            format='json',
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+    
+    def test_bulk_review_large_selection_is_queued(
+        self, settings, django_capture_on_commit_callbacks
+    ):
+        settings.JOBS_BULK_REVIEW_ASYNC_THRESHOLD = 1
+        settings.CELERY_TASK_ALWAYS_EAGER = True
+        client = APIClient()
+        client.force_authenticate(user=UserFactory(is_staff=True))
+        job = JobFactory()
+        JobApplicationFactory.create_batch(3, job=job)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post('/api/applications/bulk-review/', {
+                'status': 'reviewed', 'filter': {'job': job.pk}
+            }, format='json')
+        
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data['selected'] == 3
+        assert response.data['task_id']
+        assert JobApplication.objects.filter(status='reviewed').count() == 3
+
+
+@pytest.mark.django_db
+class TestJobCategoryViewSet:
+    def test_conditional_get(self):
+        client = APIClient()
+        category = JobCategoryFactory()
+        
+        etag = client.get('/api/categories/')['ETag']
+        assert (
+            client.get('/api/categories/', headers={'if-none-match': etag}).status_code
+            == 304
+        )
+        
+        category.description = 'Updated'
+        category.save()
+        assert (
+            client.get('/api/categories/', headers={'if-none-match': etag}).status_code
+            == 200
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentApply:
+    threads = 8
+    
+    def _apply_concurrently(self, job, user, headers=None):
+        barrier = threading.Barrier(self.threads)
+        
+        def apply():
+            client = APIClient()
+            client.force_authenticate(user=user)
+            try:
+                barrier.wait()
+                return client.post(
+                    f'/api/jobs/{job.pk}/apply/',
+                    {'cover_letter': 'Hi'},
+                    headers=headers,
+                )
+            finally:
+                connection.close()
+        
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            futures = [executor.submit(apply) for _ in range(self.threads)]
+            return [future.result() for future in futures]
+    
+    def test_simultaneous_applies_create_one_application(self):
+        job = JobFactory()
+        user = UserFactory()
+        
+        responses = self._apply_concurrently(job, user)
+        
+        codes = sorted(response.status_code for response in responses)
+        assert codes == [status.HTTP_200_OK] * (self.threads - 1) + [
+            status.HTTP_201_CREATED
+        ]
+        assert len({response.data['id'] for response in responses}) == 1
+        assert JobApplication.objects.filter(job=job, applicant=user).count() == 1
+    
+    def test_simultaneous_retries_with_idempotency_key(self):
+        job = JobFactory()
+        user = UserFactory()
+        
+        responses = self._apply_concurrently(
+            job, user, headers={'Idempotency-Key': 'retry'}
+        )
+        
+        # Retries either replay the stored 201 or find the original still running.
+        codes = [response.status_code for response in responses]
+        assert set(codes) <= {status.HTTP_201_CREATED, status.HTTP_409_CONFLICT}
+        replayed = [
+            response for response in responses if 'Idempotent-Replayed' in response
+        ]
+        assert (
+            len(responses) - len(replayed) - codes.count(status.HTTP_409_CONFLICT) == 1
+        )
+        assert JobApplication.objects.filter(job=job, applicant=user).count() == 1
+
+
+@pytest.fixture
+def async_views():
+    """Rebuild the API routes with JOBS_ASYNC_VIEWS on, as config/asgi.py sets it."""
+    def rebuild():
+        importlib.reload(api_router)
+        importlib.reload(urls)
+        clear_url_caches()
+    
+    with override_settings(JOBS_ASYNC_VIEWS=True):
+        rebuild()
+        yield
+    rebuild()
+
 
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('async_views')
+class TestAsgi:
+    def test_reads_are_async(self):
+        assert iscoroutinefunction(resolve('/api/jobs/').func)
+        assert iscoroutinefunction(resolve('/api/jobs/1/').func)
+        assert not iscoroutinefunction(resolve('/api/jobs/export/').func)
+    
+    def test_dispatch_copy_matches_pinned_drf(self):
+        # AsyncReadMixin._adispatch() follows APIView.dispatch() of this release.
+        assert rest_framework.VERSION == '3.16.1'
+    
+    def test_list_and_retrieve(self):
+        job = JobFactory(status='published')
+        JobFactory(status='draft')
+        
+        @async_to_sync
+        async def get():
+            client = AsyncClient()
+            return await client.get('/api/jobs/'), await client.get(
+                f'/api/jobs/{job.pk}/', {'fields': 'id,title'}
+            )
+        
+        listed, retrieved = get()
+        assert [row['id'] for row in listed.json()['results']] == [job.pk]
+        assert retrieved.json() == {'id': job.pk, 'title': job.title}
+    
+    def test_export_streams(self, monkeypatch):
+        monkeypatch.setattr(NDJSONRenderer, 'batch_size', 1)
+        jobs = JobFactory.create_batch(3, status='published')
+        
+        @async_to_sync
+        async def export():
+            response = await AsyncClient().get('/api/jobs/export/')
+            return response, [chunk async for chunk in response.streaming_content]
+        
+        response, chunks = export()
+        assert response.streaming
+        assert response.is_async
+        assert len(chunks) == 3
+        assert sorted(json.loads(chunk)['id'] for chunk in chunks) == sorted(
+            job.pk for job in jobs
+        )
+    
+    def test_writes_stay_atomic(self, monkeypatch):
+        user = UserFactory()
+        
+        def save_then_fail(self, serializer):
+            serializer.save(created_by=user)
+            raise RuntimeError
+        
+        @async_to_sync
+        async def create():
+            client = AsyncClient(raise_request_exception=False)
+            await client.aforce_login(user)
+            data = {
+                'title': 'Engineer',
+                'description': 'Build things',
+                'company_name': 'Acme',
+                'location': 'Remote',
+            }
+            return await client.post(
+                '/api/jobs/', data, content_type='application/json'
+            )
+        
+        assert create().status_code == status.HTTP_201_CREATED
+        # An error after the INSERT rolls the request back.
+        monkeypatch.setattr(JobViewSet, 'perform_create', save_then_fail)
+        assert create().status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert Job.objects.count() == 1
@@ -0,0 +1,67 @@
+import socketserver
+import threading
+
+import pytest
+
+
+class SMTPStub(socketserver.ThreadingTCPServer):
+    """
+    Minimal SMTP server recording connections and messages.
+    
+    Refuses the first ``failures`` senders.
+    """
+    
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), SMTPHandler)
+        self.connections = 0
+        self.messages = []
+        self.failures = 0
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+    
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply('220 stub')
+        while line := self.rfile.readline().decode().strip():
+            command = line.split(' ', 1)[0].upper()
+            if command in ('EHLO', 'HELO', 'RCPT', 'RSET', 'NOOP'):
+                self.reply('250 OK')
+            elif command == 'MAIL':
+                if server.failures:
+                    server.failures -= 1
+                    self.reply('451 try again later')
+                else:
+                    self.reply('250 OK')
+            elif command == 'DATA':
+                self.reply('354 go ahead')
+                data = []
+                while (data_line := self.rfile.readline()) not in (b'.\r\n', b''):
+                    data.append(data_line)
+                server.messages.append(b''.join(data).decode())
+                self.reply('250 queued')
+            elif command == 'QUIT':
+                self.reply('221 bye')
+                return
+            else:
+                self.reply('502 not implemented')
+
+
+@pytest.fixture
+def smtp_stub(settings):
+    server = SMTPStub()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    settings.EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+    settings.EMAIL_HOST, settings.EMAIL_PORT = server.server_address
+    settings.EMAIL_USE_TLS = settings.EMAIL_USE_SSL = False
+    settings.EMAIL_HOST_USER = settings.EMAIL_HOST_PASSWORD = ''
+    yield server
+    server.shutdown()
+    server.server_close()
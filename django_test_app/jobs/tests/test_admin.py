@@ -27,3 +27,87 @@ class TestJobAdmin:
         admin.save_model(admin_user, job, None, False)
         assert job.created_by == admin_user
 
+
+    def test_changelists_use_estimated_count_paginator(self, admin_client):
+        from django.urls import reverse
+        from django_test_app.jobs.pagination import EstimatedCountPaginator
+        JobFactory()
+        
+        for model in ('job', 'jobapplication'):
+            response = admin_client.get(reverse(f'admin:jobs_{model}_changelist'))
+            assert response.status_code == 200
+            assert isinstance(response.context['cl'].paginator, EstimatedCountPaginator)
+    
+    def test_review_actions_set_reviewed_at(self, admin_client):
+        from django.urls import reverse
+        from django_test_app.jobs.tests.factories import JobApplicationFactory
+        applications = JobApplicationFactory.create_batch(2)
+        
+        response = admin_client.post(reverse('admin:jobs_jobapplication_changelist'), {
+            'action': 'mark_as_accepted',
+            '_selected_action': [application.pk for application in applications],
+        })
+        
+        assert response.status_code == 302
+        for application in applications:
+            application.refresh_from_db()
+            assert application.status == 'accepted'
+            assert application.reviewed_at is not None
+    
+    def test_review_all_matching_applications(
+        self, admin_client, settings, django_capture_on_commit_callbacks
+    ):
+        from django.urls import reverse
+        from django_test_app.jobs.tests.factories import JobApplicationFactory
+        settings.JOBS_BULK_REVIEW_ASYNC_THRESHOLD = 1
+        settings.CELERY_TASK_ALWAYS_EAGER = True
+        applications = JobApplicationFactory.create_batch(3)
+        rejected = JobApplicationFactory(status='rejected')
+        url = reverse('admin:jobs_jobapplication_changelist')
+        # The changelist posts the rows checked on the page along with select_across.
+        data = {
+            'action': 'mark_as_accepted',
+            'select_across': '1',
+            'index': '0',
+            '_selected_action': [applications[0].pk],
+        }
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_client.post(
+                f'{url}?status__exact=pending', data, follow=True
+            )
+        
+        assert 'Marking 3 applications as accepted' in str(
+            next(iter(response.context['messages']))
+        )
+        assert set(
+            JobApplication.objects.exclude(pk=rejected.pk).values_list(
+                'status', flat=True
+            )
+        ) == {'accepted'}
+        rejected.refresh_from_db()
+        assert rejected.status == 'rejected'
+        
+        response = admin_client.post(f'{url}?q=a', data, follow=True)
+        assert 'Too many applications' in str(next(iter(response.context['messages'])))
+    
+    def test_publish_and_close_actions(self, admin_client):
+        from django.urls import reverse
+        jobs = [JobFactory(status='draft'), JobFactory(status='published')]
+        url = reverse('admin:jobs_job_changelist')
+        selected = [job.pk for job in jobs]
+        
+        response = admin_client.post(
+            url,
+            {'action': 'publish_selected', '_selected_action': selected},
+            follow=True,
+        )
+        assert '1 of 2 selected job(s) published.' in [
+            str(message) for message in response.context['messages']
+        ]
+        assert set(Job.objects.values_list('status', flat=True)) == {'published'}
+        
+        admin_client.post(
+            url, {'action': 'close_selected', '_selected_action': selected}
+        )
+        assert set(Job.objects.values_list('status', flat=True)) == {'closed'}
@@ -0,0 +1,114 @@
+import pytest
+from rest_framework.test import APIClient
+from django_test_app.jobs.cache import (
+    cache_stats,
+    get_job,
+    get_job_data,
+    invalidate_jobs,
+    reset_stats,
+)
+from django_test_app.jobs.services import close_job, publish_job
+from django_test_app.jobs.tests.factories import JobFactory
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    reset_stats()
+
+
+@pytest.mark.django_db
+class TestJobCache:
+    def test_hit_after_miss(self, django_assert_num_queries):
+        job = JobFactory()
+        
+        with django_assert_num_queries(1):
+            assert get_job(job.pk) == job
+        with django_assert_num_queries(0):
+            cached = get_job(job.pk)
+            assert cached.category.name == job.category.name
+            assert cached.created_by.email == job.created_by.email
+        assert cache_stats() == {
+            'instance_misses': 1,
+            'misses': 1,
+            'instance_hits': 1,
+            'hits': 1,
+            'hit_ratio': 0.5,
+        }
+    
+    def test_missing_job_not_cached(self, django_assert_num_queries):
+        with django_assert_num_queries(2):
+            assert get_job(0) is None
+            assert get_job(0) is None
+    
+    def test_invalidate(self):
+        job = JobFactory(title='Old')
+        get_job(job.pk)
+        
+        type(job).objects.filter(pk=job.pk).update(title='New')
+        assert get_job(job.pk).title == 'Old'
+        invalidate_jobs([job.pk])
+        assert get_job(job.pk).title == 'New'
+    
+    def test_job_save_invalidates_on_commit(self, django_capture_on_commit_callbacks):
+        job = JobFactory(title='Old')
+        get_job_data(job.pk)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            job.title = 'New'
+            job.save()
+        assert get_job_data(job.pk)['data']['title'] == 'New'
+    
+    def test_category_save_and_delete_invalidate(
+        self, django_capture_on_commit_callbacks
+    ):
+        job = JobFactory()
+        get_job_data(job.pk)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            job.category.name = 'Renamed'
+            job.category.save()
+        assert get_job_data(job.pk)['data']['category']['name'] == 'Renamed'
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            job.category.delete()
+        assert get_job_data(job.pk)['data']['category'] is None
+    
+    def test_publish_and_close_invalidate(self, django_capture_on_commit_callbacks):
+        job = JobFactory(status='draft')
+        assert get_job(job.pk).status == 'draft'
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            publish_job(job.pk)
+        assert get_job(job.pk).status == 'published'
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            close_job(job.pk)
+        assert get_job(job.pk).status == 'closed'
+
+
+@pytest.mark.django_db
+class TestCachedRetrieve:
+    def test_served_from_cache(self, django_assert_num_queries):
+        client = APIClient()
+        job = JobFactory(status='published')
+        
+        expected = client.get(f'/api/jobs/{job.pk}/').data
+        # Only the ATOMIC_REQUESTS savepoint and its release.
+        with django_assert_num_queries(2):
+            response = client.get(f'/api/jobs/{job.pk}/')
+        assert response.data == expected
+        with django_assert_num_queries(2):
+            response = client.get(f'/api/jobs/{job.pk}/', {'fields': 'id,status'})
+        assert response.data == {'id': job.pk, 'status': 'published'}
+    
+    def test_status_filter_checked(self):
+        client = APIClient()
+        job = JobFactory(status='draft')
+        
+        assert client.get(f'/api/jobs/{job.pk}/').status_code == 404
+        assert (
+            client.get(f'/api/jobs/{job.pk}/', {'status': 'draft'}).data['id'] == job.pk
+        )
+    
+    def test_invalid_pk(self):
+        assert APIClient().get('/api/jobs/abc/').status_code == 404
@@ -0,0 +1,130 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django_test_app.jobs.imports import import_jobs, read_rows, validate_rows
+from django_test_app.jobs.models import Job
+from django_test_app.jobs.search_index import InvertedIndex
+from django_test_app.jobs.tests.factories import JobCategoryFactory
+from django_test_app.users.tests.factories import UserFactory
+
+
+def job_row(**overrides):
+    return {
+        'title': 'Backend Engineer',
+        'description': 'Build APIs',
+        'company_name': 'Acme',
+        'location': 'Remote',
+        'salary_min': '40000',
+        'salary_max': '60000',
+        'status': 'published',
+        **overrides,
+    }
+
+
+class TestReadRows:
+    def test_csv_drops_empty_cells(self):
+        stream = io.StringIO('title,salary_min,salary_max\nEngineer,,60000\n')
+        
+        assert list(read_rows(stream, 'csv')) == [
+            {'title': 'Engineer', 'salary_max': '60000'}
+        ]
+    
+    def test_ndjson_skips_blank_lines(self):
+        stream = io.StringIO('{"title": "A"}\n\n{"title": "B"}\n')
+        
+        assert list(read_rows(stream, 'ndjson')) == [{'title': 'A'}, {'title': 'B'}]
+
+
+@pytest.mark.django_db
+class TestValidateRows:
+    def test_salary_rule_and_field_errors(self):
+        rows = [job_row(), job_row(salary_min='70000'), job_row(title='')]
+        
+        valid, errors = validate_rows(rows, start=10)
+        assert [position for position, _data in valid] == [10]
+        assert errors == [
+            {
+                'index': 11,
+                'errors': {
+                    'salary_max': ['Maximum salary must be greater than minimum salary']
+                },
+            },
+            {'index': 12, 'errors': {'title': ['This field may not be blank.']}},
+        ]
+    
+    def test_unknown_category(self):
+        category = JobCategoryFactory()
+        
+        missing = category.pk + 1000
+        
+        valid, errors = validate_rows(
+            [job_row(category_id=category.pk), job_row(category_id=missing)]
+        )
+        assert len(valid) == 1
+        assert errors == [
+            {
+                'index': 1,
+                'errors': {
+                    'category_id': [f'Invalid pk "{missing}" - object does not exist.']
+                },
+            }
+        ]
+    
+    def test_surrogates_rejected(self):
+        valid, errors = validate_rows([job_row(title='bad \ud800')])
+        
+        assert valid == []
+        assert list(errors[0]['errors']) == ['title']
+
+
+@pytest.mark.django_db
+class TestImportJobs:
+    @pytest.mark.parametrize('method', ['copy', 'bulk_create'])
+    def test_import(self, method):
+        user = UserFactory()
+        category = JobCategoryFactory()
+        rows = [
+            job_row(category_id=category.pk),
+            job_row(salary_min='90000'),
+            job_row(status='draft', title='Draft'),
+        ]
+        
+        result = import_jobs(iter(rows), user, batch_size=2, method=method)
+        assert result.created == 2
+        assert [error['index'] for error in result.errors] == [1]
+        published = Job.objects.get(status='published')
+        assert published.created_by == user
+        assert published.category == category
+        assert published.salary_max == Decimal('60000.00')
+        assert published.published_at is not None
+        assert Job.objects.get(status='draft').published_at is None
+    
+    def test_updates_search_index(
+        self, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        index = InvertedIndex()
+        monkeypatch.setattr('django_test_app.jobs.search_index._index', index)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            import_jobs([job_row(title='Zookeeper')], UserFactory())
+        assert index.search('zookeeper') == [Job.objects.get().pk]
+
+
+@pytest.mark.django_db
+def test_import_jobs_command(tmp_path):
+    user = UserFactory()
+    path = tmp_path / 'jobs.ndjson'
+    path.write_text(
+        '\n'.join(json.dumps(row) for row in [job_row(), job_row(location='')])
+    )
+    stdout, stderr = io.StringIO(), io.StringIO()
+    
+    call_command(
+        'import_jobs', str(path), created_by=user.email, stdout=stdout, stderr=stderr
+    )
+    assert Job.objects.count() == 1
+    assert 'Imported 1 of 2 jobs' in stdout.getvalue()
+    assert stderr.getvalue().startswith('row 1: {"location"')
@@ -0,0 +1,129 @@
+import pytest
+from django.core import mail
+from django.core.cache import cache
+from django.db import transaction
+from django_test_app.jobs.models import JobApplication, OutboxEmail
+from django_test_app.jobs.notifications import send_digests, send_notifications
+from django_test_app.jobs.outbox import dispatch
+from django_test_app.jobs.services import apply_to_job
+from django_test_app.jobs.tasks import send_digests_task
+from django_test_app.jobs.tests.factories import JobFactory, JobApplicationFactory
+from django_test_app.users.tests.factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestSendNotifications:
+    def test_queues_once_per_application(self):
+        application = JobApplicationFactory()
+        JobApplication.objects.update(notified_at=None)
+        OutboxEmail.objects.all().delete()
+        
+        assert send_notifications([application.pk]) == 1
+        assert send_notifications([application.pk]) == 0
+        
+        email = OutboxEmail.objects.get()
+        assert email.recipients == [application.job.created_by.email]
+        assert email.subject == f'New application for {application.job.title}'
+        application.refresh_from_db()
+        assert application.notified_at is not None
+    
+    def test_new_applications_are_sent_over_one_connection(self, smtp_stub):
+        # Creating an application queues its email right away.
+        JobApplicationFactory.create_batch(3)
+        
+        assert dispatch() == (3, 0)
+        
+        assert smtp_stub.connections == 1
+        assert len(smtp_stub.messages) == 3
+
+
+@pytest.mark.django_db
+class TestDigests:
+    @pytest.fixture(autouse=True)
+    def _digest_mode(self, settings):
+        settings.JOBS_NOTIFICATION_DIGEST_WINDOW = 60
+    
+    def test_one_email_per_employer(self, smtp_stub):
+        employer = UserFactory()
+        for job in JobFactory.create_batch(2, created_by=employer):
+            JobApplicationFactory(job=job)
+        single = JobApplicationFactory()
+        
+        assert send_digests() == 3
+        assert dispatch() == (2, 0)
+        
+        assert smtp_stub.connections == 1
+        digest = next(
+            message for message in smtp_stub.messages if employer.email in message
+        )
+        assert 'Subject: 2 new applications for your jobs' in digest
+        assert any(
+            f'Subject: New application for {single.job.title}' in message
+            for message in smtp_stub.messages
+        )
+        assert send_digests() == 0
+    
+    def test_batches(self):
+        JobApplicationFactory.create_batch(3)
+        
+        assert send_digests(batch_size=2) == 2
+        assert send_digests(batch_size=2) == 1
+
+
+@pytest.mark.django_db
+class TestQueueApplicationNotification:
+    def test_apply_sends_after_commit(self, django_capture_on_commit_callbacks):
+        job = JobFactory()
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            apply_to_job(job, UserFactory())
+            assert OutboxEmail.objects.filter(status='pending').count() == 1
+            assert mail.outbox == []
+        
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == [job.created_by.email]
+        assert OutboxEmail.objects.get().status == 'sent'
+    
+    def test_rolled_back_apply_queues_nothing(self, django_capture_on_commit_callbacks):
+        job = JobFactory()
+        
+        def apply_and_roll_back():
+            with transaction.atomic():
+                apply_to_job(job, UserFactory())
+                raise RuntimeError
+        
+        with (
+            django_capture_on_commit_callbacks(execute=True),
+            pytest.raises(RuntimeError),
+        ):
+            apply_and_roll_back()
+        
+        assert not OutboxEmail.objects.exists()
+        assert mail.outbox == []
+    
+    def test_digest_mode_coalesces_a_burst(
+        self, settings, django_capture_on_commit_callbacks
+    ):
+        settings.JOBS_NOTIFICATION_DIGEST_WINDOW = 60
+        job = JobFactory()
+        
+        with django_capture_on_commit_callbacks() as callbacks:
+            for _ in range(3):
+                apply_to_job(job, UserFactory())
+        assert not OutboxEmail.objects.exists()
+        # A digest is already scheduled for this window: the burst is merged into it.
+        scheduled_key = send_digests_task.coalesce_cache_key((), {})
+        cache.set(scheduled_key, value=True)
+        for callback in callbacks:
+            callback()
+        assert not OutboxEmail.objects.exists()
+        
+        # Tests run tasks eagerly, ignoring the countdown, so scheduling the digest
+        # queues it.
+        cache.delete(scheduled_key)
+        callbacks[0]()
+        
+        email = OutboxEmail.objects.get()
+        assert email.recipients == [job.created_by.email]
+        assert email.subject == '3 new applications for your jobs'
+        assert not JobApplication.objects.filter(notified_at__isnull=True).exists()
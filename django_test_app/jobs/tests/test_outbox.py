@@ -0,0 +1,223 @@
+import datetime
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+from kombu.exceptions import OperationalError
+from rest_framework.test import APIClient
+from django_test_app.jobs import outbox, tasks
+from django_test_app.jobs.models import OutboxEmail
+from django_test_app.jobs.outbox import dispatch, drain, enqueue, outbox_metrics
+from django_test_app.jobs.services import send_application_notification
+from django_test_app.jobs.tests.factories import JobApplicationFactory, JobFactory
+from django_test_app.users.tests.factories import UserFactory
+
+
+def messages(count):
+    return [
+        EmailMessage(
+            subject=f'Message {number}',
+            body='Hello',
+            from_email='noreply@example.com',
+            to=['a@example.com'],
+        )
+        for number in range(count)
+    ]
+
+
+@pytest.mark.django_db
+class TestEnqueue:
+    def test_dispatches_after_commit(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            enqueue(messages(2))
+            assert mail.outbox == []
+        
+        assert sorted(message.subject for message in mail.outbox) == [
+            'Message 0',
+            'Message 1',
+        ]
+        assert set(OutboxEmail.objects.values_list('status', flat=True)) == {'sent'}
+    
+    def test_broker_outage_keeps_the_rows(
+        self, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        def unavailable():
+            msg = 'broker unavailable'
+            raise OperationalError(msg)
+        
+        monkeypatch.setattr(tasks.dispatch_outbox_task, 'delay', unavailable)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            enqueue(messages(1))
+        
+        assert OutboxEmail.objects.get().status == 'pending'
+        assert dispatch() == (1, 0)
+
+
+@pytest.mark.django_db
+class TestDispatch:
+    def test_one_connection_per_batch(self, smtp_stub, settings):
+        settings.JOBS_OUTBOX_BATCH_SIZE = 3
+        enqueue(messages(5))
+        
+        assert dispatch() == (3, 0)
+        assert smtp_stub.connections == 1
+        assert drain() == (2, 0)
+        assert smtp_stub.connections == 2
+        assert len(smtp_stub.messages) == 5
+        assert drain() == (0, 0)
+    
+    def test_refused_message_is_retried_later(self, smtp_stub):
+        enqueue(messages(3))
+        smtp_stub.failures = 1
+        
+        assert dispatch() == (2, 1)
+        
+        retry = OutboxEmail.objects.get(status='pending')
+        assert retry.attempts == 1
+        assert '451' in retry.last_error
+        assert retry.available_at > timezone.now()
+        assert dispatch() == (0, 0)
+        
+        OutboxEmail.objects.update(available_at=timezone.now())
+        assert dispatch() == (1, 0)
+        assert len(smtp_stub.messages) == 3
+    
+    def test_unreachable_server_releases_the_batch(self, smtp_stub):
+        enqueue(messages(3))
+        smtp_stub.shutdown()
+        smtp_stub.server_close()
+        
+        assert dispatch() == (0, 1)
+        
+        assert OutboxEmail.objects.filter(attempts=0, status='pending').count() == 2
+    
+    def test_gives_up_after_max_attempts(self, smtp_stub, settings):
+        settings.JOBS_OUTBOX_MAX_ATTEMPTS = 2
+        enqueue(messages(1))
+        smtp_stub.failures = 2
+        
+        dispatch()
+        OutboxEmail.objects.update(available_at=timezone.now())
+        dispatch()
+        
+        email = OutboxEmail.objects.get()
+        assert (email.status, email.attempts) == ('failed', 2)
+
+    
+    def test_unbuildable_message_does_not_hold_up_the_batch(self):
+        enqueue(messages(1))
+        job = JobFactory(title='Engineer\nBcc: everyone@example.com')
+        send_application_notification(JobApplicationFactory(job=job).pk)
+        enqueue(messages(1))
+        
+        assert dispatch() == (2, 1)
+        
+        assert [message.subject for message in mail.outbox] == [
+            'Message 0',
+            'Message 0',
+        ]
+        bad = OutboxEmail.objects.get(status='pending')
+        assert bad.attempts == 1
+        assert 'BadHeaderError' in bad.last_error
+        assert dispatch() == (0, 0)
+    
+    def test_sent_rows_are_recorded_when_interrupted(self, monkeypatch):
+        enqueue(messages(3))
+        build = outbox._message  # noqa: SLF001
+        
+        def interrupt_second(row):
+            if row.subject == 'Message 1':
+                msg = 'interrupted'
+                raise RuntimeError(msg)
+            return build(row)
+        
+        monkeypatch.setattr(outbox, '_message', interrupt_second)
+        with pytest.raises(RuntimeError):
+            dispatch()
+        
+        assert dict(OutboxEmail.objects.values_list('subject', 'status')) == {
+            'Message 0': 'sent', 'Message 1': 'pending', 'Message 2': 'pending'
+        }
+        assert OutboxEmail.objects.get(subject='Message 1').attempts == 1
+        assert OutboxEmail.objects.get(subject='Message 2').attempts == 0
+
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentDispatchers:
+    def test_each_email_is_sent_once(self, settings):
+        settings.JOBS_OUTBOX_BATCH_SIZE = 5
+        # Skips enqueue(): outside a test transaction its dispatch request would run at
+        # once.
+        OutboxEmail.objects.bulk_create(
+            [
+                OutboxEmail(
+                    subject=message.subject,
+                    body=message.body,
+                    from_email=message.from_email,
+                    recipients=message.to,
+                )
+                for message in messages(60)
+            ]
+        )
+        barrier = threading.Barrier(4)
+        
+        def dispatcher():
+            try:
+                barrier.wait()
+                return drain()
+            finally:
+                connection.close()
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: dispatcher(), range(4)))
+        
+        assert sum(sent for sent, _failed in results) == 60
+        assert sorted(message.subject for message in mail.outbox) == sorted(
+            f'Message {n}' for n in range(60)
+        )
+        assert not OutboxEmail.objects.exclude(status='sent').exists()
+
+
+@pytest.mark.django_db
+class TestMetrics:
+    def test_depth_and_throughput(self):
+        enqueue(messages(3))
+        dispatch(batch_size=1)
+        OutboxEmail.objects.filter(status='pending').update(
+            available_at=timezone.now() - datetime.timedelta(seconds=30)
+        )
+        OutboxEmail.objects.filter(pk=OutboxEmail.objects.filter(status='pending').first().pk).update(
+            status='failed'
+        )
+        
+        metrics = outbox_metrics(window=60)
+        
+        assert metrics['pending'] == metrics['due'] == 1
+        assert metrics['failed'] == 1
+        assert metrics['sent_last_window'] == metrics['sent_per_minute'] == 1
+        assert metrics['oldest_due_seconds'] >= 30
+    
+    def test_api_is_for_staff(self):
+        client = APIClient()
+        client.force_authenticate(user=UserFactory())
+        assert client.get('/api/outbox/metrics/').status_code == 403
+        
+        client.force_authenticate(user=UserFactory(is_staff=True))
+        response = client.get('/api/outbox/metrics/')
+        assert response.status_code == 200
+        assert response.data['pending'] == 0
+    
+    def test_command(self):
+        enqueue(messages(2))
+        stdout = io.StringIO()
+        
+        call_command('dispatch_outbox', '--once', stdout=stdout)
+        
+        assert 'Sent 2, failed 0' in stdout.getvalue()
+        assert len(mail.outbox) == 2
@@ -0,0 +1,141 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.utils import timezone
+from django_test_app.jobs.models import Job
+from django_test_app.jobs.pagination import (
+    EstimatedCountPaginator,
+    InvalidCursor,
+    apaginate_keyset,
+    decode_cursor,
+    encode_cursor,
+    estimate_count,
+    keyset_ordering,
+    paginate_keyset,
+    planner_estimate,
+)
+from django_test_app.jobs.services import search_jobs
+from django_test_app.jobs.tests.factories import JobFactory
+
+
+class TestCursor:
+    def test_round_trip_keeps_microseconds(self):
+        now = timezone.now().replace(microsecond=123456)
+        values, reverse = decode_cursor(encode_cursor([now, 7], reverse=True))
+        assert values == [now.isoformat(), 7]
+        assert reverse is True
+    
+    def test_invalid(self):
+        with pytest.raises(InvalidCursor):
+            decode_cursor('not-a-cursor')
+
+
+class TestKeysetOrdering:
+    def test_appends_pk_tiebreaker(self):
+        assert keyset_ordering(Job.objects.all()) == [
+            ('created_at', True),
+            ('id', True),
+        ]
+    
+    def test_uses_queryset_ordering(self):
+        assert keyset_ordering(Job.objects.order_by('title')) == [
+            ('title', False),
+            ('id', False),
+        ]
+
+
+@pytest.mark.django_db
+class TestPaginateKeyset:
+    def test_walks_forward_and_back(self):
+        created_at = timezone.now()
+        jobs = JobFactory.create_batch(5)
+        # Identical timestamps must still be split by id.
+        Job.objects.update(created_at=created_at)
+        expected = sorted(job.pk for job in jobs)[::-1]
+        
+        first = paginate_keyset(Job.objects.all(), per_page=2)
+        second = paginate_keyset(Job.objects.all(), first.next_cursor, per_page=2)
+        third = paginate_keyset(Job.objects.all(), second.next_cursor, per_page=2)
+        
+        assert [job.pk for page in (first, second, third) for job in page] == expected
+        assert not first.has_previous()
+        assert not third.has_next()
+        
+        back = paginate_keyset(Job.objects.all(), second.previous_cursor, per_page=2)
+        assert [job.pk for job in back] == [job.pk for job in first]
+        assert not back.has_previous()
+        assert back.next_cursor == first.next_cursor
+    
+    def test_keeps_search_rank_order(self):
+        description_match = JobFactory(
+            title='Backend Engineer', description='Some Python scripting'
+        )
+        title_match = JobFactory(title='Python Engineer', description='Backend work')
+        queryset = search_jobs('python')
+        
+        first = paginate_keyset(queryset, per_page=1)
+        second = paginate_keyset(queryset, first.next_cursor, per_page=1)
+        assert list(first) == [title_match]
+        assert list(second) == [description_match]
+    
+    def test_mismatched_cursor(self):
+        with pytest.raises(InvalidCursor):
+            paginate_keyset(Job.objects.all(), encode_cursor([1]))
+    
+    def test_cursor_values_of_the_wrong_type(self):
+        with pytest.raises(InvalidCursor):
+            paginate_keyset(Job.objects.all(), encode_cursor(['x', 'y']))
+    
+    def test_async_pages_match(self):
+        JobFactory.create_batch(5)
+        first = paginate_keyset(Job.objects.values('id', 'created_at'), per_page=2)
+        
+        page = async_to_sync(apaginate_keyset)(
+            Job.objects.values('id', 'created_at'), first.next_cursor, per_page=2
+        )
+        
+        assert page == paginate_keyset(
+            Job.objects.values('id', 'created_at'), first.next_cursor, per_page=2
+        )
+        assert page.has_previous()
+        assert page.has_next()
+
+
+@pytest.mark.django_db
+class TestEstimateCount:
+    def test_exact_below_threshold(self, django_assert_num_queries):
+        JobFactory.create_batch(3)
+        
+        with django_assert_num_queries(2):
+            assert estimate_count(Job.objects.all()) == 3
+    
+    def test_planner_estimate_above_threshold(
+        self, settings, django_assert_num_queries
+    ):
+        settings.JOBS_EXACT_COUNT_THRESHOLD = 0
+        JobFactory.create_batch(3)
+        queryset = Job.objects.filter(status='published')
+        expected = planner_estimate(queryset)
+        
+        with django_assert_num_queries(1):
+            assert estimate_count(queryset) == expected
+    
+    def test_cached_exact_count_above_threshold(
+        self, settings, django_assert_num_queries
+    ):
+        from django.core.cache import cache
+        cache.clear()
+        settings.JOBS_EXACT_COUNT_THRESHOLD = 0
+        settings.JOBS_COUNT_CACHE_TIMEOUT = 60
+        JobFactory.create_batch(3)
+        
+        assert estimate_count(Job.objects.all()) == 3
+        JobFactory()
+        with django_assert_num_queries(1):
+            assert estimate_count(Job.objects.all()) == 3
+    
+    def test_paginator(self):
+        JobFactory.create_batch(3)
+        
+        paginator = EstimatedCountPaginator(Job.objects.all(), 2)
+        assert paginator.count == 3
+        assert paginator.num_pages == 2
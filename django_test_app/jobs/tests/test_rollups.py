@@ -0,0 +1,189 @@
+import datetime
+
+import pytest
+from rest_framework.test import APIClient
+from django_test_app.jobs.models import (
+    DailyApplicationRollup, HourlyApplicationRollup, JobApplication, RollupWatermark
+)
+from django_test_app.jobs.rollups import application_series, rollup_applications
+from django_test_app.jobs.tasks import rollup_applications_task
+from django_test_app.jobs.tests.factories import (
+    JobFactory,
+    JobApplicationFactory,
+    JobCategoryFactory,
+)
+from django_test_app.users.tests.factories import UserFactory
+
+
+NOON = datetime.datetime(2026, 3, 10, 12, 0, tzinfo=datetime.UTC)
+
+
+def apply_at(job, applied_at, count=1):
+    for _ in range(count):
+        application = JobApplicationFactory(job=job)
+        JobApplication.objects.filter(pk=application.pk).update(applied_at=applied_at)
+
+
+@pytest.mark.django_db
+class TestRollupApplications:
+    def test_buckets_by_hour_and_day(self):
+        job = JobFactory(company_name='Acme')
+        apply_at(job, NOON, count=2)
+        apply_at(job, NOON + datetime.timedelta(minutes=30))
+        apply_at(job, NOON + datetime.timedelta(hours=1))
+        
+        assert rollup_applications(
+            until=NOON + datetime.timedelta(days=1)
+        ) == NOON + datetime.timedelta(days=1)
+        
+        hourly = HourlyApplicationRollup.objects.order_by('bucket')
+        assert [(row.bucket, row.applications) for row in hourly] == [
+            (NOON, 3), (NOON + datetime.timedelta(hours=1), 1)
+        ]
+        daily = DailyApplicationRollup.objects.get()
+        assert (daily.bucket, daily.applications, daily.company_name) == (
+            NOON.date(),
+            4,
+            'Acme',
+        )
+        assert daily.category_id == job.category_id
+    
+    def test_only_processes_rows_after_the_watermark(self):
+        job = JobFactory()
+        apply_at(job, NOON)
+        rollup_applications(until=NOON + datetime.timedelta(minutes=10))
+        
+        apply_at(job, NOON + datetime.timedelta(minutes=20), count=2)
+        rollup_applications(until=NOON + datetime.timedelta(minutes=30))
+        # Re-running up to the same watermark is a no-op.
+        rollup_applications(until=NOON + datetime.timedelta(minutes=30))
+        
+        assert HourlyApplicationRollup.objects.get().applications == 3
+        assert RollupWatermark.objects.get().position == NOON + datetime.timedelta(
+            minutes=30
+        )
+    
+    def test_default_leaves_recent_rows_for_the_next_run(self, settings):
+        settings.JOBS_ROLLUP_LAG = 3600
+        JobApplicationFactory()
+        
+        rollup_applications()
+        
+        assert not HourlyApplicationRollup.objects.exists()
+    
+    def test_task_is_scheduled(self, settings):
+        settings.CELERY_TASK_ALWAYS_EAGER = True
+        assert rollup_applications_task.name in {
+            entry['task'] for entry in settings.CELERY_BEAT_SCHEDULE.values()
+        }
+        JobApplicationFactory()
+        JobApplication.objects.update(applied_at=NOON)
+        
+        rollup_applications_task.delay()
+        
+        assert DailyApplicationRollup.objects.get().applications == 1
+
+
+@pytest.mark.django_db
+class TestApplicationSeries:
+    def test_groups_and_ranges(self):
+        category = JobCategoryFactory(name='Engineering')
+        first = JobFactory(category=category, company_name='Acme')
+        second = JobFactory(category=category, company_name='Globex')
+        apply_at(first, NOON, count=2)
+        apply_at(second, NOON)
+        apply_at(second, NOON + datetime.timedelta(days=1))
+        apply_at(second, NOON + datetime.timedelta(days=5))
+        rollup_applications(until=NOON + datetime.timedelta(days=10))
+        
+        start, end = (
+            NOON - datetime.timedelta(hours=1),
+            NOON + datetime.timedelta(days=1, hours=1),
+        )
+        assert application_series('day', start, end) == [
+            {'bucket': NOON.date(), 'applications': 3},
+            {'bucket': (NOON + datetime.timedelta(days=1)).date(), 'applications': 1},
+        ]
+        assert application_series(
+            'hour', start, NOON + datetime.timedelta(hours=1), group_by='company'
+        ) == [
+            {'bucket': NOON, 'company': 'Acme', 'applications': 2},
+            {'bucket': NOON, 'company': 'Globex', 'applications': 1},
+        ]
+        assert application_series('day', start, end, group_by='category') == [
+            {
+                'bucket': NOON.date(),
+                'category': category.pk,
+                'category_name': 'Engineering',
+                'applications': 3,
+            },
+            {
+                'bucket': (NOON + datetime.timedelta(days=1)).date(),
+                'category': category.pk,
+                'category_name': 'Engineering',
+                'applications': 1,
+            },
+        ]
+        assert application_series('day', start, end, filters={'job_id': first.pk}) == [
+            {'bucket': NOON.date(), 'applications': 2},
+        ]
+
+
+@pytest.mark.django_db
+class TestApplicationAnalyticsAPI:
+    url = '/api/analytics/applications/'
+    
+    def test_returns_own_jobs_only(self):
+        owner = UserFactory()
+        mine = JobFactory(created_by=owner)
+        apply_at(mine, NOON)
+        apply_at(JobFactory(), NOON, count=3)
+        rollup_applications(until=NOON + datetime.timedelta(hours=1))
+        client = APIClient()
+        client.force_authenticate(user=owner)
+        
+        params = {
+            'start': '2026-03-10T00:00:00Z',
+            'end': '2026-03-11T00:00:00Z',
+            'group_by': 'job',
+        }
+        response = client.get(self.url, params)
+        
+        assert response.status_code == 200
+        assert response.data['results'] == [
+            {
+                'bucket': NOON.date(),
+                'job': mine.pk,
+                'job_title': mine.title,
+                'applications': 1,
+            }
+        ]
+        
+        client.force_authenticate(user=UserFactory(is_staff=True))
+        response = client.get(
+            self.url,
+            {'start': params['start'], 'end': params['end'], 'granularity': 'hour'},
+        )
+        assert response.data['results'] == [{'bucket': NOON, 'applications': 4}]
+    
+    def test_validation(self):
+        client = APIClient()
+        assert client.get(self.url).status_code in (401, 403)
+        
+        client.force_authenticate(user=UserFactory())
+        assert client.get(self.url).status_code == 200
+        assert client.get(self.url, {'granularity': 'minute'}).status_code == 400
+        response = client.get(
+            self.url, {'start': '2026-03-10T00:00:00Z', 'end': '2026-03-09T00:00:00Z'}
+        )
+        assert response.status_code == 400
+        response = client.get(
+            self.url,
+            {
+                'granularity': 'hour',
+                'start': '2026-01-01T00:00:00Z',
+                'end': '2026-03-01T00:00:00Z',
+            },
+        )
+        assert response.status_code == 400
+
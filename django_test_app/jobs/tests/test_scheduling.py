@@ -0,0 +1,155 @@
+import datetime
+import threading
+
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from django_test_app.jobs.cache import get_job
+from django_test_app.jobs.models import Job
+from django_test_app.jobs.scheduling import (
+    close_expired_jobs,
+    publish_due_jobs,
+    run_job_schedule,
+)
+from django_test_app.jobs.tasks import run_job_schedule_task
+from django_test_app.jobs.tests.factories import JobFactory
+from django_test_app.users.tests.factories import UserFactory
+
+
+NOW = datetime.datetime(2026, 5, 1, 9, 0, tzinfo=datetime.UTC)
+HOUR = datetime.timedelta(hours=1)
+
+
+def statuses():
+    return dict(Job.objects.values_list('title', 'status'))
+
+
+@pytest.mark.django_db
+class TestPublishDueJobs:
+    def test_publishes_due_drafts(self):
+        due = JobFactory(title='due', status='draft', publish_at=NOW - HOUR)
+        JobFactory(title='later', status='draft', publish_at=NOW + HOUR)
+        JobFactory(title='unscheduled', status='draft')
+        JobFactory(title='closed', status='closed', publish_at=NOW - HOUR)
+        
+        assert publish_due_jobs(NOW) == [due.pk]
+        
+        assert statuses() == {
+            'due': 'published',
+            'later': 'draft',
+            'unscheduled': 'draft',
+            'closed': 'closed',
+        }
+        due.refresh_from_db()
+        assert due.published_at == due.updated_at == NOW
+    
+    def test_updates_in_chunks(self, settings):
+        settings.JOBS_SCHEDULE_CHUNK_SIZE = 2
+        JobFactory.create_batch(5, status='draft', publish_at=NOW - HOUR)
+        
+        with CaptureQueriesContext(connection) as queries:
+            published = publish_due_jobs(NOW)
+        
+        assert len(published) == 5
+        assert len([query for query in queries if 'UPDATE' in query['sql']]) == 3
+        assert not Job.objects.filter(status='draft').exists()
+    
+    def test_invalidates_cached_jobs(self, django_capture_on_commit_callbacks):
+        job = JobFactory(status='draft', publish_at=NOW - HOUR)
+        assert get_job(job.pk).status == 'draft'
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            publish_due_jobs(NOW)
+        
+        assert get_job(job.pk).status == 'published'
+
+
+@pytest.mark.django_db
+class TestCloseExpiredJobs:
+    def test_closes_expired_jobs(self):
+        published = JobFactory(
+            title='published', status='published', expires_at=NOW - HOUR
+        )
+        draft = JobFactory(title='draft', status='draft', expires_at=NOW)
+        JobFactory(title='open', status='published', expires_at=NOW + HOUR)
+        
+        assert sorted(close_expired_jobs(NOW)) == sorted([published.pk, draft.pk])
+        
+        assert statuses() == {
+            'published': 'closed',
+            'draft': 'closed',
+            'open': 'published',
+        }
+    
+    def test_expired_draft_is_never_published(self):
+        job = JobFactory(
+            status='draft', publish_at=NOW - 2 * HOUR, expires_at=NOW - HOUR
+        )
+        
+        assert run_job_schedule(NOW) == {'published': 0, 'closed': 1}
+        
+        job.refresh_from_db()
+        assert (job.status, job.published_at) == ('closed', None)
+    
+    def test_task_is_scheduled(self, settings):
+        assert run_job_schedule_task.name in {
+            entry['task'] for entry in settings.CELERY_BEAT_SCHEDULE.values()
+        }
+        JobFactory(status='draft', publish_at=timezone.now() - HOUR)
+        JobFactory(status='published', expires_at=timezone.now() - HOUR)
+        
+        assert run_job_schedule_task.delay().get() == {'published': 1, 'closed': 1}
+
+
+@pytest.mark.django_db(transaction=True)
+class TestLockedJobs:
+    def test_locked_rows_are_left_for_the_next_run(self):
+        locked = JobFactory(status='draft', publish_at=NOW - HOUR)
+        free = JobFactory(status='draft', publish_at=NOW - HOUR)
+        acquired, release = threading.Event(), threading.Event()
+        
+        def edit():
+            try:
+                with transaction.atomic():
+                    Job.objects.select_for_update().get(pk=locked.pk)
+                    acquired.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+        
+        thread = threading.Thread(target=edit)
+        thread.start()
+        acquired.wait(10)
+        try:
+            assert publish_due_jobs(NOW) == [free.pk]
+        finally:
+            release.set()
+            thread.join()
+        
+        assert publish_due_jobs(NOW) == [locked.pk]
+
+
+@pytest.mark.django_db
+class TestScheduleFields:
+    def test_expiry_must_follow_publish_time(self):
+        client = APIClient()
+        client.force_authenticate(user=UserFactory())
+        data = {
+            'title': 'Engineer',
+            'description': 'Build things',
+            'company_name': 'Acme',
+            'location': 'Remote',
+            'publish_at': '2026-05-02T09:00:00Z',
+            'expires_at': '2026-05-01T09:00:00Z',
+        }
+        
+        response = client.post('/api/jobs/', data)
+        assert response.status_code == 400
+        assert 'expires_at' in response.data
+        
+        data['expires_at'] = '2026-06-01T09:00:00Z'
+        response = client.post('/api/jobs/', data)
+        assert response.status_code == 201
+        assert response.data['publish_at'] == '2026-05-02T09:00:00Z'
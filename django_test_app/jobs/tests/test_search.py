@@ -0,0 +1,162 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django_test_app.jobs.models import Job
+from django_test_app.jobs import search_index
+from django_test_app.jobs.search import (
+    ContainsSearchBackend,
+    FullTextSearchBackend,
+    InvertedIndexSearchBackend,
+    TrigramSearchBackend,
+    get_search_backend,
+)
+from django_test_app.jobs.tests.factories import JobFactory
+
+
+@pytest.mark.django_db
+class TestFullTextSearchBackend:
+    def test_matches_stemmed_terms(self):
+        job = JobFactory(title='Senior Python Developers', description='Backend work')
+        JobFactory(title='Java Developer', description='Backend work')
+        
+        results = FullTextSearchBackend().search(Job.objects.all(), 'python developer')
+        assert list(results) == [job]
+    
+    def test_title_outranks_company_and_description(self):
+        in_description = JobFactory(
+            title='Engineer', company_name='Acme', description='We use Django daily'
+        )
+        in_company = JobFactory(
+            title='Engineer', company_name='Django Shop', description='Backend work'
+        )
+        in_title = JobFactory(
+            title='Django Engineer', company_name='Acme', description='Backend work'
+        )
+        
+        results = FullTextSearchBackend().search(Job.objects.all(), 'django')
+        assert list(results) == [in_title, in_company, in_description]
+    
+    def test_search_vector_updates_on_save(self):
+        job = JobFactory(title='Java Developer', description='Backend work')
+        backend = FullTextSearchBackend()
+        assert not backend.search(Job.objects.all(), 'rust').exists()
+        
+        job.title = 'Rust Developer'
+        job.save()
+        assert list(backend.search(Job.objects.all(), 'rust')) == [job]
+
+
+@pytest.mark.django_db
+class TestContainsSearchBackend:
+    def test_matches_substring(self):
+        job = JobFactory(company_name='Initech')
+        JobFactory(company_name='Globex')
+        
+        results = ContainsSearchBackend().search(Job.objects.all(), 'nite')
+        assert list(results) == [job]
+
+
+@pytest.mark.django_db
+class TestTrigramSearchBackend:
+    def test_matches_misspelled_company(self):
+        job = JobFactory(company_name='Initech')
+        JobFactory(company_name='Globex')
+        
+        results = TrigramSearchBackend().search(Job.objects.all(), 'Inittech')
+        assert list(results) == [job]
+    
+    def test_matches_infix(self):
+        job = JobFactory(title='Backend Engineer', company_name='Umbrella')
+        JobFactory(title='Designer', company_name='Globex')
+        
+        results = TrigramSearchBackend().search(Job.objects.all(), 'kend')
+        assert list(results) == [job]
+    
+    def test_orders_by_similarity(self):
+        close = JobFactory(title='Designer', company_name='Initech')
+        distant = JobFactory(title='Designer', company_name='Initrode')
+        
+        results = TrigramSearchBackend().search(Job.objects.all(), 'initech')
+        assert list(results) == [close, distant]
+    
+    def test_threshold_setting(self, settings):
+        JobFactory(company_name='Initech')
+        settings.JOBS_SEARCH_TRIGRAM_THRESHOLD = 0.95
+        
+        assert not TrigramSearchBackend().search(Job.objects.all(), 'Inittech').exists()
+    
+    def test_threshold_is_set_per_session(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT current_setting('pg_trgm.word_similarity_threshold')"
+            )
+            assert float(cursor.fetchone()[0]) == 0.3
+        
+        with CaptureQueriesContext(connection) as queries:
+            TrigramSearchBackend().search(Job.objects.all(), 'Inittech')
+        assert not queries
+    
+    def test_suggest(self):
+        JobFactory(title='Designer', company_name='Initech')
+        JobFactory(title='Designer', company_name='Globex')
+        
+        assert TrigramSearchBackend().suggest(Job.objects.all(), 'Inittech') == [
+            'Initech'
+        ]
+
+
+@pytest.mark.django_db
+class TestInvertedIndexSearchBackend:
+    @pytest.fixture(autouse=True)
+    def _reset_index(self):
+        search_index.reset_index()
+        yield
+        search_index.reset_index()
+    
+    def test_search_ranks_title_matches_first(self):
+        in_description = JobFactory(title='Engineer', description='We use Django daily')
+        in_title = JobFactory(title='Django Engineer', description='Backend work')
+        JobFactory(title='Designer', description='Figma')
+        
+        results = InvertedIndexSearchBackend().search(Job.objects.all(), 'django')
+        assert list(results) == [in_title, in_description]
+    
+    def test_search_respects_queryset(self):
+        job = JobFactory(title='Python Developer', location='Berlin')
+        JobFactory(title='Python Developer', location='Paris')
+        
+        results = InvertedIndexSearchBackend().search(
+            Job.objects.filter(location='Berlin'), 'python'
+        )
+        assert list(results) == [job]
+    
+    def test_many_matches_bind_one_array(self):
+        jobs = JobFactory.create_batch(5, title='Python Developer')
+        backend = InvertedIndexSearchBackend()
+        backend.rank_limit = 2
+        
+        results = backend.search(Job.objects.all(), 'python')
+        _sql, params = results.query.sql_with_params()
+        # The matching ids and the ranked ids, plus the rank given to the rest.
+        assert len(params) == 3
+        ranked = search_index.get_index().search('python')[:2]
+        rest = sorted(
+            (job for job in jobs if job.pk not in ranked),
+            key=lambda job: job.created_at,
+            reverse=True,
+        )
+        assert [job.pk for job in results] == ranked + [job.pk for job in rest]
+
+
+class TestGetSearchBackend:
+    def test_uses_setting(self, settings):
+        settings.JOBS_SEARCH_BACKEND = (
+            'django_test_app.jobs.search.ContainsSearchBackend'
+        )
+        assert isinstance(get_search_backend(), ContainsSearchBackend)
+    
+    def test_explicit_path(self):
+        backend = get_search_backend(
+            'django_test_app.jobs.search.FullTextSearchBackend'
+        )
+        assert isinstance(backend, FullTextSearchBackend)
@@ -0,0 +1,146 @@
+import pytest
+from config.celery_app import app
+from django_test_app.jobs import search_index
+from django_test_app.jobs.search_index import InvertedIndex, load_index, stem, tokenize
+from django_test_app.jobs.tasks import build_search_index_task
+from django_test_app.jobs.tests.factories import JobFactory
+
+
+class TestTokenize:
+    def test_stems_and_drops_stop_words(self):
+        assert tokenize('The Engineering Managers of Python') == [
+            'engin',
+            'manag',
+            'python',
+        ]
+    
+    def test_shared_stems(self):
+        assert stem('developers') == stem('developing') == stem('developer')
+    
+    def test_empty(self):
+        assert tokenize(None) == []
+
+
+class TestInvertedIndex:
+    def test_search_requires_all_terms(self):
+        index = InvertedIndex()
+        index.add(1, {'title': 'Python Developer'})
+        index.add(2, {'title': 'Java Developer'})
+        
+        assert index.search('python developers') == [1]
+        assert index.search('developer') == [2, 1]
+    
+    def test_title_outranks_description(self):
+        index = InvertedIndex()
+        index.add(1, {'title': 'Engineer', 'description': 'We use Django'})
+        index.add(2, {'title': 'Django Engineer', 'description': 'Backend'})
+        
+        assert index.search('django') == [2, 1]
+    
+    def test_add_replaces_and_remove(self):
+        index = InvertedIndex()
+        index.add(1, {'title': 'Python Developer'})
+        index.add(1, {'title': 'Rust Developer'})
+        
+        assert index.search('python') == []
+        assert index.search('rust') == [1]
+        
+        index.remove(1)
+        assert index.search('developer') == []
+        assert len(index) == 0
+    
+    def test_snapshot_round_trip(self, tmp_path):
+        index = InvertedIndex()
+        index.build([
+            (1, {'title': 'Python Developer', 'company_name': 'Initech'}),
+            (2, {'title': 'Java Developer', 'company_name': 'Globex'}),
+        ])
+        path = tmp_path / 'jobs.idx'
+        index.save(path)
+        
+        loaded = InvertedIndex.load(path)
+        assert loaded.search('developer') == index.search('developer')
+        assert loaded.built_at == index.built_at
+        
+        loaded.remove(1)
+        assert loaded.search('initech') == []
+    
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / 'jobs.idx'
+        path.write_bytes(b'not an index')
+        
+        with pytest.raises(ValueError, match='is not a job search index snapshot'):
+            InvertedIndex.load(path)
+
+
+@pytest.mark.django_db
+class TestIndexMaintenance:
+    @pytest.fixture(autouse=True)
+    def _reset_index(self):
+        search_index.reset_index()
+        yield
+        search_index.reset_index()
+    
+    def test_signals_update_built_index(self, django_capture_on_commit_callbacks):
+        index = search_index.get_index()
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            job = JobFactory(title='Python Developer', status='published')
+        assert index.search('python') == [job.pk]
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            job.status = 'closed'
+            job.save()
+        assert index.search('python') == []
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            job.status = 'published'
+            job.save()
+            job.delete()
+        assert index.search('python') == []
+    
+    def test_load_index_catches_up(self, tmp_path):
+        stale = JobFactory(title='Python Developer', status='published')
+        kept = JobFactory(title='Java Developer', status='published')
+        path = tmp_path / 'jobs.idx'
+        search_index.build_index().save(path)
+        
+        stale.delete()
+        added = JobFactory(title='Rust Developer', status='published')
+        
+        index = load_index(path)
+        assert set(index.search('developer')) == {kept.pk, added.pk}
+    
+    def test_load_index_catches_up_with_edits_during_build(self, tmp_path, monkeypatch):
+        job = JobFactory(title='Python Developer', status='published')
+        indexed_rows = search_index._indexed_rows  # noqa: SLF001
+        
+        def rows_then_edit(queryset):
+            yield from indexed_rows(queryset)
+            job.title = 'Rust Developer'
+            job.save()
+        
+        monkeypatch.setattr(search_index, '_indexed_rows', rows_then_edit)
+        path = tmp_path / 'jobs.idx'
+        search_index.build_index().save(path)
+        monkeypatch.undo()
+        
+        index = load_index(path)
+        assert index.search('rust') == [job.pk]
+        assert index.search('python') == []
+    
+    def test_rebuild_task_writes_snapshot(self, tmp_path, settings):
+        job = JobFactory(title='Python Developer', status='published')
+        settings.JOBS_SEARCH_INDEX_SNAPSHOT = str(tmp_path / 'jobs.idx')
+        
+        assert build_search_index_task.delay().get() == 1
+        
+        assert InvertedIndex.load(settings.JOBS_SEARCH_INDEX_SNAPSHOT).search(
+            'python'
+        ) == [job.pk]
+    
+    def test_rebuild_task_runs_on_the_cpu_queues(self):
+        route = app.amqp.router.route({}, build_search_index_task.name)
+        
+        assert route['queue'].name == 'exports'
+        assert route['priority'] == 9
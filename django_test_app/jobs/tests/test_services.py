@@ -1,8 +1,25 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from django_test_app.jobs.models import Job, JobApplication
-from django_test_app.jobs.services import publish_job, close_job, get_job_statistics, search_jobs
+from django_test_app.jobs.services import (
+    apply_to_job,
+    bulk_review_applications,
+    publish_job,
+    publish_jobs,
+    close_job,
+    close_jobs,
+    get_job_facets,
+    get_job_statistics,
+    review_applications,
+    review_applications_in_chunks,
+    search_jobs,
+    suggest_search_terms,
+)
+from django_test_app.jobs.tasks import review_applications_task
 from django_test_app.jobs.tests.factories import JobFactory, JobApplicationFactory, JobCategoryFactory
+from django_test_app.users.tests.factories import UserFactory
 
 
 @pytest.mark.django_db
@@ -20,6 +37,29 @@ class TestPublishJob:
         job = JobFactory(status='published')
         result = publish_job(job.pk)
         assert result is False
+    
+    def test_publish_jobs_in_one_statement(self):
+        drafts = JobFactory.create_batch(2, status='draft')
+        closed = JobFactory(status='closed', title='Closed')
+        
+        with CaptureQueriesContext(connection) as queries:
+            published = publish_jobs([closed.pk, *(job.pk for job in drafts), 0])
+        
+        assert len(queries) == 1
+        assert published == sorted(job.pk for job in drafts)
+        closed.refresh_from_db()
+        assert (closed.status, closed.published_at) == ('closed', None)
+        assert publish_jobs([job.pk for job in drafts]) == []
+        assert publish_jobs([]) == []
+    
+    def test_publish_keeps_concurrent_edits(self):
+        job = JobFactory(status='draft', title='Old')
+        Job.objects.filter(pk=job.pk).update(title='Edited elsewhere')
+        
+        publish_jobs([job.pk])
+        
+        job.refresh_from_db()
+        assert (job.title, job.status) == ('Edited elsewhere', 'published')
 
 
 @pytest.mark.django_db
@@ -31,6 +71,192 @@ class TestCloseJob:
         assert result is True
         job.refresh_from_db()
         assert job.status == 'closed'
+        assert close_job(job.pk) is False
+    
+    def test_close_jobs(self):
+        jobs = [
+            JobFactory(status='draft'),
+            JobFactory(status='published'),
+            JobFactory(status='closed'),
+        ]
+        
+        assert close_jobs([job.pk for job in jobs]) == [jobs[0].pk, jobs[1].pk]
+        assert set(Job.objects.values_list('status', flat=True)) == {'closed'}
+
+
+@pytest.mark.django_db
+class TestApplyToJob:
+    def test_creates_application_in_one_statement(self):
+        job = JobFactory()
+        user = UserFactory()
+        
+        with CaptureQueriesContext(connection) as queries:
+            application, created = apply_to_job(job, user, cover_letter='Hello')
+        
+        assert created is True
+        # Queuing the employer notification reads and marks the new row afterwards.
+        statements = [
+            query['sql'] for query in queries if 'jobs_jobapplication' in query['sql']
+        ]
+        assert statements[0].lstrip().startswith('INSERT INTO')
+        assert (
+            len(
+                [
+                    sql
+                    for sql in statements
+                    if sql.lstrip().startswith('INSERT INTO jobs_jobapplication')
+                ]
+            )
+            == 1
+        )
+        assert application.status == 'pending'
+        assert application.applied_at is not None
+        assert JobApplication.objects.get() == application
+    
+    def test_returns_existing_application(self):
+        existing = JobApplicationFactory(cover_letter='Original')
+        
+        application, created = apply_to_job(
+            existing.job, existing.applicant, cover_letter='Retry'
+        )
+        
+        assert created is False
+        assert application.pk == existing.pk
+        assert application.cover_letter == 'Original'
+        assert application.applied_at == existing.applied_at
+        assert JobApplication.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestReviewApplications:
+    def test_sets_status_and_reviewed_at_in_one_update(self):
+        applications = JobApplicationFactory.create_batch(3)
+        
+        with CaptureQueriesContext(connection) as queries:
+            updated = review_applications(JobApplication.objects.all(), 'accepted')
+        
+        assert updated == 3
+        assert (
+            len([query for query in queries if 'jobs_jobapplication' in query['sql']])
+            == 1
+        )
+        for application in applications:
+            application.refresh_from_db()
+            assert application.status == 'accepted'
+            assert application.reviewed_at is not None
+    
+    def test_rejects_unknown_status(self):
+        with pytest.raises(ValueError, match='Invalid review status'):
+            review_applications(JobApplication.objects.all(), 'pending')
+    
+    def test_in_chunks_reports_progress(self):
+        applications = JobApplicationFactory.create_batch(5)
+        ids = [application.pk for application in applications]
+        reviewed_at = timezone.now()
+        progress = []
+        
+        after, state = review_applications_in_chunks(
+            {'pk__in': ids},
+            'rejected',
+            reviewed_at,
+            max(ids),
+            chunk_size=2,
+            progress=progress.append,
+        )
+        
+        assert after is None
+        assert state == {'done': 5, 'total': None, 'updated': 5}
+        assert [step['done'] for step in progress] == [2, 4, 5]
+        assert set(JobApplication.objects.values_list('status', 'reviewed_at')) == {
+            ('rejected', reviewed_at)
+        }
+    
+    def test_in_chunks_stops_when_time_runs_out(self):
+        applications = JobApplicationFactory.create_batch(3)
+        max_pk = max(application.pk for application in applications)
+        JobApplicationFactory()
+        reviewed_at = timezone.now()
+        
+        after, state = review_applications_in_chunks(
+            {'status': 'pending'},
+            'rejected',
+            reviewed_at,
+            max_pk,
+            chunk_size=2,
+            max_seconds=1e-9,
+        )
+        assert after == sorted(application.pk for application in applications)[1]
+        assert state['done'] == 2
+        
+        after, state = review_applications_in_chunks(
+            {'status': 'pending'},
+            'rejected',
+            reviewed_at,
+            max_pk,
+            after=after,
+            state=state,
+            chunk_size=2,
+        )
+        assert (after, state['done'], state['updated']) == (None, 3, 3)
+        # Applications created after the selection are left alone.
+        assert JobApplication.objects.filter(status='pending').count() == 1
+    
+    def test_bulk_review_small_selection_runs_inline(
+        self, django_capture_on_commit_callbacks
+    ):
+        JobApplicationFactory.create_batch(2)
+        
+        with django_capture_on_commit_callbacks() as callbacks:
+            count, task_id = bulk_review_applications({}, 'reviewed')
+        
+        assert (count, task_id) == (2, None)
+        assert callbacks == []
+        assert not JobApplication.objects.exclude(status='reviewed').exists()
+    
+    def test_bulk_review_large_selection_runs_in_task(
+        self, settings, django_capture_on_commit_callbacks
+    ):
+        settings.JOBS_BULK_REVIEW_ASYNC_THRESHOLD = 2
+        settings.JOBS_BULK_REVIEW_CHUNK_SIZE = 2
+        settings.CELERY_TASK_ALWAYS_EAGER = True
+        job = JobFactory()
+        JobApplicationFactory.create_batch(5, job=job)
+        JobApplicationFactory()
+        
+        with django_capture_on_commit_callbacks() as callbacks:
+            count, task_id = bulk_review_applications({'job_id': job.pk}, 'accepted')
+            assert not JobApplication.objects.filter(status='accepted').exists()
+        
+        assert count == 5
+        assert task_id is not None
+        assert callbacks[0]().get() == {'done': 5, 'total': 5, 'updated': 5}
+        reviewed = JobApplication.objects.filter(job=job).values_list(
+            'status', 'reviewed_at'
+        )
+        assert len(set(reviewed)) == 1
+        assert reviewed[0][0] == 'accepted'
+        assert JobApplication.objects.filter(status='pending').count() == 1
+    
+    def test_review_task_continues_when_time_runs_out(self, settings, monkeypatch):
+        settings.JOBS_BULK_REVIEW_CHUNK_SIZE = 1
+        settings.JOBS_BULK_REVIEW_TASK_SECONDS = 1e-9
+        applications = JobApplicationFactory.create_batch(3)
+        ids = sorted(application.pk for application in applications)
+        replaced = []
+        monkeypatch.setattr(
+            review_applications_task, 'update_state', lambda **kwargs: None
+        )
+        monkeypatch.setattr(review_applications_task, 'replace', replaced.append)
+        
+        state = {'done': 0, 'total': 3, 'updated': 0}
+        review_applications_task(
+            {}, 'accepted', timezone.now().isoformat(), ids[-1], state=state
+        )
+        
+        assert replaced[0].kwargs == {
+            'after': ids[0],
+            'state': {'done': 1, 'total': 3, 'updated': 1},
+        }
 
 
 @pytest.mark.django_db
@@ -68,3 +294,95 @@ class TestSearchJobs:
         results = search_jobs(None, category_id=category.pk)
         assert results.count() == 1
 
+    
+    def test_search_ranks_title_matches_first(self):
+        description_match = JobFactory(
+            title='Backend Engineer',
+            description='Some Python scripting',
+            status='published',
+        )
+        title_match = JobFactory(
+            title='Python Engineer', description='Backend work', status='published'
+        )
+        
+        results = search_jobs('python')
+        assert list(results) == [title_match, description_match]
+    
+    def test_search_with_status(self):
+        JobFactory(title='Python Developer', status='published')
+        draft = JobFactory(title='Python Developer', status='draft')
+        
+        results = search_jobs('Python', status='draft')
+        assert list(results) == [draft]
+
+
+@pytest.mark.django_db
+class TestSuggestSearchTerms:
+    def test_suggests_published_company(self):
+        JobFactory(title='Designer', company_name='Initech', status='published')
+        JobFactory(title='Designer', company_name='Initrode', status='draft')
+        
+        assert suggest_search_terms('Inittech') == ['Initech']
+    
+    def test_empty_query(self):
+        assert suggest_search_terms('') == []
+
+
+@pytest.mark.django_db
+class TestGetJobFacets:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from django.core.cache import cache
+        cache.clear()
+    
+    def test_counts_every_facet_in_one_query(self, django_assert_num_queries):
+        engineering = JobCategoryFactory(name='Engineering')
+        design = JobCategoryFactory(name='Design')
+        JobFactory(
+            title='Python Developer',
+            category=engineering,
+            location='Berlin',
+            salary_min=40000,
+            salary_max=60000,
+        )
+        JobFactory(
+            title='Python Engineer',
+            category=engineering,
+            location='Paris',
+            salary_min=None,
+            salary_max=None,
+        )
+        JobFactory(
+            title='Python Designer',
+            category=design,
+            location='Berlin',
+            salary_min=90000,
+            salary_max=120000,
+        )
+        JobFactory(title='Java Developer', category=engineering, location='Berlin')
+        
+        with django_assert_num_queries(1):
+            facets = get_job_facets('python')
+        
+        assert [(c['name'], c['count']) for c in facets['category']] == [
+            ('Engineering', 2),
+            ('Design', 1),
+        ]
+        assert facets['status'] == [{'value': 'published', 'count': 3}]
+        assert facets['location'] == [
+            {'value': 'Berlin', 'count': 2},
+            {'value': 'Paris', 'count': 1},
+        ]
+        assert {s['value']: s['count'] for s in facets['salary']} == {
+            '50000-75000': 1,
+            'unspecified': 1,
+            '100000+': 1,
+        }
+    
+    def test_cached_per_normalized_filters(self, django_assert_num_queries):
+        JobFactory(title='Python Developer')
+        get_job_facets('Python  Developer')
+        
+        with django_assert_num_queries(0):
+            facets = get_job_facets(' python developer ')
+        assert facets['status'] == [{'value': 'published', 'count': 1}]
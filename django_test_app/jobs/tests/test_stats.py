@@ -0,0 +1,272 @@
+import io
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from django_test_app.jobs.models import Job, JobApplication, JobStats
+from django_test_app.jobs.services import (
+    apply_to_job, get_job_statistics, get_job_statistics_bulk, review_applications
+)
+from django_test_app.jobs.stats import reconcile_job_stats
+from django_test_app.jobs.tests.factories import JobFactory, JobApplicationFactory
+from django_test_app.users.tests.factories import UserFactory
+
+
+def counters(job):
+    return get_job_statistics(job.pk)
+
+
+@pytest.mark.django_db
+class TestJobStatsCounters:
+    def test_follow_application_lifecycle(self):
+        job = JobFactory()
+        application = JobApplicationFactory(job=job)
+        JobApplicationFactory(job=job, status='accepted')
+        assert counters(job) == {
+            'total': 2,
+            'pending': 1,
+            'reviewed': 0,
+            'accepted': 1,
+            'rejected': 0,
+        }
+        
+        application.status = 'rejected'
+        application.save()
+        assert counters(job) == {
+            'total': 2,
+            'pending': 0,
+            'reviewed': 0,
+            'accepted': 1,
+            'rejected': 1,
+        }
+        
+        application.cover_letter = 'Updated'
+        application.save(update_fields=['cover_letter'])
+        application.delete()
+        assert counters(job) == {
+            'total': 1,
+            'pending': 0,
+            'reviewed': 0,
+            'accepted': 1,
+            'rejected': 0,
+        }
+    
+    def test_apply_to_job_counts_new_applications_only(self):
+        job = JobFactory()
+        user = UserFactory()
+        
+        apply_to_job(job, user)
+        apply_to_job(job, user)
+        
+        assert counters(job)['total'] == 1
+        assert counters(job)['pending'] == 1
+    
+    def test_bulk_review_across_jobs(self):
+        first, second = JobFactory(), JobFactory()
+        JobApplicationFactory.create_batch(2, job=first)
+        JobApplicationFactory(job=first, status='accepted')
+        JobApplicationFactory(job=second, status='reviewed')
+        
+        review_applications(JobApplication.objects.all(), 'accepted')
+        
+        assert counters(first) == {
+            'total': 3,
+            'pending': 0,
+            'reviewed': 0,
+            'accepted': 3,
+            'rejected': 0,
+        }
+        assert counters(second) == {
+            'total': 1,
+            'pending': 0,
+            'reviewed': 0,
+            'accepted': 1,
+            'rejected': 0,
+        }
+    
+    def test_api_review_action(self):
+        application = JobApplicationFactory()
+        client = APIClient()
+        client.force_authenticate(user=UserFactory(is_staff=True))
+        
+        response = client.post(
+            f'/api/applications/{application.pk}/review/', {'status': 'reviewed'}
+        )
+        
+        assert response.status_code == 200
+        assert counters(application.job)['reviewed'] == 1
+        assert counters(application.job)['pending'] == 0
+    
+    def test_admin_bulk_action(self, admin_client):
+        application = JobApplicationFactory()
+        
+        admin_client.post(reverse('admin:jobs_jobapplication_changelist'), {
+            'action': 'mark_as_rejected',
+            '_selected_action': [application.pk],
+        })
+        
+        assert counters(application.job)['rejected'] == 1
+        assert counters(application.job)['pending'] == 0
+    
+    def test_deleting_job_removes_row(self):
+        job = JobFactory()
+        JobApplicationFactory.create_batch(2, job=job)
+        
+        job.delete()
+        
+        assert not JobStats.objects.exists()
+
+
+@pytest.mark.django_db
+class TestGetJobStatistics:
+    def test_reads_a_single_row(self):
+        job = JobFactory()
+        JobApplicationFactory.create_batch(3, job=job)
+        
+        with CaptureQueriesContext(connection) as queries:
+            statistics = get_job_statistics(job.pk)
+        
+        assert len(queries) == 1
+        assert statistics['total'] == 3
+    
+    def test_job_without_applications(self):
+        job = JobFactory()
+        assert get_job_statistics(job.pk) == {
+            'total': 0,
+            'pending': 0,
+            'reviewed': 0,
+            'accepted': 0,
+            'rejected': 0,
+        }
+    
+    def test_unknown_job(self):
+        with pytest.raises(Job.DoesNotExist):
+            get_job_statistics(0)
+
+
+@pytest.mark.django_db
+class TestGetJobStatisticsBulk:
+    def test_query_count_is_constant(self):
+        jobs = JobFactory.create_batch(5)
+        for job in jobs:
+            JobApplicationFactory(job=job, status='accepted')
+        
+        for size in (1, 5):
+            with CaptureQueriesContext(connection) as queries:
+                statistics = get_job_statistics_bulk([job.pk for job in jobs[:size]])
+            assert len(queries) == 1
+            assert len(statistics) == size
+    
+    def test_counters_per_job(self):
+        busy, idle = JobFactory(), JobFactory()
+        JobApplicationFactory.create_batch(2, job=busy)
+        JobApplicationFactory(job=busy, status='rejected')
+        
+        statistics = get_job_statistics_bulk([busy.pk, idle.pk, 0])
+        
+        assert statistics == {
+            busy.pk: {
+                'total': 3,
+                'pending': 2,
+                'reviewed': 0,
+                'accepted': 0,
+                'rejected': 1,
+            },
+            idle.pk: {
+                'total': 0,
+                'pending': 0,
+                'reviewed': 0,
+                'accepted': 0,
+                'rejected': 0,
+            },
+        }
+    
+    def test_api_returns_own_jobs(self):
+        owner = UserFactory()
+        mine = JobFactory.create_batch(2, created_by=owner, status='draft')
+        JobApplicationFactory(job=mine[0])
+        JobFactory()
+        client = APIClient()
+        client.force_authenticate(user=owner)
+        
+        response = client.get('/api/jobs/stats/')
+        assert response.status_code == 200
+        assert [row['job'] for row in response.data['results']] == sorted(
+            job.pk for job in mine
+        )
+        
+        response = client.get('/api/jobs/stats/', {'page_size': 1})
+        assert [row['job'] for row in response.data['results']] == [
+            min(job.pk for job in mine)
+        ]
+        response = client.get(response.data['next'])
+        assert [row['job'] for row in response.data['results']] == [
+            max(job.pk for job in mine)
+        ]
+        
+        other = Job.objects.exclude(created_by=owner).get()
+        response = client.get('/api/jobs/stats/', {'ids': f'{mine[0].pk},{other.pk}'})
+        assert response.data['results'] == [
+            {
+                'job': mine[0].pk,
+                'total': 1,
+                'pending': 1,
+                'reviewed': 0,
+                'accepted': 0,
+                'rejected': 0,
+            }
+        ]
+    
+    def test_api_validation_and_auth(self):
+        client = APIClient()
+        assert client.get('/api/jobs/stats/').status_code in (401, 403)
+        
+        client.force_authenticate(user=UserFactory())
+        assert client.get('/api/jobs/stats/', {'ids': '1,x'}).status_code == 400
+        too_many = ','.join(str(job_id) for job_id in range(1, 102))
+        assert client.get('/api/jobs/stats/', {'ids': too_many}).status_code == 400
+
+
+@pytest.mark.django_db
+class TestReconcileJobStats:
+    def test_repairs_drift(self):
+        job = JobFactory()
+        JobApplicationFactory.create_batch(2, job=job)
+        JobFactory()
+        # Bypasses the counters.
+        JobApplication.objects.filter(job=job).update(status='accepted')
+        JobStats.objects.filter(job=job).update(total=7)
+        
+        assert reconcile_job_stats(batch_size=1) == 1
+        assert counters(job) == {
+            'total': 2,
+            'pending': 0,
+            'reviewed': 0,
+            'accepted': 2,
+            'rejected': 0,
+        }
+        assert JobStats.objects.count() == 1
+        assert reconcile_job_stats() == 0
+    
+    def test_resets_rows_of_jobs_without_applications(self):
+        job = JobFactory()
+        JobApplicationFactory(job=job)
+        JobApplication.objects.filter(job=job).delete()
+        JobStats.objects.filter(job=job).update(total=1, pending=1)
+        
+        assert reconcile_job_stats([job.pk]) == 1
+        assert counters(job)['total'] == 0
+    
+    def test_command(self):
+        job = JobFactory()
+        JobApplicationFactory(job=job)
+        JobStats.objects.all().delete()
+        stdout = io.StringIO()
+        
+        call_command('reconcile_job_stats', stdout=stdout)
+        
+        assert 'Corrected 1 job stats row(s)' in stdout.getvalue()
+        assert counters(job)['total'] == 1
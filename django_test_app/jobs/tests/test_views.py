@@ -1,9 +1,29 @@
 import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.auth.models import AnonymousUser
 from django.urls import reverse
 from django_test_app.jobs.tests.factories import JobFactory, JobCategoryFactory, JobApplicationFactory
 from django_test_app.users.tests.factories import UserFactory
 
 
+@pytest.fixture(params=[False, True], ids=['sync', 'async'])
+def async_views(request, settings):
+    """Build the job views both the way WSGI and the way config/asgi.py get them."""
+    settings.JOBS_ASYNC_VIEWS = request.param
+    return request.param
+
+
+def call(view, request, **kwargs):
+    """Run a view from a sync test, adding the auser() of AuthenticationMiddleware."""
+    async def auser():
+        return request.user
+    
+    request.auser = auser
+    if iscoroutinefunction(view):
+        return async_to_sync(view)(request, **kwargs)
+    return view(request, **kwargs)
+
+
 @pytest.mark.django_db
 class TestJobListView:
     def test_list_view(self, client):
@@ -23,6 +43,50 @@ class TestJobListView:
         assert response.status_code == 200
         assert len(response.context['jobs']) == 1
 
+    
+    def test_cursor_pagination(self, rf, async_views):
+        from django_test_app.jobs.views import JobListView
+        jobs = JobFactory.create_batch(21, status='published')
+        
+        request = rf.get('/jobs/')
+        request.user = AnonymousUser()
+        response = call(JobListView.as_view(), request)
+        page = response.context_data['page_obj']
+        assert len(response.context_data['jobs']) == 20
+        assert response.context_data['is_paginated']
+        assert response.context_data['result_count']() == 21
+        
+        request = rf.get('/jobs/', {'cursor': page.next_cursor})
+        request.user = AnonymousUser()
+        response = call(JobListView.as_view(), request)
+        assert list(response.context_data['jobs']) == [jobs[0]]
+        assert not response.context_data['page_obj'].has_next()
+    
+    def test_conditional_get(self, rf, async_views, django_assert_num_queries):
+        from django_test_app.jobs.views import JobListView
+        job = JobFactory(status='published')
+        
+        def get(**headers):
+            request = rf.get('/jobs/', headers=headers)
+            request.user = AnonymousUser()
+            return call(JobListView.as_view(), request)
+        
+        etag = get()['ETag']
+        with django_assert_num_queries(2):
+            assert get(if_none_match=etag).status_code == 304
+        
+        job.title = 'Renamed'
+        job.save()
+        assert get(if_none_match=etag).status_code == 200
+    
+    def test_no_validators_for_authenticated_users(self, rf, async_views):
+        from django_test_app.jobs.views import JobListView
+        JobFactory(status='published')
+        request = rf.get('/jobs/')
+        request.user = UserFactory()
+        
+        assert 'ETag' not in call(JobListView.as_view(), request)
+
 
 @pytest.mark.django_db
 class TestJobDetailView:
@@ -32,6 +96,34 @@ class TestJobDetailView:
         assert response.status_code == 200
         assert response.context['job'] == job
     
+    def test_conditional_get(self, rf, async_views, django_capture_on_commit_callbacks):
+        from django_test_app.jobs.views import JobDetailView
+        job = JobFactory(status='published')
+        other = JobFactory(status='published')
+        
+        def get(pk, **headers):
+            request = rf.get(f'/jobs/{pk}/', headers=headers)
+            request.user = AnonymousUser()
+            return call(JobDetailView.as_view(), request, pk=pk)
+        
+        response = get(job.pk)
+        assert response.has_header('Last-Modified')
+        assert get(job.pk, if_none_match=response['ETag']).status_code == 304
+        
+        other.save()
+        assert get(job.pk, if_none_match=response['ETag']).status_code == 304
+        job.category.name = 'Renamed'
+        with django_capture_on_commit_callbacks(execute=True):
+            job.category.save()
+        assert get(job.pk, if_none_match=response['ETag']).status_code == 200
+    
+    def test_async_only_when_enabled(self, async_views):
+        from django_test_app.jobs.views import JobDetailView, JobListView
+        for view in (JobListView.as_view(), JobDetailView.as_view()):
+            assert iscoroutinefunction(view) == async_views
+            # ATOMIC_REQUESTS cannot wrap async views, but still covers the sync ones.
+            assert hasattr(view, '_non_atomic_requests') == async_views
+    
     def test_draft_not_visible(self, client):
         job = JobFactory(status='draft')
         response = client.get(reverse('jobs:detail', kwargs={'pk': job.pk}))
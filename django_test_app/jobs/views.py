@@ -1,42 +1,111 @@
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Q
 from django.views.generic import ListView, DetailView, CreateView, UpdateView
+from django.db import transaction
+from django.http import Http404
 from django.urls import reverse_lazy
+from django.utils.functional import classproperty
 from django.contrib import messages
+from .cache import aget_job, get_job, last_modified
+from .conditional import AsyncConditionalGetViewMixin, ajob_version, job_version
 from .models import Job, JobApplication
+from .pagination import AsyncKeysetPaginationMixin, KeysetPaginationMixin
+from .services import asearch_jobs, search_jobs
 
 
-class JobListView(ListView):
+class AsyncGetMixin:
+    """
+    Serve GET with ``aget()`` when ``JOBS_ASYNC_VIEWS`` is on, which
+    config/asgi.py does, and with the sync ``get()`` otherwise, so WSGI
+    requests do not go through async_to_sync.
+    """
+    
+    @classproperty
+    def view_is_async(cls):
+        return getattr(settings, 'JOBS_ASYNC_VIEWS', False)
+    
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        if cls.view_is_async:
+            # Django cannot wrap async views in ATOMIC_REQUESTS; these only read.
+            view = transaction.non_atomic_requests(view)
+        return view
+    
+    def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async and request.method in ('GET', 'HEAD'):
+            return self.aget(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+
+class AsyncDetailMixin:
+    """DetailView ``aget()`` for views loading their object with ``aget_object()``."""
+    
+    async def aget(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        return self.render_to_response(self.get_context_data(object=self.object))
+
+
+class JobListView(
+    AsyncGetMixin, AsyncConditionalGetViewMixin, AsyncKeysetPaginationMixin, ListView
+):
     model = Job
     template_name = 'jobs/job_list.html'
     context_object_name = 'jobs'
     paginate_by = 20
     
     def get_queryset(self):
-        queryset = Job.objects.filter(status='published')
         search = self.request.GET.get('search', '')
         category = self.request.GET.get('category', '')
-        
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | 
-                Q(description__icontains=search) |
-                Q(company_name__icontains=search)
-            )
-        
-        if category:
-            queryset = queryset.filter(category_id=category)
-        
-        return queryset
-
-
-class JobDetailView(DetailView):
+        return search_jobs(search, category_id=category)
+    
+    def get_version(self, queryset):
+        return job_version(queryset)
+    
+    async def aget_queryset(self):
+        search = self.request.GET.get('search', '')
+        category = self.request.GET.get('category', '')
+        return await asearch_jobs(search, category_id=category)
+    
+    async def aget_version(self, queryset):
+        return await ajob_version(queryset)
+
+
+class JobDetailView(
+    AsyncGetMixin, AsyncConditionalGetViewMixin, AsyncDetailMixin, DetailView
+):
     model = Job
     template_name = 'jobs/job_detail.html'
     context_object_name = 'job'
     
     def get_queryset(self):
         return Job.objects.filter(status='published')
+    
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_job'):
+            self._job = get_job(self.kwargs[self.pk_url_kwarg])
+        return self._published(self._job)
+    
+    def get_version(self, queryset):
+        return self._version(self.get_object())
+    
+    async def aget_object(self):
+        if not hasattr(self, '_job'):
+            self._job = await aget_job(self.kwargs[self.pk_url_kwarg])
+        return self._published(self._job)
+    
+    async def aget_version(self, queryset):
+        return self._version(await self.aget_object())
+    
+    def _published(self, job):
+        if job is None or job.status != 'published':
+            msg = 'No job found matching the query'
+            raise Http404(msg)
+        return job
+    
+    def _version(self, job):
+        modified = last_modified(job)
+        return (job.pk, job.category_id, job.created_by.email, modified), modified
 
 
 class JobCreateView(LoginRequiredMixin, CreateView):
@@ -82,7 +151,7 @@ class JobApplicationCreateView(LoginRequiredMixin, CreateView):
         return super().form_valid(form)
 
 
-class MyApplicationsListView(LoginRequiredMixin, ListView):
+class MyApplicationsListView(LoginRequiredMixin, KeysetPaginationMixin, ListView):
     model = JobApplication
     template_name = 'jobs/my_applications.html'
     context_object_name = 'applications'
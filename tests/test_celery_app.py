@@ -0,0 +1,98 @@
+from fnmatch import fnmatch
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from kombu.exceptions import OperationalError
+
+from config.celery_app import app
+from config.celery_app import coalesced_task
+from django_test_app.jobs import tasks  # noqa: F401
+
+runs = []
+
+
+@coalesced_task(window=30, key=lambda job_id, **kwargs: str(job_id))
+def refresh_job(job_id, reason=""):
+    runs.append((job_id, reason))
+    return job_id
+
+
+@coalesced_task(window=lambda: 5)
+def recount(*args):
+    return args
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    cache.clear()
+    runs.clear()
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        refresh_job,
+        "apply_async",
+        lambda args, kwargs, countdown: calls.append((args, kwargs, countdown)),
+    )
+    return calls
+
+
+def test_triggers_are_merged_per_key(scheduled):
+    assert refresh_job.coalesce(1, reason="applied")
+    assert not refresh_job.coalesce(1, reason="withdrawn")
+    assert not refresh_job.coalesce(1)
+    assert refresh_job.coalesce(2)
+
+    assert scheduled == [((1,), {"reason": "applied"}, 30), ((2,), {}, 30)]
+
+
+def test_trigger_during_a_run_schedules_the_next_one(scheduled):
+    refresh_job.coalesce(1)
+    args, kwargs, _countdown = scheduled.pop()
+
+    refresh_job.apply(args, kwargs)
+
+    assert runs == [(1, "")]
+    assert refresh_job.coalesce(1)
+    assert len(scheduled) == 1
+
+
+def test_broker_failure_releases_the_key(monkeypatch):
+    def unavailable(*args, **kwargs):
+        msg = "broker unavailable"
+        raise OperationalError(msg)
+
+    monkeypatch.setattr(refresh_job, "apply_async", unavailable)
+    with pytest.raises(OperationalError):
+        refresh_job.coalesce(1)
+    monkeypatch.undo()
+
+    assert refresh_job.coalesce(1)
+    # Tests run tasks eagerly, ignoring the countdown.
+    assert runs == [(1, "")]
+
+
+def test_default_key_is_the_arguments(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        recount,
+        "apply_async",
+        lambda args, kwargs, countdown: calls.append((args, countdown)),
+    )
+
+    assert recount.coalesce(1)
+    assert not recount.coalesce(1)
+    assert recount.coalesce(2)
+
+    assert calls == [((1,), 5), ((2,), 5)]
+
+
+def test_task_routes_match_registered_tasks():
+    # app.tasks includes the jobs tasks, registered by the import at the top.
+    queues = {queue.name for queue in settings.CELERY_TASK_QUEUES}
+    for pattern, route in settings.CELERY_TASK_ROUTES.items():
+        assert any(fnmatch(name, pattern) for name in app.tasks), pattern
+        assert route["queue"] in queues